@@ -0,0 +1,242 @@
+"""Format methods benchmark
+
+Time every public format method of Gephi, with each of its graph_format / scheme variants, on synthetic random,
+power-law and dense graphs, and record the peak memory of every call. Each call runs in a forked child process
+so its peak memory is measured on its own, on top of the already built graph. The results are stored as JSON
+so runs of two versions can be compared.
+
+To run the benchmark use the following command :
+
+	$python benchmarks/bench_formats.py [--sizes 1000 10000 ...] [--kinds random power-law dense] [-o results.json]
+
+To compare a run against a previous one :
+
+	$python benchmarks/bench_formats.py --compare old.json new.json
+
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gephi import Gephi
+
+
+# (method, args, kwargs) of every benchmarked call
+CASES = [
+	('CVS', ('adjacency-list',), {}),
+	('CVS', ('edge-list',), {}),
+	('CVS', ('mixed',), {}),
+	('CVS', ('matrix',), {}),
+	('CVS', ('edge-weight',), {}),
+	('adjacency_list', (), {}),
+	('multiline_adjacency_list', (), {}),
+	('pajek_net', ('edges',), {}),
+	('pajek_net', ('weight',), {}),
+	('pajek_net', ('edges-list',), {}),
+	('pajek_net', ('edges',), {'labels' : False}),
+	('GDF_format', (), {}),
+	('GEXF', (), {}),
+	('GML', (), {}),
+	('graph_ML', (), {}),
+	('spread_sheet', (), {}),
+	('GraphViz_dot_format', ('basic',), {}),
+	('GraphViz_dot_format', ('adjacency-list',), {}),
+	('GraphViz_dot_format', ('Labels',), {}),
+	('ucinet_DL', ('basic',), {}),
+	('ucinet_DL', ('weight',), {}),
+	('ucinet_DL', ('edge-list',), {}),
+	('ucinet_DL', ('labels-embedded',), {}),
+	('ucinet_DL', ('edge-weight',), {}),
+	('TLP', (), {}),
+	('netdraw_VNA', (), {}),
+]
+
+# calls whose output holds one cell per node pair
+MATRIX_CASES = set([ ('CVS', ('matrix',)), ('CVS', ('edge-weight',)), ('ucinet_DL', ('basic',)), ('ucinet_DL', ('weight',)) ])
+
+
+def case_name(method, args, kwargs):
+	"""Readable name of a call, as G.method(args, kwargs) would be written."""
+
+	params = [ repr(arg) for arg in args ] + [ '{}={!r}'.format(key, kwargs[key]) for key in sorted(kwargs) ]
+	return '{}({})'.format(method, ', '.join(params))
+
+def random_graph(nodes, degree, seed = 0):
+	"""Random graph, every node has degree distinct uniformly drawn targets."""
+
+	rand = random.Random(seed)
+	names = [ 'n' + str(i) for i in xrange(nodes) ]
+	degree = min(degree, nodes)
+	return dict( (name, ([ names[j] for j in rand.sample(xrange(nodes), degree) ], [ int(rand.random() * 9) + 1 for _ in xrange(degree) ])) for name in names )
+
+def power_law_graph(nodes, degree, seed = 0, exponent = 1.5):
+	"""Power-law graph, pareto distributed out degrees of mean degree and targets skewed to the first nodes."""
+
+	rand = random.Random(seed)
+	names = [ 'n' + str(i) for i in xrange(nodes) ]
+	scale = degree * (exponent - 1) / exponent
+	data = dict()
+	for name in names :
+		count = min(nodes, max(1, int(scale * rand.paretovariate(exponent))))
+		data[name] = ([ names[int(nodes * rand.random() ** 3)] for _ in xrange(count) ], [ int(rand.random() * 9) + 1 for _ in xrange(count) ])
+	return data
+
+def dense_graph(nodes, density, seed = 0):
+	"""Dense graph, every node is linked to a density fraction of all nodes."""
+
+	return random_graph(nodes, max(1, int(nodes * density)), seed)
+
+def peak_memory():
+	"""Peak resident memory of the current process in bytes."""
+
+	peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	return peak if sys.platform == 'darwin' else peak * 1024
+
+def run_case(G, method, args, kwargs, repeat, conn):
+	"""Child process body, send (best time, output length, peak memory increase) of repeat calls."""
+
+	before = peak_memory()
+	best = None
+	for _ in xrange(repeat) :
+		start = time.time()
+		output = getattr(G, method)(*args, **kwargs)
+		elapsed = time.time() - start
+		best = elapsed if best is None else min(best, elapsed)
+		size = len(output)
+		del output
+	conn.send((best, size, peak_memory() - before))
+	conn.close()
+
+def measure(G, method, args, kwargs, repeat):
+	"""Run one call in a forked child process, returns its result dict."""
+
+	parent, child = multiprocessing.Pipe(False)
+	process = multiprocessing.Process(target = run_case, args = (G, method, args, kwargs, repeat, child))
+	process.start()
+	child.close()
+	try :
+		best, size, memory = parent.recv()
+	except EOFError :
+		process.join()
+		return {'error' : 'exit code {}'.format(process.exitcode)}
+	process.join()
+	return {'time' : best, 'bytes' : size, 'peak_memory' : memory}
+
+def revision():
+	"""Git revision of the benchmarked tree, None outside of a git checkout."""
+
+	try :
+		return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd = os.path.dirname(os.path.abspath(__file__)), stderr = open(os.devnull, 'w')).strip()
+	except (OSError, subprocess.CalledProcessError) :
+		return None
+
+def run(options):
+	"""Run the benchmark for every graph kind and size, returns the results document."""
+
+	generators = {
+		'random' : lambda nodes : random_graph(nodes, options.degree, options.seed),
+		'power-law' : lambda nodes : power_law_graph(nodes, options.degree, options.seed),
+		'dense' : lambda nodes : dense_graph(nodes, options.density, options.seed),
+	}
+	results = {
+		'revision' : revision(),
+		'python' : platform.python_version(),
+		'platform' : platform.platform(),
+		'date' : time.strftime('%Y-%m-%dT%H:%M:%S'),
+		'options' : vars(options),
+		'results' : [],
+	}
+
+	for kind in options.kinds :
+		for nodes in options.sizes :
+			if kind == 'dense' and nodes > options.dense_max :
+				continue
+
+			data = generators[kind](nodes)
+			start = time.time()
+			G = Gephi(data, graph_type = options.graph_type, compact = options.compact)
+			build = time.time() - start
+			edges = sum([ len(G.data[key][0]) for key in G.keys ])
+			print '{} graph, {} nodes, {} edges, built in {:.3f} s'.format(kind, nodes, edges, build)
+
+			for method, args, kwargs in CASES :
+				name = case_name(method, args, kwargs)
+				if options.methods and not any(pattern in name for pattern in options.methods) :
+					continue
+
+				result = {'graph' : kind, 'nodes' : nodes, 'edges' : edges, 'build_time' : build, 'case' : name}
+				if (method, args) in MATRIX_CASES and nodes > options.matrix_max :
+					result['skipped'] = 'matrix larger than {} nodes'.format(options.matrix_max)
+				else :
+					result.update(measure(G, method, args, kwargs, options.repeat))
+				results['results'].append(result)
+
+				if 'time' in result :
+					print '  {:<48}{:>10.3f} s{:>10.1f} MB out{:>10.1f} MB peak'.format(name, result['time'], result['bytes'] / 1e6, result['peak_memory'] / 1e6)
+				else :
+					print '  {:<48}{}'.format(name, result.get('skipped', result.get('error')))
+
+			del G, data
+
+	return results
+
+def compare(old_path, new_path):
+	"""Print the time and peak memory ratios of the cases measured in both results files."""
+
+	with open(old_path) as f :
+		old = json.load(f)
+	with open(new_path) as f :
+		new = json.load(f)
+
+	key = lambda result : (result['graph'], result['nodes'], result['case'])
+	previous = dict( (key(result), result) for result in old['results'] if 'time' in result )
+
+	print '{} -> {}'.format(old.get('revision'), new.get('revision'))
+	print '{:<10}{:>9}  {:<48}{:>10}{:>10}'.format('graph', 'nodes', 'case', 'time', 'memory')
+	for result in new['results'] :
+		if 'time' not in result or key(result) not in previous :
+			continue
+		before = previous[key(result)]
+		print '{:<10}{:>9}  {:<48}{:>9.2f}x{:>9.2f}x'.format(result['graph'], result['nodes'], result['case'],
+			result['time'] / max(before['time'], 1e-9), float(result['peak_memory']) / max(before['peak_memory'], 1))
+
+def main(argv = None):
+
+	parser = argparse.ArgumentParser(description = 'Benchmark the Gephi format methods.')
+	parser.add_argument('--sizes', type = int, nargs = '+', default = [1000, 10000, 100000, 1000000], help = 'graph sizes in nodes')
+	parser.add_argument('--kinds', nargs = '+', choices = ['random', 'power-law', 'dense'], default = ['random', 'power-law', 'dense'], help = 'graph kinds')
+	parser.add_argument('--degree', type = int, default = 10, help = 'mean out degree of random and power-law graphs')
+	parser.add_argument('--density', type = float, default = 0.5, help = 'edge density of dense graphs')
+	parser.add_argument('--dense-max', type = int, default = 2000, help = 'largest dense graph in nodes')
+	parser.add_argument('--matrix-max', type = int, default = 20000, help = 'largest graph for the matrix formats in nodes')
+	parser.add_argument('--graph-type', choices = ['direct', 'undirect'], default = 'direct')
+	parser.add_argument('--compact', action = 'store_true', help = 'use the compact array storage')
+	parser.add_argument('--methods', nargs = '+', help = 'only run the cases whose name contains one of these strings')
+	parser.add_argument('--repeat', type = int, default = 1, help = 'keep the best time of repeat calls')
+	parser.add_argument('--seed', type = int, default = 0)
+	parser.add_argument('-o', '--output', default = 'bench_formats.json', help = 'results JSON file')
+	parser.add_argument('--compare', nargs = 2, metavar = ('OLD', 'NEW'), help = 'compare two results files and exit')
+	options = parser.parse_args(argv)
+
+	if options.compare :
+		compare(*options.compare)
+		return
+
+	results = run(options)
+	with open(options.output, 'w') as f :
+		json.dump(results, f, indent = 1, sort_keys = True)
+	print 'results written to', options.output
+
+
+if __name__ == '__main__' :
+	main()
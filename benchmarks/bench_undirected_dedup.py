@@ -0,0 +1,84 @@
+"""Undirected deduplication benchmark
+
+Compare the undirected constructor of Gephi against the previous implementation, which stored every edge twice
+as (source, target) and (target, source) tuples and looked both up for each edge.
+
+To run the benchmark use the following command :
+
+	$python benchmarks/bench_undirected_dedup.py [nodes] [degree]
+
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gephi import Gephi
+
+
+def random_graph(nodes, degree, seed = 0):
+	"""Random graph of nodes names 'n0' ... with degree random targets per node and unit weights."""
+
+	rand = random.Random(seed)
+	names = [ 'n' + str(i) for i in xrange(nodes) ]
+	return dict( (name, ([ rand.choice(names) for _ in xrange(degree) ], [ 1 ] * degree)) for name in names )
+
+def tuple_dedup(data):
+	"""Previous undirected constructor path, returns the deduplicated data and the hash set it used."""
+
+	check_hash_set = set()
+	t_data = dict()
+
+	for key in data.keys() :
+		nodes = data[key][0]
+		weights = data[key][1]
+		t_nodes = []
+		t_weights = []
+		for node_index in xrange(len(nodes)) :
+			if (key,nodes[node_index]) not in check_hash_set and (nodes[node_index],key) not in check_hash_set :
+				t_nodes.append(nodes[node_index])
+				t_weights.append(weights[node_index])
+				check_hash_set.add((key,nodes[node_index]))
+				check_hash_set.add((nodes[node_index],key))
+		t_data[key] = (t_nodes,t_weights)
+
+	return t_data, check_hash_set
+
+def int_dedup_set(G):
+	"""Rebuild the int encoded edge set the Gephi constructor keeps while deduplicating."""
+
+	return set( (min(G.index[key], G.index[node]) << 32) | max(G.index[key], G.index[node]) for key, node, _ in G.edges() )
+
+def set_size(hash_set):
+	"""Approximate memory of a set and of the items it allocated in bytes : the tuples or ints, not the node names
+	the tuples point to, which are shared with the graph data."""
+
+	return sys.getsizeof(hash_set) + sum(sys.getsizeof(item) for item in hash_set)
+
+def main(nodes = 100000, degree = 10):
+
+	data = random_graph(nodes, degree)
+
+	start = time.time()
+	old_data, old_set = tuple_dedup(data)
+	old_time = time.time() - start
+
+	start = time.time()
+	G = Gephi(data, graph_type = 'undirect')
+	new_time = time.time() - start
+
+	assert all(G.data[key] == old_data[key] for key in data)
+
+	new_set = int_dedup_set(G)
+
+	print 'undirected dedup, {} nodes, {} edges'.format(nodes, nodes * degree)
+	print '{:<12}{:>12}{:>16}{:>14}'.format('', 'time (s)', 'set items', 'set (MB)')
+	print '{:<12}{:>12.3f}{:>16}{:>14.1f}'.format('tuples', old_time, len(old_set), set_size(old_set) / 1e6)
+	print '{:<12}{:>12.3f}{:>16}{:>14.1f}'.format('int pairs', new_time, len(new_set), set_size(new_set) / 1e6)
+
+
+if __name__ == '__main__' :
+	main(*[ int(arg) for arg in sys.argv[1:] ])
@@ -1,15 +1,21 @@
-from .gephi import Gephi
-
-
-__all__=['Gephi']
-
-
-__author__ = "Wessam Elhefnawy"
-__copyright__ = "Copyright 2017, The FragDB Project"
-__credits__ = ["Wessam Elhefnawy"]
-__license__ = "MIT"
-__version__ = "0.0.1"
-__maintainer__ = "Wessam Elhefnawy"
-__email__ = "welhe001@odu.edu"
-__status__ = "Research"
+from .aio import AsyncStream, EndOfStream
+from .attributes import AttributeTable
+from .cache import RenderCache
+from .gephi import Gephi
+from .progress import CancelToken, ExportCancelled
+from .stats import ExportPhase, ExportStats
+from .storage import CompactData
+
+
+__all__=['Gephi','CompactData','RenderCache','AttributeTable','AsyncStream','EndOfStream','ExportPhase','ExportStats','CancelToken','ExportCancelled']
+
+
+__author__ = "Wessam Elhefnawy"
+__copyright__ = "Copyright 2017, The FragDB Project"
+__credits__ = ["Wessam Elhefnawy"]
+__license__ = "MIT"
+__version__ = "0.0.1"
+__maintainer__ = "Wessam Elhefnawy"
+__email__ = "welhe001@odu.edu"
+__status__ = "Research"
 __date__ = "Jan, 1 2017"
\ No newline at end of file
@@ -0,0 +1,146 @@
+"""Asynchronous Export
+
+Async iterator over the chunks of Gephi.stream() for asyncio servers. Each chunk is formatted in its own event loop
+callback, or in an executor when one is given, so a large export gives the loop back between chunks instead of
+blocking every other request until the whole document is built.
+
+	>>> async for chunk in G.aexport('gexf', chunk_size = 1 << 16):
+	...     await response.write(chunk)
+
+The iterator is written without the async syntax so the module still imports on python 2, where trollius provides
+the asyncio API. The end of the stream is signalled by EndOfStream, StopAsyncIteration on python 3 :
+
+	>>> while True :
+	...     try :
+	...         chunk = yield From(stream.__anext__())
+	...     except EndOfStream :
+	...         break
+
+Asynchronous export module usage:
+	from .aio import AsyncStream, EndOfStream
+
+"""
+
+try :
+	import asyncio
+except ImportError :
+	try :
+		import trollius as asyncio
+	except ImportError :
+		asyncio = None
+
+try :
+	EndOfStream = StopAsyncIteration
+except NameError :
+	class EndOfStream(Exception):
+		"""End of an AsyncStream on python 2. A StopIteration set on the future would end the consuming trollius
+		coroutine silently, at its yield From()."""
+
+
+class AsyncStream(object):
+	"""Async Stream
+
+	Asynchronous iterator over text chunks, see Gephi.aexport(). __anext__() returns a future, resolved by a loop
+	callback or by an executor thread that takes the next chunk of the wrapped iterator.
+
+	Attributes:
+		chunks (iterator): text chunks, formatted lazily.
+		executor (concurrent.futures.Executor): executor formatting the chunks, None to format them in the loop.
+		loop (asyncio.AbstractEventLoop): event loop of the futures, the current event loop by default.
+
+	"""
+
+	__slots__ = ['chunks','executor','loop']
+
+	def __init__(self, chunks, executor = None, loop = None):
+		"""AsyncStream Constructor
+
+		Args :
+			chunks (iterable) : text chunks.
+
+		Kwargs :
+			executor (Executor, default None) : executor formatting the chunks, None to format them in the loop.
+			loop (AbstractEventLoop, default None) : event loop of the futures, the current event loop by default.
+
+		Returns :
+			none
+
+		Raises :
+			ImportError : raise exception when neither asyncio nor trollius is installed.
+
+		"""
+
+		if asyncio is None :
+			raise ImportError('asynchronous export needs the asyncio module, or trollius on python 2')
+
+		self.chunks = iter(chunks)
+		self.executor = executor
+		self.loop = loop
+
+	def __aiter__(self):
+
+		return self
+
+	def __anext__(self):
+		"""Future of the next chunk, failed with EndOfStream after the last one."""
+
+		loop = self.loop or asyncio.get_event_loop()
+		future = loop.create_future() if hasattr(loop, 'create_future') else asyncio.Future(loop = loop)
+
+		if self.executor is None :
+			loop.call_soon(self._next, future)
+		else :
+			loop.run_in_executor(self.executor, self._next_chunk).add_done_callback(lambda done : self._resolve(future, done))
+
+		return future
+
+	def aclose(self):
+		"""Stop the stream, the remaining chunks are not formatted. Returns a finished future."""
+
+		close = getattr(self.chunks, 'close', None)
+		if close is not None :
+			close()
+		self.chunks = iter(())
+
+		loop = self.loop or asyncio.get_event_loop()
+		future = loop.create_future() if hasattr(loop, 'create_future') else asyncio.Future(loop = loop)
+		future.set_result(None)
+		return future
+
+	def _next_chunk(self):
+		"""Next chunk, None after the last one."""
+
+		return next(self.chunks, None)
+
+	def _next(self, future):
+		"""Resolve future with the next chunk, in the event loop."""
+
+		if future.cancelled() :
+			return
+
+		try :
+			chunk = self._next_chunk()
+		except Exception as error :
+			future.set_exception(error)
+			return
+
+		if chunk is None :
+			future.set_exception(EndOfStream())
+		else :
+			future.set_result(chunk)
+
+	@staticmethod
+	def _resolve(future, done):
+		"""Resolve future with the outcome of the executor future done."""
+
+		if future.cancelled() :
+			return
+
+		if done.cancelled() :
+			future.cancel()
+		elif done.exception() is not None :
+			future.set_exception(done.exception())
+		elif done.result() is None :
+			future.set_exception(EndOfStream())
+		else :
+			future.set_result(done.result())
@@ -0,0 +1,95 @@
+"""Render Cache
+
+Least recently used cache of rendered graph formats. A Gephi created with a RenderCache serves repeated calls of the
+string returning methods with the same arguments from the cache. Several graphs may share one cache, the outputs of a
+graph are dropped whenever it is mutated.
+
+	>>> G = Gephi(data, cache = RenderCache(max_entries = 8, max_bytes = 64 << 20))
+	>>> G.GEXF() is G.GEXF()
+	True
+
+Render cache module usage:
+	from .cache import RenderCache
+
+"""
+
+from collections import OrderedDict
+
+class RenderCache(object):
+	"""Render Cache
+
+	Bounded LRU map of (owner, format, arguments) keys to rendered strings, limited both in number of entries and in
+	total size. Outputs larger than the size limit are never cached.
+
+	Attributes:
+		max_entries (int): maximum number of cached outputs.
+		max_bytes (int): maximum total size in characters of the cached outputs.
+		size (int): current total size of the cached outputs.
+		hits (int): number of get() calls served from the cache.
+		misses (int): number of get() calls not found in the cache.
+
+	"""
+
+	__slots__ = ['max_entries','max_bytes','size','hits','misses','entries']
+
+	def __init__(self, max_entries = 16, max_bytes = 256 << 20):
+		"""RenderCache Constructor
+
+		Kwargs :
+			max_entries (int, default 16) : maximum number of cached outputs.
+			max_bytes (int, default 256 MB) : maximum total size in characters of the cached outputs.
+
+		Returns :
+			none
+
+		"""
+
+		self.max_entries = max_entries
+		self.max_bytes = max_bytes
+		self.size = 0
+		self.hits = 0
+		self.misses = 0
+		self.entries = OrderedDict()
+
+	def get(self, key):
+		"""Cached output of key, None when it is not cached. The entry becomes the most recently used."""
+
+		value = self.entries.pop(key, None)
+		if value is None :
+			self.misses += 1
+			return None
+
+		self.entries[key] = value
+		self.hits += 1
+		return value
+
+	def put(self, key, value):
+		"""Cache the output of key, evicting the least recently used outputs beyond the limits."""
+
+		if len(value) > self.max_bytes or self.max_entries <= 0 :
+			return
+
+		old = self.entries.pop(key, None)
+		if old is not None :
+			self.size -= len(old)
+
+		self.entries[key] = value
+		self.size += len(value)
+
+		while len(self.entries) > self.max_entries or self.size > self.max_bytes :
+			self.size -= len(self.entries.popitem(last = False)[1])
+
+	def clear(self, owner = None):
+		"""Drop the cached outputs of the graph owner, the first item of their keys, or every output by default."""
+
+		if owner is None :
+			self.entries.clear()
+			self.size = 0
+			return
+
+		for key in [ key for key in self.entries if key[0] == owner ] :
+			self.size -= len(self.entries.pop(key))
+
+	def __len__(self):
+
+		return len(self.entries)
@@ -0,0 +1,102 @@
+"""Graph Files
+
+Open graph files for reading or writing with a large buffer and transparent compression selected by the file
+extension, so G.GEXF(path = 'graph.gexf.gz') and Gephi.read('gexf', 'graph.gexf.gz') work without a temporary file.
+
+	.gz : gzip
+	.bz2 : bzip2
+	.xz, .lzma : xz / lzma, needs the lzma module (python 3 or backports.lzma)
+	.zst : zstandard, needs the zstandard package
+
+Any other extension is opened as a plain file.
+
+Files module usage:
+	from .files import open_file
+
+"""
+
+import bz2
+import gzip
+import io
+import os
+
+try :
+	import lzma
+except ImportError :
+	try :
+		from backports import lzma
+	except ImportError :
+		lzma = None
+
+try :
+	import zstandard
+except ImportError :
+	zstandard = None
+
+
+# default buffer size in bytes of the opened files
+BUFFER_SIZE = 1 << 20
+
+def _open_gzip(path, mode, buffer_size):
+
+	return gzip.GzipFile(path, mode)
+
+def _open_bz2(path, mode, buffer_size):
+
+	return bz2.BZ2File(path, mode)
+
+def _open_lzma(path, mode, buffer_size):
+
+	if lzma is None :
+		raise ImportError('xz compression needs the lzma module : ' + path)
+
+	return lzma.LZMAFile(path, mode)
+
+def _open_zstd(path, mode, buffer_size):
+
+	if zstandard is None :
+		raise ImportError('zstd compression needs the zstandard package : ' + path)
+
+	f = open(path, mode, buffer_size)
+	if mode == 'rb' :
+		return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(f), buffer_size)
+	return zstandard.ZstdCompressor().stream_writer(f)
+
+# file extension -> opener(path, mode, buffer_size)
+compressions = {
+	'.gz' : _open_gzip,
+	'.bz2' : _open_bz2,
+	'.xz' : _open_lzma,
+	'.lzma' : _open_lzma,
+	'.zst' : _open_zstd,
+}
+
+def open_file(path, mode = 'r', buffer_size = BUFFER_SIZE):
+	"""Open a graph file
+
+	Open path in binary mode, through the compressor of its extension when it has one.
+
+	Args :
+		path (str) : file path, the extension selects the compression.
+
+	Kwargs :
+		mode (str, default 'r') : 'r' to read or 'w' to write.
+		buffer_size (int, default 1 MB) : buffer size of plain files.
+
+	Returns :
+		f (file) : file object, closed by the caller.
+
+	Raises :
+		ValueError : raise exception when mode is not 'r' or 'w'.
+		ImportError : raise exception when the compression module of the extension is not installed.
+
+	"""
+
+	if mode not in ('r', 'w') :
+		raise ValueError('Unsupported file mode : ' + mode)
+
+	opener = compressions.get(os.path.splitext(path)[1].lower())
+	if opener is None :
+		return open(path, mode + 'b', buffer_size)
+
+	return opener(path, mode + 'b', buffer_size)
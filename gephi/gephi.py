@@ -29,6 +29,32 @@ Todo :
 	
 """
 
+import multiprocessing
+import os
+import re
+import time
+import zlib
+from array import array
+from itertools import count, islice, izip, repeat
+from xml.sax.saxutils import escape
+
+try :
+	import numpy
+except ImportError :
+	numpy = None
+
+from .aio import AsyncStream
+from .attributes import AttributeTable
+from .cache import RenderCache
+from .files import open_file, compressions, BUFFER_SIZE
+from .progress import ProgressTracker
+from .readers import readers
+from .stats import ExportPhase, peak_memory
+from .storage import CompactData, edge_rows, save_snapshot, load_snapshot
+
+# distinct owner of the cached outputs of every graph, a RenderCache may be shared by several graphs
+_cache_ids = count()
+
 class Gephi(object):
 	"""Gephi 
 	
@@ -36,75 +62,1542 @@ class Gephi(object):
     	
     	Attributes:
         data (dict): dictionary map of graph information <key,value>, key is node name value is tuple of two items first item is list of edges and second item is list of edges weights.
+                     an optional third list holds the (start, end) time span of every edge, None for edges without span.
+                     compact graphs keep a CompactData instead, read through the same data[key] protocol.
         keys (list): nodes names of the graph
         graph_type (str): graph type
+        index (dict): map of node name to its integer position in keys, shared by every writer that emits numeric ids.
+        cache (RenderCache): cache of the string returning methods outputs, None when caching is disabled.
+        edge_count (int): number of edges of the graph.
+        node_attributes (AttributeTable): node attribute columns indexed by node id, see set_node_attribute().
+        edge_attributes (AttributeTable): edge attribute columns indexed by edge id, see set_edge_attribute().
+        instrument (callable): called with the ExportPhase measures of the exports, None when they are not measured.
 	
 	"""
 	
-	__slots__ = ['data','keys','graph_type']
+	__slots__ = ['data','keys','graph_type','index','cache','edge_count','_pairs','_pair_ids','_delta','_checkpoints','node_attributes','edge_attributes','_token_cache','instrument','_borrowed','_owned','_cache_id']
+	
+	# format name -> line generator, used by stream(), write() and the string returning methods
+	formats = {
+		'csv' : '_csv_lines',
+		'adjacency-list' : '_adjacency_list_lines',
+		'multiline-adjacency-list' : '_multiline_adjacency_list_lines',
+		'pajek' : '_pajek_net_lines',
+		'gdf' : '_gdf_lines',
+		'gexf' : '_gexf_lines',
+		'gml' : '_gml_lines',
+		'graphml' : '_graph_ml_lines',
+		'spreadsheet' : '_spread_sheet_lines',
+		'dot' : '_graphviz_dot_lines',
+		'dl' : '_ucinet_dl_lines',
+		'tlp' : '_tlp_lines',
+		'vna' : '_netdraw_vna_lines',
+	}
+	
+	# number of edges formatted by one worker task of the parallel exports
+	parallel_chunk = 65536
+	
+	# number of edges export_many() formats in every format before moving to the next ones
+	export_chunk = 8192
+	
+	# number of edges formatted by one % operation of the numeric writers (pajek, DL edge lists, TLP, VNA)
+	block_size = 16384
+	
+	# delta exportable (format, graph_format or scheme) -> edge section formatter
+	delta_formats = {
+		('csv', 'edge-list') : '_csv_edge_lines',
+		('pajek', 'edges') : '_pajek_arc_lines',
+		('pajek', 'weight') : '_pajek_weight_arc_lines',
+	}
+	
+	# width of the padded pajek '*Vertices N' line of export_delta(), rewritten in place as the graph grows
+	vertices_width = 32
 	
-	def __init__(self, data , graph_type = 'undirect'):
+	# number of edges between two progress callbacks and cancel token checks of an export
+	progress_chunk = 65536
+	
+	def __init__(self, data , graph_type = 'undirect', compact = False, cache = None, instrument = None):
 	
 		"""Gephi Constructor
 		
 		Args :
 			data (str):     python dictionary <key (str): node name, values (tuple) : (edges (list): nodes names , weight (list): edges weights)>
+			                or a CompactData, used as is by direct graphs. A value may have a third list of edges (start, end)
+			                time spans, see GEXF(mode = 'dynamic'), compact graphs do not keep them. Direct graphs copy
+			                the dictionary and an adjacency before their first change, data itself is never modified.
 			
 		Kwargs:
 			graph_type (str, default 'undirect') : type of graph 'directed' or 'undirected'
+			compact (bool, default False) : store the graph as CSR arrays (CompactData) instead of python lists, about
+			                                12 bytes per edge. Weights are stored as doubles. Always True for CompactData.
+			cache (RenderCache, default None) : serve repeated calls of the string returning methods from this cache,
+			                                    which may be shared by several graphs. Every mutation of the graph
+			                                    drops its own cached outputs.
+			instrument (callable, default None) : called with an ExportPhase for every phase of every export, an
+			                                      ExportStats for instance, see gephi.stats. None disables it.
 
 		Returns :
 			none
 			
 		Raises :
 			ValueError : raise exception when value of graph_type is not direct nor undirect.
-			TypeError : raise exception when the input data type is not a dictionary 'map'.
+			TypeError : raise exception when the input data type is not a dictionary 'map' nor a CompactData.
 		
 		"""
 	
-		if type(data) == dict :
+		if type(data) == dict or isinstance(data, CompactData) :
 		
 			self.graph_type = graph_type 
+			# direct graphs share the dictionary of the caller until their first change, see _adjacency()
+			self._borrowed = False
+			self._owned = None
+			self.cache = cache
+			self._cache_id = next(_cache_ids)
+			self.instrument = instrument
 			self.keys = data.keys()
 			
+			if isinstance(data, CompactData) :
+				compact = True
+				compact_data = CompactData(data.names) if graph_type == 'undirect' else data
+				self.index = compact_data.index
+			elif compact :
+				compact_data = CompactData(self.keys)
+				self.index = compact_data.index
+			else :
+				self.index = dict( (key, i) for i, key in enumerate(self.keys) )
+			
 			if graph_type == 'undirect' :
 				
+				# an undirected edge is stored once as the int (min_id << 32) | max_id, a single set insertion per edge
+				# tells whether it was already seen. targets that are not nodes of the graph get ids after the keys.
 				check_hash_set = set()
-				self.data = dict()
+				extra_ids = dict()
+				self.data = compact_data if compact else dict()
+				index = self.index
+				nodes_count = len(self.keys)
 				
-				for key in self.keys :
+				for source, key in enumerate(self.keys) :
 					
-					nodes = data[key][0] 
-					weights = data[key][1]
 					t_nodes = []
 					t_weights = []
+					adjacency = data[key]
+					# edges time spans travel with their weights as (weight, span) pairs, split after the loop
+					spans = adjacency[2] if len(adjacency) > 2 and not compact else None
+					
+					for node, weight in izip(adjacency[0], adjacency[1] if spans is None else izip(adjacency[1], spans)) :
 					
-					for node_index in xrange(len(nodes)) :
-						if (key,nodes[node_index]) not in check_hash_set and (nodes[node_index],key) not in check_hash_set :
-							t_nodes.append(nodes[node_index])
-							t_weights.append(weights[node_index])
-							check_hash_set.add((key,nodes[node_index]))
-							check_hash_set.add((nodes[node_index],key))
+						target = index.get(node)
+						if target is None or target >= nodes_count :
+							target = extra_ids.setdefault(node, nodes_count + len(extra_ids))
+							
+						seen = len(check_hash_set)
+						check_hash_set.add((source << 32) | target if source < target else (target << 32) | source)
+						if len(check_hash_set) != seen :
+							t_nodes.append(node)
+							t_weights.append(weight)
 					
-					self.data[key] = (t_nodes,t_weights)
+					if compact :
+						self.data.append(t_nodes, t_weights)
+					elif spans is not None :
+						self.data[key] = (t_nodes, [ pair[0] for pair in t_weights ], [ pair[1] for pair in t_weights ])
+					else :
+						self.data[key] = (t_nodes,t_weights)
 					
 					
 			elif graph_type == 'direct':
 			
-				self.data = data
+				if compact :
+					self.data = compact_data
+					if compact_data is not data :
+						for key in self.keys :
+							self.data.append(data[key][0], data[key][1])
+				else :
+					self.data = data
+					self._borrowed = True
+					self._owned = set()
 			
 			else:
 			
 				raise ValueError('Unspported Graph type : ' + graph_type + ' : Gephi only support direct and undirect graphs types')
 				
+			if isinstance(self.data, CompactData) :
+				self.edge_count = len(self.data.targets)
+			else :
+				self.edge_count = sum([ len(self.data[key][0]) for key in self.keys ])
+				
+			# undirected edge set of add_edge(), built on the first mutation
+			self._pairs = None
+			self._pair_ids = None
+			
+			# edges added since the oldest export_delta() checkpoint, None before the first one, and the checkpoint of
+			# every delta exported path as (position in _delta, number of nodes)
+			self._delta = None
+			self._checkpoints = dict()
+			
+			self.node_attributes = AttributeTable()
+			self.edge_attributes = AttributeTable()
+			
+			# token style -> map of node name to its escaped token, None when no name needs escaping, see _tokens()
+			self._token_cache = dict()
+				
+		else :
+		
+			raise TypeError('Unsupported data type : ' + str(type(data)) + ' : Gephi support dictionary and CompactData data containers ')
+			
+			
+	def stream(self, fmt, *args, **kwargs):
+		"""Stream a graph format
+	
+		Generate the selected graph format incrementally as bounded-size chunks of text, so the whole document
+		never exists in memory at once. Unlike the string returning methods the stream keeps the final newline.
+	
+			>>> for chunk in G.stream('pajek', 'edges'):
+			...     sock.send(chunk)
+	
+		Args :
+			fmt (str) : format name, one of the keys of Gephi.formats ('gexf', 'graphml', 'pajek', ...)
+			args : positional arguments of the format method (e.g. graph_format or scheme)
+	
+		Kwargs :
+			chunk_size (int, default 65536) : approximate size in characters of each yielded chunk.
+			progress (callable, default None) : called as progress(edges done, total edges) every progress_chunk edges.
+			cancel (CancelToken, default None) : stop the stream with ExportCancelled once cancelled.
+			kwargs : keyword arguments of the format method (e.g. labels, colors)
+	
+		Returns :
+			generator of str chunks
+	
+		Raises :
+			ValueError : raise exception when fmt is not a supported format.
+			ExportCancelled : raise exception from the generator when cancel is cancelled.
+	
+		"""
+	
+		chunk_size = kwargs.pop('chunk_size', 65536)
+	
+		if fmt not in self.formats :
+			raise ValueError('Unsupported graph format : ' + fmt)
+	
+		return _chunks(self._lines(fmt, *args, **kwargs), chunk_size)
+	
+	def write(self, fmt, fileobj, *args, **kwargs):
+		"""Write a graph format
+	
+		Write the selected graph format into a file-like object chunk by chunk, memory use is bounded by the chunk size
+		and does not depend on the graph size. A path is opened with open_file(), compressed by its extension, and
+		written in chunks of the file buffer size, and removed when the export fails or is cancelled.
+	
+			>>> with open('graph.gexf', 'w') as f:
+			...     G.write('gexf', f)
+			>>> G.write('gexf', 'graph.gexf.gz')
+	
+		Args :
+			fmt (str) : format name, one of the keys of Gephi.formats
+			fileobj (file or str) : any object with a write(str) method, or a file path
+			args : positional arguments of the format method
+	
+		Kwargs :
+			chunk_size (int, default 65536) : approximate size in characters of each write call, 1 MB for paths.
+			kwargs : keyword arguments of the format method
+	
+		Returns :
+			size (int) : number of characters written
+	
+		Raises :
+			ValueError : raise exception when fmt is not a supported format.
+			ImportError : raise exception when the compression module of the path extension is not installed.
+			ExportCancelled : raise exception when the cancel kwarg is cancelled, a path is removed.
+	
+		"""
+	
+		if isinstance(fileobj, basestring) :
+			if fmt not in self.formats :
+				raise ValueError('Unsupported graph format : ' + fmt)
+			kwargs.setdefault('chunk_size', BUFFER_SIZE)
+			f = open_file(fileobj, 'w')
+			try :
+				size = self.write(fmt, f, *args, **kwargs)
+			except :
+				# a cancelled or failed export leaves no partial file behind
+				f.close()
+				os.remove(fileobj)
+				raise
+			f.close()
+			return size
+	
+		return _write(fileobj, self.stream(fmt, *args, **kwargs))
+	
+	def aexport(self, fmt, *args, **kwargs):
+		"""Export a graph format asynchronously
+	
+		Asynchronous iterator over the chunks of stream() for asyncio applications. Every chunk is at most chunk_size
+		characters and is formatted in its own event loop callback, so the loop serves other tasks between two chunks,
+		or in executor when one is given, so the formatting does not run in the loop thread at all.
+	
+			>>> async for chunk in G.aexport('gexf', executor = pool):
+			...     await response.write(chunk)
+	
+		Args :
+			fmt (str) : format name, one of the keys of Gephi.formats
+			args : positional arguments of the format method
+	
+		Kwargs :
+			chunk_size (int, default 65536) : maximum size in characters of each chunk.
+			executor (Executor, default None) : executor formatting the chunks, a ThreadPoolExecutor for instance.
+			loop (AbstractEventLoop, default None) : event loop of the iterator, the current event loop by default.
+			kwargs : keyword arguments of the format method
+	
+		Returns :
+			chunks (AsyncStream) : asynchronous iterator of str chunks, ended by EndOfStream
+	
+		Raises :
+			ValueError : raise exception when fmt is not a supported format.
+			ImportError : raise exception when neither asyncio nor trollius is installed.
+	
+		"""
+	
+		chunk_size = kwargs.pop('chunk_size', 65536)
+		executor = kwargs.pop('executor', None)
+		loop = kwargs.pop('loop', None)
+	
+		return AsyncStream(_bounded(self.stream(fmt, chunk_size = chunk_size, *args, **kwargs), chunk_size), executor, loop)
+	
+	def export_many(self, targets, chunk_size = BUFFER_SIZE, progress = None, cancel = None):
+		"""Export several formats in one pass
+		
+		Write several graph formats with a single walk over the edges. The edges are taken in chunks of export_chunk
+		edges, and the rows of each chunk, the edge tuples, their escaped names and their id columns, are built once
+		and handed to the edge formatter of every format, while the chunk is still hot in the CPU caches. Each format
+		runs through the same line pipeline as stream(), so the graph instrument measures its phases and the cancel
+		token stops it. Formats without an edge section (adjacency lists, dense matrices) are written whole with the
+		first chunk. Paths are removed when the export fails.
+		
+			>>> G.export_many({'gexf' : 'graph.gexf.gz', 'pajek' : ('graph.net', 'weight'), 'graphml' : ('graph.graphml', {'weights' : True})})
+		
+		Args :
+			targets (dict) : map of format name to a path or file object, or to a tuple (path or file object, args of the
+			                 format method..., optional dict of its keyword arguments).
+			
+		Kwargs :
+			chunk_size (int, default 1 MB) : approximate size in characters of the write calls.
+			progress (callable, default None) : called as progress(edges done, total edges) before every chunk.
+			cancel (CancelToken, default None) : stop every format with ExportCancelled once cancelled.
+			
+		Returns :
+			sizes (dict) : map of format name to the number of characters written.
+			
+		Raises :
+			ValueError : raise exception when a format is not supported.
+			ExportCancelled : raise exception when cancel is cancelled, the paths are removed.
+			
+		"""
+		
+		for fmt in targets :
+			if fmt not in self.formats :
+				raise ValueError('Unsupported graph format : ' + fmt)
+				
+		# the chunk every format formats next, None once the edges are done
+		current = [ None ]
+		
+		def chunks():
+			while current[0] is not None :
+				yield current[0]
+				
+		outputs = []
+		opened = []
+		sizes = dict()
+		
+		try :
+			for fmt in targets :
+				target, args, kwargs = targets[fmt], (), {}
+				if isinstance(target, tuple) :
+					target, args = target[0], target[1:]
+					if args and isinstance(args[-1], dict) :
+						args, kwargs = args[:-1], dict(args[-1])
+						
+				if isinstance(target, basestring) :
+					path, target = target, open_file(target, 'w')
+					opened.append((path, target))
+					
+				kwargs['chunks'] = chunks()
+				kwargs.setdefault('cancel', cancel)
+				outputs.append((fmt, target, self._lines(fmt, *args, **kwargs)))
+				sizes[fmt] = 0
+				
+			for keys, edge_id in self._key_chunks(self.export_chunk):
+				if progress is not None :
+					progress(edge_id, self.edge_count)
+				current[0] = (_Chunk(keys), edge_id)
+				for fmt, target, lines in outputs :
+					sizes[fmt] += _write(target, _chunks(_until_marker(lines), chunk_size))
+					
+			current[0] = None
+			for fmt, target, lines in outputs :
+				sizes[fmt] += _write(target, _chunks(_until_marker(lines), chunk_size))
+				
+			if progress is not None :
+				progress(self.edge_count, self.edge_count)
+				
+		except :
+			# like write(), a failed export leaves no partial file behind
+			for path, f in opened :
+				f.close()
+				os.remove(path)
+			raise
+			
+		for path, f in opened :
+			f.close()
+			
+		return sizes
+		
+	def export_shards(self, fmt, path, shards, *args, **kwargs):
+		"""Sharded Export
+		
+		Split the graph into shards small enough to be opened one at a time, in a single pass over the adjacency. Every
+		node belongs to one shard, by the crc32 of its name or by partition. Each shard file holds the subgraph induced
+		by its nodes, and the boundary file holds the cut edges, the edges between two shards, with their end nodes.
+		The files are written in the selected format, by worker processes when workers is more than 1. Node and edge
+		attributes follow their nodes and edges.
+		
+			>>> G.export_shards('gexf', 'graph-{}.gexf.gz', 8, workers = 4)
+			>>> G.export_shards('pajek', 'graph-{}.net', 2, 'weight', partition = lambda name : int(name < 'm'))
+		
+		Args :
+			fmt (str) : format name, one of the keys of Gephi.formats
+			path (str) : shard path template, path.format(i) is the path of shard i and path.format('boundary') the
+			             path of the boundary file, compressed by its extension.
+			shards (int) : number of shards.
+			args : positional arguments of the format method
+			
+		Kwargs :
+			partition (callable or dict, default None) : map of node name to its shard number, from 0 to shards - 1,
+			                                             the crc32 of the name modulo shards by default.
+			workers (int, default 1) : number of processes writing the files.
+			kwargs : keyword arguments of the format method
+			
+		Returns :
+			sizes (dict) : map of shard number, and of 'boundary', to the number of characters written.
+			
+		Raises :
+			ValueError : raise exception when fmt is not a supported format, when shards is less than 1, when path has
+			             no replacement field or when a node is mapped outside of the shards.
+			
+		"""
+		
+		partition = kwargs.pop('partition', None)
+		workers = kwargs.pop('workers', 1)
+		
+		if fmt not in self.formats :
+			raise ValueError('Unsupported graph format : ' + fmt)
+		if shards < 1 :
+			raise ValueError('Unsupported number of shards : ' + str(shards))
+		if path.format(0) == path.format(1) :
+			raise ValueError('Shard path without replacement field : ' + path)
+			
+		if partition is None :
+			shard_of = lambda name : _crc32(name) % shards
+		else :
+			shard_of = partition if callable(partition) else partition.__getitem__
+			
+		# the graph ids of the edges are only kept to carry the edge attributes
+		edge_ids = len(self.edge_attributes) > 0
+		parts = [ _Shard(edge_ids) for _ in xrange(shards) ]
+		boundary = _Shard(edge_ids)
+		owners = dict()
+		
+		def owner(name):
+			part = owners.get(name)
+			if part is None :
+				number = shard_of(name)
+				if not 0 <= number < shards :
+					raise ValueError('Node ' + str(name) + ' mapped outside of the ' + str(shards) + ' shards : ' + str(number))
+				part = owners[name] = parts[number]
+				part.node(name, self.index.get(name, -1))
+			return part
+			
+		edge_id = 0
+		for key in self.keys :
+			
+			adjacency = self.data[key]
+			spans = adjacency[2] if len(adjacency) > 2 else repeat(None)
+			source = owner(key)
+			source.source(key, len(adjacency) > 2)
+			
+			for node, weight, span in izip(adjacency[0], adjacency[1], spans) :
+				if owner(node) is source :
+					source.edge(key, node, weight, span, edge_id)
+				else :
+					boundary.node(key, self.index.get(key, -1))
+					boundary.node(node, self.index.get(node, -1))
+					boundary.source(key, len(adjacency) > 2)
+					boundary.edge(key, node, weight, span, edge_id)
+				edge_id += 1
+				
+		tasks = []
+		for number, part in enumerate(parts + [ boundary ]) :
+			tasks.append(( fmt, path.format(number if part is not boundary else 'boundary'), args, kwargs, self.graph_type,
+				part.data, part.names, self._shard_attributes(self.node_attributes, part.node_ids),
+				self.edge_attributes.take(part.edge_order()) if edge_ids else None ))
+				
+		if workers <= 1 :
+			sizes = map(_write_shard, tasks)
+		else :
+			pool = multiprocessing.Pool(min(workers, len(tasks)))
+			try :
+				sizes = pool.map(_write_shard, tasks)
+			finally :
+				pool.terminate()
+				
+		return dict(zip(range(shards) + [ 'boundary' ], sizes))
+		
+	def _shard_attributes(self, table, ids):
+		"""Rows of table for ids, None without attributes."""
+		
+		return table.take(ids) if len(table) else None
+	
+	@classmethod
+	def read(cls, fmt, source, *args, **kwargs):
+		"""Read a graph format
+		
+		Parse a file written in one of the supported formats back into a Gephi object. The source is consumed line by
+		line and turned into the data dictionary accepted by the constructor, see gephi.readers for what each format keeps.
+		
+			>>> G = Gephi.read('pajek', 'graph.net', graph_type = 'direct')
+			>>> H = Gephi.read('csv', open('graph.csv'), 'edge-list')
+		
+		Args :
+			fmt (str) : format name, one of the keys of Gephi.formats
+			source (str or file) : path or file-like object
+			args : positional arguments of the reader, the graph_format of 'csv'
+			
+		Kwargs :
+			graph_type (str, default 'undirect') : type of graph 'direct' or 'undirect'
+			compact (bool, default False) : store the graph as CSR arrays
+			kwargs : keyword arguments of the reader
+			
+		Returns :
+			G (Gephi) : graph read from source
+			
+		Raises :
+			ValueError : raise exception when fmt is not a supported format.
+		
+		"""
+		
+		graph_type = kwargs.pop('graph_type', 'undirect')
+		compact = kwargs.pop('compact', False)
+		
+		if fmt not in readers :
+			raise ValueError('Unsupported graph format : ' + fmt)
+			
+		return cls(readers[fmt](source, *args, **kwargs), graph_type = graph_type, compact = compact)
+		
+	@classmethod
+	def from_edges(cls, sources, targets = None, weights = None, graph_type = 'undirect', compact = False, spans = None):
+		"""Build a graph from an edge list
+		
+		Group an edge list by source in one linear pass, without building the nested dictionary first. Compact graphs
+		fill the CSR arrays directly, see CompactData.from_edges(). Like the readers every node referenced by an edge
+		is a node of the graph. Names that are not strings, NumPy integer ids for instance, are converted with str().
+		
+			>>> G = Gephi.from_edges(['a', 'a', 'b'], ['b', 'c', 'c'], [1, 2, 3])
+			>>> G = Gephi.from_edges(numpy_sources, numpy_targets, compact = True)
+			>>> G = Gephi.from_edges(cursor.fetchall(), graph_type = 'direct')
+			>>> G = Gephi.from_edges(sources, targets, spans = zip(starts, ends))
+		
+		Args :
+			sources (iterable) : source names, or (source, target) / (source, target, weight) tuples when targets is None.
+			
+		Kwargs :
+			targets (sequence, default None) : target names, one per source.
+			weights (sequence, default None) : edges weights, one per source, every edge weights 1 by default.
+			graph_type (str, default 'undirect') : type of graph 'direct' or 'undirect'
+			compact (bool, default False) : store the graph as CSR arrays
+			spans (sequence, default None) : (start, end) time span of every edge, see GEXF(mode = 'dynamic').
+			
+		Returns :
+			G (Gephi) : graph of the edges, every source and target is a node.
+			
+		Raises :
+			ValueError : raise exception when spans are given for a compact graph.
+			
+		"""
+		
+		rows = edge_rows(sources, targets, weights)
+		
+		if compact :
+			if spans is not None :
+				raise ValueError('Compact graphs do not store edges time spans')
+			return cls(CompactData.from_edges(rows), graph_type = graph_type)
+			
+		if spans is not None :
+			spans = iter(spans)
+			
+		empty = (lambda : ([], [], [])) if spans is not None else (lambda : ([], []))
+		data = dict()
+		for source, target, weight in rows :
+			adjacency = data.get(source)
+			if adjacency is None :
+				adjacency = data[source] = empty()
+			adjacency[0].append(target)
+			adjacency[1].append(weight)
+			if spans is not None :
+				adjacency[2].append(_span(next(spans)))
+			if target not in data :
+				data[target] = empty()
+			
+		return cls(data, graph_type = graph_type)
+		
+	def save(self, path):
+		"""Save a binary snapshot
+		
+		Write the graph as a binary snapshot, the CSR arrays and the nodes names table, see storage.save_snapshot().
+		Gephi.load() reopens it instantly. Weights are saved as doubles, edges time spans and attributes are not saved.
+		
+			>>> G.save('graph.csr')
+			>>> G = Gephi.load('graph.csr')
+		
+		Args :
+			path (str) : snapshot file path.
+			
+		Returns :
+			size (int) : size of the snapshot in bytes.
+			
+		"""
+		
+		data = self.data
+		if not isinstance(data, CompactData) :
+			data = CompactData(self.keys)
+			for key in self.keys :
+				data.append(self.data[key][0], self.data[key][1])
+				
+		return save_snapshot(path, data, 1 if self.graph_type == 'undirect' else 0)
+		
+	@classmethod
+	def load(cls, path, cache = None):
+		"""Load a binary snapshot
+		
+		Reopen a graph saved by save() without parsing : the file is mapped in memory and its CSR arrays are used in
+		place, only the nodes names table is read. Processes loading the same snapshot share its pages. The graph is a
+		compact graph, read-only like every CompactData graph.
+		
+		Args :
+			path (str) : snapshot file path.
+			
+		Kwargs :
+			cache (RenderCache, default None) : cache of the string returning methods.
+			
+		Returns :
+			G (Gephi) : graph of the snapshot, with the graph type it was saved with.
+			
+		Raises :
+			ValueError : raise exception when path is not a snapshot.
+			
+		"""
+		
+		data, flags = load_snapshot(path)
+		
+		# the saved edges of undirected graphs are already deduplicated, the graph is built as a direct one
+		G = cls(data, graph_type = 'direct', cache = cache)
+		G.graph_type = 'undirect' if flags & 1 else 'direct'
+		return G
+		
+	def add_node(self, node):
+		"""Add a node
+		
+		Append a node without edges to the graph, nothing is done when it is already a node. O(1).
+		
+		Args :
+			node (str) : node name.
+			
+		Returns :
+			added (bool) : False when node was already a node of the graph.
+			
+		Raises :
+			TypeError : raise exception for compact graphs, which are read-only.
+			
+		"""
+		
+		self._check_mutable()
+		
+		if node in self.data :
+			return False
+			
+		self.index[node] = len(self.keys)
+		self.keys.append(node)
+		self._own_data()
+		self.data[node] = ([], [])
+		self._mutated()
+		return True
+		
+	def add_edge(self, source, target, weight = 1, start = None, end = None):
+		"""Add an edge
+		
+		Append an edge source -> target, its missing end nodes are added to the graph first. Undirected graphs keep a
+		single edge per pair of nodes, in either direction, checked against the int encoded edge set of the constructor,
+		which is built once on the first call. O(1) amortised.
+		
+		Timestamped edge streams give the time span of every edge, written by GEXF(mode = 'dynamic') :
+		
+			>>> for source, target, time in events :
+			...     G.add_edge(source, target, start = time, end = time + 3600)
+		
+		Args :
+			source (str) : source node name.
+			target (str) : target node name.
+			
+		Kwargs :
+			weight (number, default 1) : edge weight.
+			start (number or str, default None) : start time of the edge, unbounded by default.
+			end (number or str, default None) : end time of the edge, unbounded by default.
+			
+		Returns :
+			added (bool) : False when the undirected edge already exists.
+			
+		Raises :
+			TypeError : raise exception for compact graphs, which are read-only.
+			
+		"""
+		
+		self._check_mutable()
+		
+		self.add_node(source)
+		self.add_node(target)
+		
+		if self.graph_type == 'undirect' :
+			pairs = self._edge_pairs()
+			pair = self._pair(source, target)
+			if pair in pairs :
+				return False
+			pairs.add(pair)
+			
+		adjacency = self._adjacency(source)
+		if start is not None or end is not None or len(adjacency) > 2 :
+			adjacency = self._spanned(source)
+			adjacency[2].append(None if start is None and end is None else (start, end))
+		adjacency[0].append(target)
+		adjacency[1].append(weight)
+		self.edge_count += 1
+		if len(self.edge_attributes) :
+			self.edge_attributes.insert(self._edge_id(source, len(adjacency[0]) - 1))
+		if self._delta is not None :
+			self._delta.append((source, target, weight))
+		self._mutated()
+		return True
+		
+	def remove_edge(self, source, target):
+		"""Remove an edge
+		
+		Remove the first edge source -> target, undirected graphs also look for target -> source. Nodes are kept.
+		O(degree of source) to find the edge in its adjacency list.
+		
+		Args :
+			source (str) : source node name.
+			target (str) : target node name.
+			
+		Returns :
+			weight (number) : weight of the removed edge.
+			
+		Raises :
+			TypeError : raise exception for compact graphs, which are read-only.
+			KeyError : raise exception when the edge is not in the graph.
+			
+		"""
+		
+		self._check_mutable()
+		
+		ends = [ (source, target) ]
+		if self.graph_type == 'undirect' :
+			ends.append((target, source))
+			
+		for key, node in ends :
+			if key not in self.data :
+				continue
+			try :
+				position = self.data[key][0].index(node)
+			except ValueError :
+				continue
+				
+			adjacency = self._adjacency(key)
+			nodes, weights = adjacency[0], adjacency[1]
+			if len(self.edge_attributes) :
+				self.edge_attributes.delete(self._edge_id(key, position))
+			del nodes[position]
+			weight = weights.pop(position)
+			if len(adjacency) > 2 :
+				del adjacency[2][position]
+			self.edge_count -= 1
+			if self._pairs is not None :
+				self._pairs.discard(self._pair(source, target))
+			# an appended export can not remove lines, the next export_delta() calls write the whole graph
+			self._delta = None
+			self._checkpoints.clear()
+			self._mutated()
+			return weight
+			
+		raise KeyError('Edge not found : ' + str(source) + ' -> ' + str(target))
+		
+	def set_node_attribute(self, name, values, attr_type = 'string', default = None):
+		"""Set a node attribute
+		
+		Store the values of a node attribute as one column of node_attributes, written by GDF_format(), GEXF(),
+		graph_ML() and netdraw_VNA(). Nodes beyond the column, such as the nodes added later, have the default value.
+		
+			>>> G.set_node_attribute('age', [56, 23, 48], 'int')
+			>>> G.set_node_attribute('gender', {'joe' : 'male', 'wendy' : 'female'})
+		
+		Args :
+			name (str) : attribute name.
+			values (sequence or dict) : value of every node in keys order, or map of node name to value.
+			
+		Kwargs :
+			attr_type (str, default 'string') : 'string', 'int', 'double' or 'boolean'.
+			default (object, default None) : value of the nodes without value, '', 0, 0.0 or False by type by default.
+			
+		Returns :
+			none
+			
+		Raises :
+			ValueError : raise exception when attr_type is not supported.
+			KeyError : raise exception when a name of the values map is not a node.
+			
+		"""
+		
+		if isinstance(values, dict) :
+			self.node_attributes.add(name, (), attr_type, default)
+			column = [ self.node_attributes.defaults[name] ] * len(self.keys)
+			for node, value in values.iteritems() :
+				i = self.index.get(node, len(self.keys))
+				if i >= len(self.keys) :
+					raise KeyError('Node not found : ' + str(node))
+				column[i] = value
+			values = column
+			
+		self.node_attributes.add(name, values, attr_type, default)
+		self._mutated()
+		
+	def set_edge_attribute(self, name, values, attr_type = 'string', default = None):
+		"""Set an edge attribute
+		
+		Store the values of an edge attribute as one column of edge_attributes, indexed by edge id : the position of
+		the edge in the edges() order. add_edge() and remove_edge() keep the columns aligned, in O(edges) once the graph
+		has edge attributes.
+		
+			>>> G.set_edge_attribute('kind', [ 'friend' if weight > 1 else 'colleague' for s, t, weight in G.edges() ])
+		
+		Args :
+			name (str) : attribute name.
+			values (sequence) : value of every edge in edges() order.
+			
+		Kwargs :
+			attr_type (str, default 'string') : 'string', 'int', 'double' or 'boolean'.
+			default (object, default None) : value of the edges without value, '', 0, 0.0 or False by type by default.
+			
+		Returns :
+			none
+			
+		Raises :
+			ValueError : raise exception when attr_type is not supported.
+			
+		"""
+		
+		self.edge_attributes.add(name, values, attr_type, default)
+		self._mutated()
+		
+	def _edge_id(self, key, position):
+		"""Edge id of the edge at position of the adjacency of key, counting the edges of the previous keys. O(nodes)."""
+		
+		edge_id = position
+		for other in islice(self.keys, self.index[key]) :
+			edge_id += len(self.data[other][0])
+			
+		return edge_id
+		
+	def export_delta(self, fmt, path, *args, **kwargs):
+		"""Delta Export
+		
+		Keep a CSV edge-list or a pajek edges / weight file up to date : the first call for a path writes the whole graph
+		and takes a checkpoint of the path, the next calls only append the edges added since its checkpoint, in
+		O(delta). Pajek files are written with a padded '*Vertices N' line that is rewritten in place when nodes are added.
+		
+		The whole graph is written again when there is no checkpoint or no file yet, when an edge was removed since the
+		checkpoint, when nodes were added to a pajek file with labels, or when the pajek header does not come from
+		export_delta().
+		
+			>>> G.export_delta('pajek', 'graph.net', 'edges', labels = False)
+			>>> G.add_edge('a', 'e')
+			>>> G.export_delta('pajek', 'graph.net', 'edges', labels = False)
+		
+		Args :
+			fmt (str) : 'csv' or 'pajek'.
+			path (str) : path of an uncompressed file.
+			args : graph_format 'edge-list' of 'csv', scheme 'edges' or 'weight' of 'pajek'.
+			
+		Kwargs :
+			labels (bool, default True) : pajek nodes labels.
+			
+		Returns :
+			size (int) : number of characters written.
+			
+		Raises :
+			ValueError : raise exception when the format or the path extension does not support appending.
+			
+		"""
+		
+		method = self.delta_formats.get((fmt, args[0] if args else None))
+		if method is None :
+			raise ValueError('Unsupported delta format : ' + fmt + ' ' + ' '.join(args))
+		if os.path.splitext(path)[1].lower() in compressions :
+			raise ValueError('Delta export needs an uncompressed file : ' + path)
+			
+		key = os.path.abspath(path)
+		checkpoint = self._checkpoints.get(key)
+		
+		full = checkpoint is None or not os.path.exists(path)
+		if not full and fmt == 'pajek' :
+			full = (kwargs.get('labels', True) and len(self.keys) != checkpoint[1]) or not self._update_vertices(path)
+			
+		if full :
+			if fmt == 'pajek' :
+				kwargs['vertices_width'] = self.vertices_width
+			size = self.write(fmt, path, *args, **kwargs)
+			if self._delta is None :
+				self._delta = []
+		else :
+			with open(path, 'ab') as f :
+				size = _write(f, _chunks(self._delta_lines(method, checkpoint[0]), BUFFER_SIZE))
+				
+		self._checkpoints[key] = (len(self._delta), len(self.keys))
+		
+		# drop the edges every checkpoint has exported
+		done = min( position for position, nodes in self._checkpoints.values() )
+		if done :
+			del self._delta[:done]
+			for other, (position, nodes) in self._checkpoints.items() :
+				self._checkpoints[other] = (position - done, nodes)
+				
+		return size
+		
+	def _delta_lines(self, method, start):
+		"""Edge lines of the edges added since position start of _delta, formatted by method with the ids of the graph."""
+		
+		data = dict()
+		keys = []
+		for source, target, weight in self._delta[start:] :
+			if source not in data :
+				data[source] = ([], [])
+				keys.append(source)
+			data[source][0].append(target)
+			data[source][1].append(weight)
+			
+		delta = Gephi(data, graph_type = 'direct')
+		delta.index = self.index
+		return getattr(delta, method)(keys, 0)
+		
+	def _update_vertices(self, path):
+		"""Rewrite the padded '*Vertices N' line of a pajek file, False when it is missing or too short."""
+		
+		with open(path, 'r+b') as f :
+			line = f.readline().rstrip('\r\n')
+			vertices = '*Vertices ' + str(len(self.keys))
+			if not line.startswith('*Vertices ') or len(line) < len(vertices) :
+				return False
+				
+			f.seek(0)
+			f.write(vertices.ljust(len(line)))
+			
+		return True
+		
+	def _spanned(self, key):
+		"""Adjacency of key with its third list of edges time spans, added with None spans for the existing edges."""
+		
+		adjacency = self._adjacency(key)
+		if len(adjacency) < 3 :
+			adjacency = self.data[key] = (adjacency[0], adjacency[1], [ None ] * len(adjacency[0]))
+			
+		return adjacency
+		
+	def _adjacency(self, key):
+		"""Adjacency of key to change, a copy of the caller's lists on the first change of a borrowed key. O(degree)."""
+		
+		adjacency = self.data[key]
+		if self._owned is not None and key not in self._owned :
+			self._own_data()
+			adjacency = self.data[key] = tuple( list(values) for values in adjacency )
+			self._owned.add(key)
+			
+		return adjacency
+		
+	def _own_data(self):
+		"""Replace the dictionary shared with the caller by a shallow copy, the adjacencies stay shared. O(nodes) once."""
+		
+		if self._borrowed :
+			self.data = dict(self.data)
+			self._borrowed = False
+		
+	def _check_mutable(self):
+	
+		if isinstance(self.data, CompactData) :
+			raise TypeError('Compact graphs are read-only : build a dictionary graph to add or remove edges')
+			
+	def _edge_pairs(self):
+		"""Set of the undirected edges encoded by _pair(), built from the edges on the first call."""
+		
+		if self._pairs is None :
+			self._pair_ids = dict()
+			self._pairs = set( self._pair(key, node) for key, node, weight in self.edges() )
+			
+		return self._pairs
+		
+	def _pair(self, source, target):
+		"""Int encoding (min_id << 32) | max_id of an undirected edge.
+		
+		Nodes use their index position, names that are not nodes get ids counted down from 2**32 - 1 and keep them
+		once they are added as nodes, so encoded pairs never change.
+		
+		"""
+		
+		ids = []
+		for name in (source, target) :
+			node_id = self._pair_ids.get(name)
+			if node_id is None :
+				node_id = self.index.get(name)
+				if node_id is None :
+					node_id = self._pair_ids[name] = (1 << 32) - 1 - len(self._pair_ids)
+			ids.append(node_id)
+			
+		low, high = min(ids), max(ids)
+		return (low << 32) | high
+		
+	def _render(self, fmt, *args, **kwargs):
+		"""Render a graph format as one string without the trailing newline, backing the string returning methods.
+		
+		With a path kwarg the format is written into that file instead, see write(), and the written size is returned.
+		
+		"""
+	
+		path = kwargs.pop('path', None)
+		if path is not None :
+			return self.write(fmt, path, *args, **kwargs)
+	
+		key = _cache_key(self._cache_id, fmt, args, kwargs) if self.cache is not None else None
+		if key is not None :
+			output = self.cache.get(key)
+			if output is not None :
+				return output
+	
+		chunks = [ chunk for chunk in self._lines(fmt, *args, **kwargs) if chunk ]
+		if chunks :
+			chunks[-1] = chunks[-1][:-1]
+	
+		output = ''.join(chunks)
+		if key is not None :
+			self.cache.put(key, output)
+	
+		return output
+	
+	def _mutated(self):
+		"""Invalidate what is derived from the graph, called by every method that changes the graph."""
+	
+		if self.cache is not None :
+			self.cache.clear(self._cache_id)
+		self._token_cache.clear()
+	
+	def _lines(self, fmt, *args, **kwargs):
+		"""Yield the lines of a format, the edge section placeholder of its writer replaced by the edge lines.
+		
+		The progress and cancel kwargs, see gephi.progress, are taken out of kwargs and followed by the edge section.
+		The chunks kwarg of export_many() is taken out too, see _edge_lines().
+		
+		"""
+	
+		progress = kwargs.pop('progress', None)
+		cancel = kwargs.pop('cancel', None)
+		chunks = kwargs.pop('chunks', None)
+		tracker = ProgressTracker(progress, cancel, self.edge_count) if progress is not None or cancel is not None else None
+		
+		if self.instrument is not None :
+			lines = self._instrumented_lines(fmt, args, kwargs, tracker, chunks)
+		elif tracker is not None :
+			lines = self._tracked_lines(fmt, args, kwargs, tracker, chunks)
+		else :
+			lines = getattr(self, self.formats[fmt])(*args, **kwargs)
+			
+		if tracker is not None :
+			tracker.update(0)
+			
+		for line in lines:
+			if line.__class__ is _EdgeSection :
+				for edge_line in self._edge_lines(line.method, line.workers, chunks = chunks):
+					yield edge_line
+			elif line.__class__ is not _Section :
+				yield line
+				
+		if tracker is not None :
+			tracker.update(self.edge_count)
+	
+	def _tracked_lines(self, fmt, args, kwargs, tracker, chunks = None):
+		"""Yield the lines of _lines() with the edge sections expanded under tracker, see _edge_lines()."""
+		
+		for line in getattr(self, self.formats[fmt])(*args, **kwargs):
+			if line.__class__ is _EdgeSection :
+				for edge_line in self._edge_lines(line.method, line.workers, tracker, chunks):
+					yield edge_line
+			elif line.__class__ is _Section :
+				tracker.section(line.rows)
+				yield line
+			else :
+				tracker.line()
+				yield line
+	
+	def _instrumented_lines(self, fmt, args, kwargs, tracker = None, chunks = None):
+		"""Yield the lines of _lines() and report every phase of the export to the instrument.
+		
+		The lines before the first section are the head phase, a _Section marker starts a phase of its name, the edge
+		section is the edges phase and the lines after it are the tail phase. Only the time spent producing the lines
+		is counted, not the time the consumer holds each line. The edge sections follow tracker when one is given.
+		The peak memory of every phase is measured against the process peak when the export starts.
+		
+		"""
+		
+		clock = time.time
+		baseline = peak_memory()
+		phase = ExportPhase(fmt, 'head')
+		started = clock()
+		
+		for line in getattr(self, self.formats[fmt])(*args, **kwargs):
 			
+			if line.__class__ is _Section or line.__class__ is _EdgeSection :
+				phase.seconds += clock() - started
+				self._report(phase, baseline)
+				phase = ExportPhase(fmt, line.phase if line.__class__ is _Section else 'edges')
+				if tracker is not None and line.__class__ is _Section :
+					tracker.section(line.rows)
+				started = clock()
 				
+			if line.__class__ is _EdgeSection :
+				for edge_line in self._edge_lines(line.method, line.workers, tracker, chunks):
+					if edge_line is not None :
+						phase.size += len(edge_line)
+					phase.seconds += clock() - started
+					yield edge_line
+					started = clock()
+				phase.seconds += clock() - started
+				self._report(phase, baseline)
+				phase = ExportPhase(fmt, 'tail')
+				started = clock()
+			elif line.__class__ is not _Section :
+				if tracker is not None :
+					tracker.line()
+				phase.size += len(line)
+				phase.seconds += clock() - started
+				yield line
+				started = clock()
+				
+		phase.seconds += clock() - started
+		self._report(phase, baseline)
+		
+	def _report(self, phase, baseline = None):
+		"""Complete phase with the nodes and edges it processed and the growth of the peak memory above baseline, then
+		give it to the instrument. Phases that emitted nothing are dropped, but for the matrix build."""
+		
+		if not phase.size and phase.phase != 'matrix' :
+			return
+			
+		if phase.phase in ('nodes', 'edges', 'matrix') :
+			phase.nodes = len(self.keys)
+		if phase.phase in ('edges', 'matrix') :
+			phase.edges = self.edge_count
+		peak = peak_memory()
+		phase.peak = peak - baseline if peak is not None and baseline is not None else None
+		
+		self.instrument(phase)
+	
+	def _tokens(self, style):
+		"""Node Tokens
+		
+		Map of every node name to its token of style : the name escaped or quoted once for a format, see _token_styles,
+		so hubs are not escaped again for each of their edges. None when no name needs escaping, which is found with
+		one scan of the distinct names joined, and writers then emit the names as they are. The map of every style is
+		kept until the graph is mutated, the joined names are not.
+		
+		Args :
+			style (str) : token style, a key of _token_styles.
+			
+		Returns :
+			tokens (dict) : map of node name to token, or None.
+			
+		"""
+		
+		if style in self._token_cache :
+			return self._token_cache[style]
+			
+		quote, special = _token_styles[style]
+		if isinstance(self.data, CompactData) :
+			names = self.data.names
 		else :
+			names = set(self.keys)
+			for key in self.keys :
+				names.update(self.data[key][0])
+				
+		tokens = None
+		if special('\0'.join(names)) :
+			tokens = dict( (name, quote(name)) for name in names )
+			if all( token == name for name, token in tokens.iteritems() ) :
+				tokens = None
+				
+		self._token_cache[style] = tokens
+		return tokens
+		
+	def _escaped_keys(self, style):
+		"""Tokens of style of the keys, in keys order."""
+		
+		tokens = self._tokens(style)
+		if tokens is None :
+			return self.keys
+			
+		return [ tokens[key] for key in self.keys ]
+		
+	def _escaped_adjacency(self, style, keys = None):
+		"""Iterate over (source token, list of target tokens) pairs of style of keys, all the nodes by default."""
+		
+		tokens = self._tokens(style)
+		for key in (self.keys if keys is None else keys) :
+			nodes = self.data[key][0]
+			if tokens is None :
+				yield key, nodes
+			else :
+				yield tokens[key], [ tokens[node] for node in nodes ]
+				
+	def _escaped_edges(self, edges, style):
+		"""Edge tuples of edges with the source and target names replaced by their tokens of style."""
+		
+		tokens = self._tokens(style)
+		if tokens is None :
+			return edges
+			
+		return ( (tokens[edge[0]], tokens[edge[1]]) + edge[2:] for edge in edges )
+		
+	def _escaped_rows(self, keys, style, spanned = False):
+		"""Edge tuples of keys escaped by style, with their time spans when spanned. The rows of an export_many() chunk
+		are built once and shared by every format of the same style."""
+		
+		if keys.__class__ is _Chunk :
+			if self._tokens(style) is None :
+				return iter(keys.shared('spanned', lambda : list(self._spanned_edges(list(keys))))) if spanned else self.edges(keys)
+			return iter(keys.shared(('escaped', style, spanned), lambda : list(self._escaped_rows(list(keys), style, spanned))))
+			
+		return self._escaped_edges(self._spanned_edges(keys) if spanned else self.edges(keys), style)
+		
+	def edges(self, keys = None):
+		"""Weighted Edges
+		
+		Iterate over the edges as (source, target, weight) triples in one pass, each target is paired with the weight
+		at the same position of its node list, so lookups are O(1) per edge and parallel edges keep their own weights.
+		
+			>>> for source, target, weight in G.edges():
+			...     print source, target, weight
 		
-			raise TypeError('Unsupported data type : ' + str(type(data)) + ' : Gephi support dictionary data container ')
+		Kwargs :
+			keys (list, default None) : source nodes to iterate, all the nodes of the graph in keys order by default.
 			
+		Returns :
+			iterator of (source, target, weight) tuples
 			
-	def CVS(self, graph_format = 'adjacency-list'):
+		"""
+		
+		if keys.__class__ is _Chunk :
+			return iter(keys.shared('edges', lambda : list(self._edges(list(keys)))))
+			
+		return self._edges(keys)
+		
+	def _edges(self, keys = None):
+		"""Generator of edges()."""
+		
+		if isinstance(self.data, CompactData) :
+			for key in (self.keys if keys is None else keys) :
+				for node, weight in self.data.edges(self.index[key]):
+					yield key, node, weight
+		else :
+			for key in (self.keys if keys is None else keys) :
+				adjacency = self.data[key]
+				for node, weight in izip(adjacency[0], adjacency[1]):
+					yield key, node, weight
+				
+	def _edge_lines(self, method, workers = 1, tracker = None, chunks = None):
+		"""Edge Section
+		
+		Yield the edge lines of a writer, formatted by getattr(self, method)(keys, edge_id). With more than one worker
+		the keys are split in contiguous chunks of about parallel_chunk edges formatted by a process pool, the chunks
+		are yielded in keys order with their global first edge id, so the output is the same as the serial one.
+		Only 2 * workers chunks are in flight at a time.
+		
+		With a tracker the edges are formatted in chunks of about progress_chunk edges, or in the parallel chunks, and
+		the tracker is updated with the number of edges done before each chunk but the first.
+		
+		export_many() gives the chunks instead, an iterable of (keys, id of the first edge) pairs shared by all its
+		formats : each chunk is formatted in turn as one text followed by a None marker, so the formats move in step.
+		
+		Args :
+			method (str) : name of the edge formatter method.
+			
+		Kwargs :
+			workers (int, default 1) : number of processes, not used with chunks.
+			tracker (ProgressTracker, default None) : progress of the export.
+			chunks (iterable, default None) : chunks of export_many().
+			
+		Returns :
+			generator of str, and of None markers with chunks
+			
+		Raises :
+			ExportCancelled : raise exception when the cancel token of tracker is cancelled.
+			
+		"""
+		
+		if chunks is not None :
+			for keys, edge_id in chunks:
+				if tracker is not None and edge_id :
+					tracker.update(edge_id)
+				yield ''.join(getattr(self, method)(keys, edge_id))
+				yield None
+			return
+			
+		if workers <= 1 and tracker is None :
+			for line in getattr(self, method)(self.keys, 0):
+				yield line
+			return
+			
+		if workers <= 1 :
+			for keys, edge_id in self._key_chunks(self.progress_chunk):
+				if edge_id :
+					tracker.update(edge_id)
+				for line in getattr(self, method)(keys, edge_id):
+					yield line
+			return
+			
+		pool = multiprocessing.Pool(workers)
+		try :
+			batch = []
+			for task in self._chunk_tasks(method):
+				batch.append(task)
+				if len(batch) == 2 * workers :
+					for task, text in izip(batch, pool.imap(_format_chunk, batch)):
+						if tracker is not None and task[3] :
+							tracker.update(task[3])
+						yield text
+					batch = []
+					
+			for task, text in izip(batch, pool.imap(_format_chunk, batch)):
+				if tracker is not None and task[3] :
+					tracker.update(task[3])
+				yield text
+				
+		finally :
+			pool.terminate()
+			
+	def _chunk_tasks(self, method):
+		"""Split the keys in contiguous chunks of about parallel_chunk edges, yield the worker tasks of _format_chunk."""
+		
+		for keys, edge_id in self._key_chunks(self.parallel_chunk):
+			data = dict( (key, self.data[key]) for key in keys )
+			attributes = None
+			if len(self.edge_attributes) :
+				attributes = self.edge_attributes.slice(edge_id, edge_id + sum( len(data[key][0]) for key in keys ))
+			yield method, keys, data, edge_id, attributes
+			
+	def _key_chunks(self, size, keys = None):
+		"""Split the keys (all the nodes by default) in contiguous chunks of at least size edges, yield (keys, id of the first edge) pairs."""
+		
+		if isinstance(self.data, CompactData) :
+			offsets = self.data.offsets
+			degree = lambda key : offsets[self.index[key] + 1] - offsets[self.index[key]]
+		else :
+			degree = lambda key : len(self.data[key][0])
+			
+		chunk = []
+		count = 0
+		edge_id = 0
+		
+		for key in (self.keys if keys is None else keys) :
+			chunk.append(key)
+			count += degree(key)
+			if count >= size :
+				yield chunk, edge_id
+				edge_id += count
+				chunk = []
+				count = 0
+				
+		if chunk :
+			yield chunk, edge_id
+			
+	def _block_lines(self, keys, template, base = 0, weighted = False, edge_id = None):
+		"""Numeric Edge Lines
+		
+		Format the edges of keys as rows of numbers, block_size edges at a time with a single % operation on the
+		repeated row template instead of one str.format call per edge. The fields of a row are the edge id when edge_id
+		is given, the source and target ids plus base and the weight when weighted.
+		
+			>>> ''.join(G._block_lines(G.keys, '%s %s %s\\n', base = 1, weighted = True))
+		
+		Args :
+			keys (list) : source nodes of the edges.
+			template (str) : % template of one row.
+			
+		Kwargs :
+			base (int, default 0) : first node id, 1 for pajek.
+			weighted (bool, default False) : add the edge weight after the ids.
+			edge_id (int, default None) : id of the first edge, no edge ids by default.
+			
+		Returns :
+			generator of str blocks
+			
+		"""
+		
+		# an export_many() chunk is formatted as one block from its shared id columns
+		chunks = [ (keys, 0) ] if keys.__class__ is _Chunk else self._key_chunks(self.block_size, keys)
+		for chunk, first in chunks:
+			columns = self._id_columns(chunk, base, weighted)
+			if edge_id is not None :
+				columns.insert(0, range(edge_id + first, edge_id + first + len(columns[0])))
+				
+			width = len(columns)
+			rows = [ None ] * (width * len(columns[0]))
+			for i, column in enumerate(columns) :
+				rows[i::width] = column
+				
+			yield (template * len(columns[0])) % tuple(rows)
+			
+	def _id_columns(self, keys, base = 0, weighted = False):
+		"""Source ids, target ids and optionally weights columns of the edges of keys, as lists.
+		
+		Compact graphs whose keys are consecutive node ids slice the CSR arrays, with NumPy when it is installed,
+		other graphs look the ids up edge by edge. The columns of an export_many() chunk are built once and shared.
+		
+		"""
+		
+		if keys.__class__ is _Chunk :
+			return list(keys.shared(('ids', base, weighted), lambda : self._id_columns(list(keys), base, weighted)))
+			
+		index = self.index
+		first = index[keys[0]]
+		
+		if isinstance(self.data, CompactData) and index[keys[-1]] == first + len(keys) - 1 :
+			data = self.data
+			start, end = data.offsets[first], data.offsets[first + len(keys)]
+			
+			if numpy is not None :
+				offsets = _numpy_array(data.offsets)[first : first + len(keys) + 1]
+				columns = [ (numpy.repeat(numpy.arange(first, first + len(keys)), numpy.diff(offsets)) + base).tolist(),
+				            (_numpy_array(data.targets)[start:end] + base).tolist() ]
+			else :
+				sources = []
+				for i in xrange(first, first + len(keys)) :
+					sources.extend([ i + base ] * (data.offsets[i + 1] - data.offsets[i]))
+				targets = list(data.targets[start:end])
+				columns = [ sources, [ target + base for target in targets ] if base else targets ]
+				
+			if weighted :
+				columns.append(list(data.weights[start:end]))
+			return columns
+			
+		sources = []
+		targets = []
+		weights = []
+		
+		for key in keys :
+			adjacency = self.data[key]
+			nodes, key_weights = adjacency[0], adjacency[1]
+			sources.extend([ index[key] + base ] * len(nodes))
+			if base :
+				targets.extend([ index[node] + base for node in nodes ])
+			else :
+				targets.extend(map(index.__getitem__, nodes))
+			if weighted :
+				weights.extend(key_weights)
+				
+		return [ sources, targets, weights ] if weighted else [ sources, targets ]
+		
+	def _sparse_matrix(self, weighted = False):
+		"""Sparse Adjacency Matrix
+		
+		Build the adjacency matrix of the graph in CSR form, row i holds the cells columns[offsets[i]:offsets[i+1]]
+		with the matching values. Undirected graphs store both (i,j) and (j,i) so every row is complete. Memory is O(V+E).
+		
+		Kwargs :
+			weighted (bool, default False) : fill values with the edges weights, otherwise values is None.
+			
+		Returns :
+			(offsets, columns, values) : array('l') of V+1 row offsets, array('l') of column ids and array('d') of weights.
+			
+		"""
+		
+		symmetric = self.graph_type == 'undirect'
+		
+		if isinstance(self.data, CompactData) and not symmetric :
+			return self.data.offsets, self.data.targets, self.data.weights if weighted else None
+			
+		offsets = array('l', [0]) * (len(self.keys) + 1)
+		
+		for key in self.keys :
+			nodes = self.data[key][0]
+			offsets[self.index[key] + 1] += len(nodes)
+			if symmetric :
+				for node in nodes:
+					offsets[self.index[node] + 1] += 1
+					
+		for i in xrange(len(self.keys)):
+			offsets[i + 1] += offsets[i]
+			
+		columns = array('l', [0]) * offsets[-1]
+		values = array('d', [0.0]) * offsets[-1] if weighted else None
+		cursor = array('l', offsets)
+		
+		for key, node, weight in self.edges():
+			source = self.index[key]
+			target = self.index[node]
+			columns[cursor[source]] = target
+			if weighted :
+				values[cursor[source]] = weight
+			cursor[source] += 1
+			if symmetric :
+				columns[cursor[target]] = source
+				if weighted :
+					values[cursor[target]] = weight
+				cursor[target] += 1
+					
+		return offsets, columns, values
+		
+	def _dense_rows(self, zero, one, matrix = None):
+		"""Dense Matrix Rows
+		
+		Yield the rows of the adjacency matrix, in the order of keys, as lists of formatted cells built on the fly from
+		_sparse_matrix(). Only one row is alive at a time and it is reused, so consume each row before asking for the next.
+		
+		Args :
+			zero (str) : cell text of missing edges.
+			one (str) : cell text of edges, or a format string such as '{0:.1f}' applied to the edge weight when it contains '{'.
+			
+		Kwargs :
+			matrix (tuple, default None) : _sparse_matrix() of the graph, weighted when one is a format string, built by
+			                               default.
+			
+		Returns :
+			generator of list of str
+			
+		"""
+		
+		weighted = '{' in one
+		offsets, columns, values = self._sparse_matrix(weighted) if matrix is None else matrix
+		row = [ zero ] * len(self.keys)
+		
+		for i in xrange(len(self.keys)):
+			cells = xrange(offsets[i], offsets[i + 1])
+			for cell in cells:
+				row[columns[cell]] = one.format(values[cell]) if weighted else one
+			yield row
+			for cell in cells:
+				row[columns[cell]] = zero
+				
+	def CVS(self, graph_format = 'adjacency-list', workers = 1, path = None, progress = None, cancel = None):
 	
 		"""CSV Format
 		
@@ -115,6 +1608,11 @@ class Gephi(object):
 		Args:
 			None
 		kwargs:
+			path (str, default None) : write the format into this file instead of returning it, compressed by its extension (.gz, .bz2, .xz, .zst).
+			progress (callable, default None) : called as progress(edges done, total edges) every progress_chunk edges,
+			                                   and before every row of the other formats.
+			cancel (CancelToken, default None) : stop the export with ExportCancelled once cancelled, see gephi.progress.
+			  workers (int, default 1) : number of processes formatting the edge-list format.
 			  graph_format (str),  specifiy te format of graph to generate the default format is adjacency-list.
 			. edge-list, the CSV example below represents a graph with two edges: "a" -> "b" and "b" -> "c".
 				
@@ -160,126 +1658,69 @@ class Gephi(object):
 		
 		Returns :
 			A string CSV selected format based on gtype.
+			size (int) : number of characters written, when path is given.
 			
 		Raises:
 			ValueError : raise exception when graph_format is not supportted by the methon.
 		
 		"""
 		
-		csv_str=''
-		
-		
-		
+		return self._render('csv', graph_format, workers = workers, path = path, progress = progress, cancel = cancel)
+	
+	def _csv_lines(self, graph_format = 'adjacency-list', workers = 1):
+		"""Yield the lines of CVS()."""
+	
 		if graph_format == 'edge-list' :
-		
-			for key in self.keys :
-				nodes = self.data[key][0]
-				for node in nodes:
-					csv_str += key + ';' + node + '\n'
-		
+	
+			yield _EdgeSection('_csv_edge_lines', workers)
+	
 		elif graph_format == 'adjacency-list' :
-
-			for key in self.keys :
-				buffer=''
-				nodes = self.data[key][0]
-				for node in nodes:
-					buffer += ';' + node
-					
-				csv_str += key + buffer + '\n'
-				
+	
+			yield _Section('edges', len(self.keys))
+			for key, nodes in self._escaped_adjacency('csv') :
+				yield ';'.join([key] + nodes) + '\n'
+	
 		elif graph_format == 'mixed' :
 	
-			for key in self.keys :
-				buffer=''
-				nodes = self.data[key][0]
-				for node in nodes:
-					buffer += ',' + node
-				csv_str += key + buffer + '\n'
-				
+			yield _Section('edges', len(self.keys))
+			for key, nodes in self._escaped_adjacency('csv') :
+				yield ','.join([key] + nodes) + '\n'
+	
 		elif graph_format == 'matrix' :
-			
-			matrix=[list() for _ in self.keys]
-			for i in xrange(len(self.keys)):
-				matrix[i]=[0 for _ in self.keys]
-				
-			csv_str = ';'+";".join([str(key) for key in self.keys])+'\n'
-			
-			if self.graph_type == 'undirect' :
-			
-				for key in self.keys :
-
-					nodes = self.data[key][0]
-					for node in nodes:
-						matrix[self.keys.index(key)][self.keys.index(node)] = 1
-						matrix[self.keys.index(node)][self.keys.index(key)] = 1
-
-						buffer=''	
-						for cell in matrix[self.keys.index(key)]:
-							buffer += ";{}".format(cell)
-
-					csv_str += key + buffer + '\n'
-					
-			else :
-			
-				for key in self.keys :
-
-					nodes = self.data[key][0]
-					for node in nodes:
-						matrix[self.keys.index(key)][self.keys.index(node)] = 1
-
-					buffer=''	
-					for cell in matrix[self.keys.index(key)]:
-						buffer += ";{}".format(cell)
-
-					csv_str += key + buffer + '\n'
-				
+	
+			keys = self._escaped_keys('csv')
+			yield ';'
+			yield _Section('nodes')
+			yield ";".join([str(key) for key in keys]) + '\n'
+	
+			yield _Section('matrix')
+			matrix = self._sparse_matrix(weighted = False)
+			yield _Section('edges', len(self.keys))
+			for i, row in enumerate(self._dense_rows('0', '1', matrix)):
+				yield keys[i] + ';' + ';'.join(row) + '\n'
+	
 		elif graph_format == 'edge-weight' :
-			
-			matrix=[list() for _ in self.keys]
-			for i in xrange(len(self.keys)):
-				matrix[i]=[0 for _ in self.keys]
-			
-			csv_str = ';'+";".join([str(key) for key in self.keys])+'\n'
-			
-			if self.graph_type == 'undirect' :
-			
-				for key in self.keys :
-
-					nodes = self.data[key][0]
-					weights = self.data[key][1]
-					
-					for node in nodes:
-						matrix[self.keys.index(key)][self.keys.index(node)] = weights[nodes.index(node)]
-						matrix[self.keys.index(node)][self.keys.index(key)] = weights[nodes.index(node)]
-
-						buffer=''	
-						for cell in matrix[self.keys.index(key)]:
-							buffer += ";{0:.1f}".format(cell)
-
-					csv_str += key + buffer + '\n'
-					
-			else :
-			
-				for key in self.keys :
-
-					nodes = self.data[key][0]
-					weights = self.data[key][1]
-					
-					for node in nodes:
-						matrix[self.keys.index(key)][self.keys.index(node)] = weights[nodes.index(node)]
-
-					buffer=''	
-					for cell in matrix[self.keys.index(key)]:
-						buffer += ";{0:.1f}".format(cell)
-
-					csv_str += key + buffer + '\n'
-					
+	
+			keys = self._escaped_keys('csv')
+			yield ';'
+			yield _Section('nodes')
+			yield ";".join([str(key) for key in keys]) + '\n'
+	
+			yield _Section('matrix')
+			matrix = self._sparse_matrix(weighted = True)
+			yield _Section('edges', len(self.keys))
+			for i, row in enumerate(self._dense_rows('0.0', "{0:.1f}", matrix)):
+				yield keys[i] + ';' + ';'.join(row) + '\n'
+	
 		else :
 			raise ValueError('Unsupported CSV graph type : ' + graph_format)
-			
-		return csv_str[:-1]
-		
-	def adjacency_list(self):
+	
+	def _csv_edge_lines(self, keys, edge_id = 0):
+	
+		for key, node, weight in self._escaped_rows(keys, 'csv'):
+			yield key + ';' + node + '\n'
+	
+	def adjacency_list(self, path = None, progress = None, cancel = None):
 		"""Adjacency list 
 		
 		Adjacency list format is useful for graphs without data associated with nodes or edges 
@@ -296,28 +1737,29 @@ class Gephi(object):
 			none
 		
 		kwargs:
-			none
+			path (str, default None) : write the format into this file instead of returning it, compressed by its extension (.gz, .bz2, .xz, .zst).
+			progress (callable, default None) : called as progress(edges done, total edges) before every node row.
+			cancel (CancelToken, default None) : stop the export with ExportCancelled once cancelled, see gephi.progress.
 			
 		Returns:
 			r_str (str): adjacency list in string format
+			size (int) : number of characters written, when path is given.
 			
 		Raises:
 			none
 		
 		"""
 		
-		r_str = ''
-		
+		return self._render('adjacency-list', path = path, progress = progress, cancel = cancel)
+	
+	def _adjacency_list_lines(self):
+		"""Yield the lines of adjacency_list()."""
+	
+		yield _Section('edges', len(self.keys))
 		for key in self.keys :
-			buffer=''
-			nodes = self.data[key][0]
-			for node in nodes:
-				buffer += ' ' + node
-			r_str += key + buffer + '\n'
-			
-		return r_str[:-1]
-		
-	def multiline_adjacency_list(self):		
+			yield ' '.join([key] + self.data[key][0]) + '\n'
+	
+	def multiline_adjacency_list(self, path = None, progress = None, cancel = None):		
 		"""Multiline Adjacency List
 		
 		The multi-line adjacency list format is useful for graphs with nodes that can be meaningfully represented as strings. 
@@ -336,30 +1778,31 @@ class Gephi(object):
 			none
 		
 		kwargs:
-			none
+			path (str, default None) : write the format into this file instead of returning it, compressed by its extension (.gz, .bz2, .xz, .zst).
+			progress (callable, default None) : called as progress(edges done, total edges) before every node row.
+			cancel (CancelToken, default None) : stop the export with ExportCancelled once cancelled, see gephi.progress.
 			
 		Returns:
 			r_str (str): multiline adjacency list in string format
+			size (int) : number of characters written, when path is given.
 			
 		Raises:
 			none
 		
 		"""
 		
-		r_str = ''
-		
+		return self._render('multiline-adjacency-list', path = path, progress = progress, cancel = cancel)
+	
+	def _multiline_adjacency_list_lines(self):
+		"""Yield the lines of multiline_adjacency_list()."""
+	
+		yield _Section('edges', len(self.keys))
 		for key in self.keys :
-		
+	
 			nodes = self.data[key][0]
-			buffer = "{} {}\n".format( key , len(nodes) )
-			
-			for node in nodes:
-				buffer += node + '\n'
-			r_str += buffer
-			
-		return r_str[:-1]
-		
-	def pajek_net(self, scheme , labels = True):
+			yield "{} {}\n".format( key , len(nodes) ) + ''.join([ node + '\n' for node in nodes ])
+	
+	def pajek_net(self, scheme , labels = True, path = None, progress = None, cancel = None):
 		"""Pajek NET Format
 		
 		This format use NET extension and is easy to use. Attributes support is however missing, 
@@ -417,62 +1860,65 @@ class Gephi(object):
 			scheme (str) : specifiy the format of output edges, weight, edges-list
 		
 		kwargs:
+			path (str, default None) : write the format into this file instead of returning it, compressed by its extension (.gz, .bz2, .xz, .zst).
+			progress (callable, default None) : called as progress(edges done, total edges) every progress_chunk edges.
+			cancel (CancelToken, default None) : stop the export with ExportCancelled once cancelled, see gephi.progress.
 			labels (bool) : enable nodes labels
 			
 		Returns:
 			r_str (str): Pajek NET in string format
+			size (int) : number of characters written, when path is given.
 			
 		Raises:
 			Exception unsupported scheme format
  
 		"""
 		
-		r_str = '*Vertices ' + str(len(self.keys)) + '\n'
-		
+		return self._render('pajek', scheme, labels = labels, path = path, progress = progress, cancel = cancel)
+	
+	def _pajek_net_lines(self, scheme , labels = True, vertices_width = 0):
+		"""Yield the lines of pajek_net(), the *Vertices line is padded with spaces to vertices_width characters."""
+	
+		if scheme not in ('edges', 'weight', 'edges-list') :
+			raise Exception('Unspprted Scheme ' + scheme)
+	
+		yield ('*Vertices ' + str(len(self.keys))).ljust(vertices_width) + '\n'
+	
 		if labels :
-			for key in enumerate(self.keys):
-				r_str += '{} "{}"\n'.format( key[0] + 1 , key[1])
-			
+			yield _Section('nodes')
+			for key in enumerate(self._escaped_keys('pajek')):
+				yield '{} "{}"\n'.format( key[0] + 1 , key[1])
+	
 		if scheme == 'edges' :
-		
-			r_str += '*arcs' + '\n'
-			
-			for key in self.keys :
-				buffer=''
-				nodes = self.data[key][0]
-				for node in nodes:
-					buffer += "{} {}\n".format( self.keys.index(key) + 1 , self.keys.index(node) + 1 )
-				r_str += buffer
-		
+	
+			yield '*arcs' + '\n'
+			yield _EdgeSection('_pajek_arc_lines')
+	
 		elif scheme == 'weight' :
-		
-			r_str += '*arcs' + '\n'
-			
-			for key in self.keys :
-				buffer=''
-				nodes = self.data[key][0]
-				weights = self.data[key][1]
-				for node in nodes:
-					buffer += "{} {} {}\n".format( self.keys.index(key) + 1 , self.keys.index(node) + 1 , weights[nodes.index(node)])
-				r_str += buffer
-				
-		elif  scheme == 'edges-list' :
-		
-			r_str += '*edgeslist' + '\n'
-			
-			for key in self.keys :
-				buffer=''
-				nodes = self.data[key][0]
-				for node in nodes:
-					buffer += " {}".format(self.keys.index(node)+1)
-				r_str += "{}{}\n".format( self.keys.index(key) + 1 , buffer )
-				
-		else:
-			raise Exception('Unspprted Scheme ' + scheme)
-			
-		return r_str[:-1]
-		
-	def GDF_format(self,colors = []):
+	
+			yield '*arcs' + '\n'
+			yield _EdgeSection('_pajek_weight_arc_lines')
+	
+		else :
+	
+			yield '*edgeslist' + '\n'
+			yield _EdgeSection('_pajek_edges_list_lines')
+	
+	def _pajek_arc_lines(self, keys, edge_id = 0):
+	
+		return self._block_lines(keys, '%s %s\n', base = 1)
+	
+	def _pajek_weight_arc_lines(self, keys, edge_id = 0):
+	
+		return self._block_lines(keys, '%s %s %s\n', base = 1, weighted = True)
+	
+	def _pajek_edges_list_lines(self, keys, edge_id = 0):
+	
+		for key in keys :
+			nodes = self.data[key][0]
+			yield "{}{}\n".format( self.index[key] + 1 , ''.join([ " {}".format(self.index[node] + 1) for node in nodes ]) )
+	
+	def GDF_format(self,colors = [], workers = 1, path = None, progress = None, cancel = None):
 		"""GDF Format
 		
 		GDF is the file format used by GUESS. It is built like a database table or a coma separated file (CSV). 
@@ -571,39 +2017,73 @@ class Gephi(object):
 		Args:
 			scheme (str) : specifiy the format of output edges, weight, edges-list
 		
+		Node attributes named class, visible, labelvisible, width or color give the values of these columns, the other node
+		and edge attributes are written as extra columns, see set_node_attribute() and set_edge_attribute().
+		
 		kwargs:
+			path (str, default None) : write the format into this file instead of returning it, compressed by its extension (.gz, .bz2, .xz, .zst).
+			progress (callable, default None) : called as progress(edges done, total edges) every progress_chunk edges.
+			cancel (CancelToken, default None) : stop the export with ExportCancelled once cancelled, see gephi.progress.
 			colors (list) : colors list in RGB format ['127,123,20', .... , '0,0,0']
+			workers (int, default 1) : number of processes formatting the edges.
 			
 		Returns:
 			r_str (str): GDF Format in string format
+			size (int) : number of characters written, when path is given.
 			
 		Raises:
 			none
 		
 		"""
 		
+		return self._render('gdf', colors = colors, workers = workers, path = path, progress = progress, cancel = cancel)
+	
+	def _gdf_lines(self, colors = [], workers = 1):
+		"""Yield the lines of GDF_format()."""
+	
 		if colors == []:
 			colors = [ '0,0,0' for _ in self.keys ]
-			
-		r_str = 'nodedef>name VARCHAR,label VARCHAR,class VARCHAR, visible BOOLEAN,labelvisible BOOLEAN,width DOUBLE,color VARCHAR' + '\n'
-		
-		for key in enumerate(self.keys):
-			r_str += "{0},{0},{0},true,true,{1},'{2}'\n".format( key[1] , len(self.data[key[1]]) , colors[key[0]] )
-			
-		r_str += 'edgedef>node1 VARCHAR,node2 VARCHAR,weight DOUBLE' + '\n'		
-		
-		for key in self.keys :
-			buffer=''
-			nodes = self.data[key][0]
-			weights = self.data[key][1]
-			for node in nodes:
-				buffer += "{},{},{}\n".format( key , node , weights[nodes.index(node)] )
-				
-			r_str += buffer		
-		
-		return r_str[:-1]
-		
-	def GEXF(self):
+	
+		table = self.node_attributes
+		builtin, extra = _attribute_columns(table, ['class', 'visible', 'labelvisible', 'width', 'color'])
+	
+		yield 'nodedef>name VARCHAR,label VARCHAR,class VARCHAR, visible BOOLEAN,labelvisible BOOLEAN,width DOUBLE,color VARCHAR' + \
+			''.join([ ',' + table.names[i] + ' ' + _gdf_types[table.types[table.names[i]]] for i in extra ]) + '\n'
+	
+		yield _Section('nodes')
+	
+		# width is the size of the (nodes, weights) pair, as GDF_format() has always written it
+		if not len(table) :
+			for key in enumerate(self._escaped_keys('gdf')):
+				yield "{0},{0},{0},true,true,{1},'{2}'\n".format( key[1] , 2 , colors[key[0]] )
+		else :
+			texts = _attribute_texts(table, _gdf_quote)
+			for i, (key, row) in enumerate(izip(self._escaped_keys('gdf'), table.rows())):
+				values = texts(row)
+				columns = [ key, 'true', 'true', '2', "'" + colors[i] + "'" ]
+				for column, position in builtin :
+					columns[column] = values[position]
+				yield key + ',' + key + ',' + ','.join(columns + [ values[position] for position in extra ]) + '\n'
+	
+		yield 'edgedef>node1 VARCHAR,node2 VARCHAR,weight DOUBLE' + \
+			''.join([ ',' + name + ' ' + _gdf_types[self.edge_attributes.types[name]] for name in self.edge_attributes ]) + '\n'
+	
+		yield _EdgeSection('_gdf_edge_lines', workers)
+	
+	def _gdf_edge_lines(self, keys, edge_id = 0):
+	
+		edges = self._escaped_rows(keys, 'gdf')
+	
+		if not len(self.edge_attributes) :
+			for key, node, weight in edges:
+				yield "{},{},{}\n".format( key , node , weight )
+			return
+	
+		texts = _attribute_texts(self.edge_attributes, _gdf_quote)
+		for (key, node, weight), row in izip(edges, self.edge_attributes.rows(edge_id)):
+			yield "{},{},{},".format( key , node , weight ) + ','.join(texts(row)) + '\n'
+	
+	def GEXF(self, workers = 1, mode = 'static', timeformat = 'double', path = None, progress = None, cancel = None):
 		"""Graph Exchange XML Format
 		
 		GEXF (Graph Exchange XML Format) is a language for describing complex networks structures, their associated 
@@ -650,6 +2130,19 @@ class Gephi(object):
 		    </graph>
 		</gexf>
 		
+		Dynamic graphs
+		
+		With mode 'dynamic' every edge with a time span, see add_edge(start, end), gets start / end attributes, and every
+		node spans from the earliest start to the latest end of its edges. The node spans are gathered in one pass over
+		the edges, the document is then streamed like a static one : no snapshot of the graph is ever built.
+		
+			<graph mode="dynamic" defaultedgetype="directed" timeformat="double">
+			    <node id="a" label="a" start="1" end="5" />
+			    <edge id="0" source="a" target="b" start="1" end="5" />
+		
+		The node and edge attributes are declared in <attributes> sections and written as <attvalues> of every node and
+		edge, see set_node_attribute() and set_edge_attribute().
+		
 		Notes:
 			This implementation does not support mixed graphs (directed and undirected edges together).
 		
@@ -657,46 +2150,136 @@ class Gephi(object):
 			None
 		
 		kwargs:
-			None
+			path (str, default None) : write the format into this file instead of returning it, compressed by its extension (.gz, .bz2, .xz, .zst).
+			progress (callable, default None) : called as progress(edges done, total edges) every progress_chunk edges.
+			cancel (CancelToken, default None) : stop the export with ExportCancelled once cancelled, see gephi.progress.
+			workers (int, default 1) : number of processes formatting the edges.
+			mode (str, default 'static') : 'static' or 'dynamic', dynamic graphs write the edges time spans.
+			timeformat (str, default 'double') : GEXF timeformat of the spans, 'double', 'date' or 'dateTime'.
 			
 		Returns:
 			r_str (str): GEXF Format in string format
+			size (int) : number of characters written, when path is given.
 			
 		Raises:
-			none
+			ValueError : raise exception when mode is not static nor dynamic.
 		
 		"""	
 		
-		r_str = '<?xml version="1.0" encoding="UTF-8"?>' + '\n'
-		r_str += '<gexf xmlns="http://www.gexf.net/1.2draft" version="1.2">' + '\n'
-		r_str += '<meta lastmodifieddate="2009-03-20">' + '\n'
-		r_str += '<creator>Gexf.net</creator>' + '\n'
-		r_str += '<description>A hello world! file</description>' + '\n'
-		r_str += '</meta>' + '\n'
-		r_str += '<graph mode="static" defaultedgetype="' + self.graph_type + '">' + '\n'
-		r_str += '<nodes>' + '\n'
-		
-		for key in self.keys:	 
-			 r_str += '<node id="'+ key +'" label="'+ key +'" />' + '\n'
-			    
-		r_str += '</nodes>' + '\n'
-		r_str += '<edges>' + '\n'
+		return self._render('gexf', workers = workers, mode = mode, timeformat = timeformat, path = path, progress = progress, cancel = cancel)
+	
+	def _gexf_lines(self, workers = 1, mode = 'static', timeformat = 'double'):
+		"""Yield the lines of GEXF()."""
+	
+		if mode not in ('static', 'dynamic') :
+			raise ValueError('Unsupported GEXF mode : ' + mode)
+	
+		yield '<?xml version="1.0" encoding="UTF-8"?>' + '\n'
+		yield '<gexf xmlns="http://www.gexf.net/1.2draft" version="1.2">' + '\n'
+		yield '<meta lastmodifieddate="2009-03-20">' + '\n'
+		yield '<creator>Gexf.net</creator>' + '\n'
+		yield '<description>A hello world! file</description>' + '\n'
+		yield '</meta>' + '\n'
+		if mode == 'static' :
+			yield '<graph mode="static" defaultedgetype="' + self.graph_type + '">' + '\n'
+			spans = dict()
+		else :
+			yield '<graph mode="dynamic" defaultedgetype="' + self.graph_type + '" timeformat="' + timeformat + '">' + '\n'
+			spans = self._node_spans()
+	
+		for kind, table in (('node', self.node_attributes), ('edge', self.edge_attributes)):
+			if len(table) :
+				yield '<attributes class="' + kind + '">' + '\n'
+				for i, name in enumerate(table.names):
+					yield '<attribute id="' + str(i) + '" title="' + _xml_quote(name) + '" type="' + _gexf_types[table.types[name]] + '" />' + '\n'
+				yield '</attributes>' + '\n'
+	
+		yield '<nodes>' + '\n'
+		yield _Section('nodes')
+	
+		if not len(self.node_attributes) :
+			for key, token in izip(self.keys, self._escaped_keys('xml')):
+				yield '<node id="'+ token +'" label="'+ token +'"' + _span_attributes(spans.get(key)) + ' />' + '\n'
+		else :
+			texts = _attribute_texts(self.node_attributes, _xml_quote)
+			for key, token, row in izip(self.keys, self._escaped_keys('xml'), self.node_attributes.rows()):
+				yield '<node id="'+ token +'" label="'+ token +'"' + _span_attributes(spans.get(key)) + '>' + '\n' + _gexf_attvalues(texts(row)) + '</node>' + '\n'
+	
+		yield '</nodes>' + '\n'
+		yield '<edges>' + '\n'
+	
+		yield _EdgeSection('_gexf_edge_lines' if mode == 'static' else '_gexf_dynamic_edge_lines', workers)
+	
+		yield '</edges>' + '\n'
+		yield '</graph>' + '\n'
+		yield '</gexf>' + '\n'
+	
+	def _gexf_edge_lines(self, keys, edge_id = 0):
+	
+		if len(self.edge_attributes) :
+			for line in self._gexf_attribute_edge_lines(keys, edge_id, False):
+				yield line
+			return
+	
+		for key, node, weight in self._escaped_rows(keys, 'xml'):
+			yield '<edge id="'+ str(edge_id) +'" source="'+ key +'" target="'+ node +'" />' + '\n'
+			edge_id += 1
+	
+	def _gexf_dynamic_edge_lines(self, keys, edge_id = 0):
+	
+		if len(self.edge_attributes) :
+			for line in self._gexf_attribute_edge_lines(keys, edge_id, True):
+				yield line
+			return
+	
+		for key, node, weight, span in self._escaped_rows(keys, 'xml', spanned = True):
+			yield '<edge id="'+ str(edge_id) +'" source="'+ key +'" target="'+ node +'"' + _span_attributes(span) + ' />' + '\n'
+			edge_id += 1
+	
+	def _gexf_attribute_edge_lines(self, keys, edge_id, dynamic):
+		"""GEXF edges with the <attvalues> of the edge attributes, and their time spans when dynamic."""
+	
+		texts = _attribute_texts(self.edge_attributes, _xml_quote)
+		for (key, node, weight, span), row in izip(self._escaped_rows(keys, 'xml', spanned = True), self.edge_attributes.rows(edge_id)):
+			yield '<edge id="'+ str(edge_id) +'" source="'+ key +'" target="'+ node +'"' + (_span_attributes(span) if dynamic else '') + '>' + '\n' + \
+				_gexf_attvalues(texts(row)) + '</edge>' + '\n'
+			edge_id += 1
+	
+	def _spanned_edges(self, keys = None):
+		"""Iterate over the edges as (source, target, weight, span) tuples, span is None for edges without time span."""
+		
+		if isinstance(self.data, CompactData) :
+			for key, node, weight in self.edges(keys):
+				yield key, node, weight, None
+			return
+			
+		for key in (self.keys if keys is None else keys) :
+			adjacency = self.data[key]
+			spans = adjacency[2] if len(adjacency) > 2 else repeat(None)
+			for node, weight, span in izip(adjacency[0], adjacency[1], spans):
+				yield key, node, weight, span
+				
+	def _node_spans(self):
+		"""Map of node name to the (start, end) span covering its edges, None bounds when an edge is unbounded.
+		
+		Nodes without edges are not in the map and exist at all times, like the ends of edges without span.
 		
-		edge_id = 0
-		for key in self.keys :
-			nodes = self.data[key][0]
-			weights = self.data[key][1]
-			for node in nodes:
-			    r_str += '<edge id="'+ str(edge_id) +'" source="'+ key +'" target="'+ node +'" />' + '\n'
-			    edge_id += 1
-			    
-		r_str += '</edges>' + '\n'
-		r_str += '</graph>' + '\n'
-		r_str += '</gexf>' + '\n'
-		
-		return r_str[:-1]
-		
-	def GML(self):
+		"""
+		
+		spans = dict()
+		for key, node, weight, span in self._spanned_edges():
+			start, end = span if span is not None else (None, None)
+			for name in (key, node) :
+				current = spans.get(name)
+				if current is None :
+					spans[name] = (start, end)
+				else :
+					spans[name] = ( None if start is None or current[0] is None else min(start, current[0]),
+					                None if end is None or current[1] is None else max(end, current[1]) )
+					
+		return spans
+		
+	def GML(self, workers = 1, path = None, progress = None, cancel = None):
 		"""GML Format
 		
 		GML (Graph Modeling Language) is a text file format supporting network data with a very easy syntax. It is 
@@ -778,91 +2361,154 @@ class Gephi(object):
 			None
 		
 		kwargs:
-			None
+			path (str, default None) : write the format into this file instead of returning it, compressed by its extension (.gz, .bz2, .xz, .zst).
+			progress (callable, default None) : called as progress(edges done, total edges) every progress_chunk edges.
+			cancel (CancelToken, default None) : stop the export with ExportCancelled once cancelled, see gephi.progress.
+			workers (int, default 1) : number of processes formatting the edges.
 			
 		Returns:
 			r_str (str): GML Format in string format
+			size (int) : number of characters written, when path is given.
 			
 		Raises:
 			none
 		
 		"""
 		
-		r_str = 'graph' + '\n'
-		r_str += '[' + '\n'
-		
-		for key in self.keys:
-			r_str += 'node' + '\n'
-			r_str += '[' + '\n'
-			r_str += 'id '+ key + '\n'
-			r_str += 'label "Node ' + key + '"' + '\n'
-			r_str += ']' + '\n'
-			
-		for key in self.keys:
-			nodes = self.data[key][0]
-			weights = self.data[key][1]
-			for node in nodes:
-				r_str += 'edge' + '\n'
-				r_str += '[' + '\n'
-				r_str += 'source ' + key + '\n'
-				r_str += 'target ' + node + '\n'
-				r_str += 'label "Edge ' + node + ' to ' + key + ' : ' + str(weights[nodes.index(node)]) + '"' + '\n'
-				r_str += ']' + '\n'		
-		
-		r_str += ']' + '\n'
-		
-			
-		return r_str[:-1]
-		
-	def graph_ML(self , weights = None , colors = []):
+		return self._render('gml', workers = workers, path = path, progress = progress, cancel = cancel)
 	
-		r_str = '<?xml version="1.0" encoding="UTF-8"?>' + '\n'
-		r_str += '<graphml xmlns="http://graphml.graphdrawing.org/xmlns" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
-		r_str += 'xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">' + '\n'
-		
-		r_str += '<key id="d0" for="node" attr.name="color" attr.type="string">' + '\n'
-		r_str += '<default>yellow</default>' + '\n'
-		r_str += '</key>' + '\n'
-		
-		r_str += '<key id="d1" for="edge" attr.name="weight" attr.type="double"/>' + '\n'
-		
-		r_str += '<graph id="G" edgedefault="' + self.graph_type + '">' + '\n'
-		
-		if colors:
-			for key in self.keys:
-				r_str += '<node id="' + key + '">' + '\n'
-				r_str += '<data key="d0">' + colors[self.keys.index(key)] + '</data>' + '\n'
-				r_str += '</node>' + '\n'
+	def _gml_lines(self, workers = 1):
+		"""Yield the lines of GML()."""
+	
+		yield 'graph' + '\n'
+		yield '[' + '\n'
+		yield _Section('nodes')
+	
+		for key, text in izip(self._escaped_keys('gml'), self._escaped_keys('xml')):
+			yield 'node' + '\n' + '[' + '\n' + 'id '+ key + '\n' + 'label "Node ' + text + '"' + '\n' + ']' + '\n'
+	
+		yield _EdgeSection('_gml_edge_lines', workers)
+	
+		yield ']' + '\n'
+	
+	def _gml_edge_lines(self, keys, edge_id = 0):
+	
+		tokens, texts = self._tokens('gml'), self._tokens('xml')
+		if tokens is None and texts is None :
+			for key, node, weight in self.edges(keys):
+				yield 'edge' + '\n' + '[' + '\n' + 'source ' + key + '\n' + 'target ' + node + '\n' + \
+					'label "Edge ' + node + ' to ' + key + ' : ' + str(weight) + '"' + '\n' + ']' + '\n'
+			return
+	
+		tokens, texts = tokens or _Names(), texts or _Names()
+		for key, node, weight in self.edges(keys):
+			yield 'edge' + '\n' + '[' + '\n' + 'source ' + tokens[key] + '\n' + 'target ' + tokens[node] + '\n' + \
+				'label "Edge ' + texts[node] + ' to ' + texts[key] + ' : ' + str(weight) + '"' + '\n' + ']' + '\n'
+	
+	def graph_ML(self , weights = None , colors = [], path = None, progress = None, cancel = None):
+		"""GraphML Format
+	
+		GraphML is a comprehensive and easy-to-use file format for graphs. It consists of a language core to describe
+		the structural properties of a graph and a flexible extension mechanism to add application-specific data.
+	
+		Args :
+			None
+		Kwargs :
+			path (str, default None) : write the format into this file instead of returning it, compressed by its extension (.gz, .bz2, .xz, .zst).
+			progress (callable, default None) : called as progress(edges done, total edges) every progress_chunk edges.
+			cancel (CancelToken, default None) : stop the export with ExportCancelled once cancelled, see gephi.progress.
+			weights (bool) : write the edges weights as the d1 edge data.
+			colors (list) : nodes colors, one per node in the order of keys.
+			The node and edge attributes are written as the next d2, d3 ... data keys, see set_node_attribute().
+		Returns :
+			r_str (str) : string of graph format
+			size (int) : number of characters written, when path is given.
+		Raises:
+			None
+	
+		"""
+	
+		return self._render('graphml', weights = weights, colors = colors, path = path, progress = progress, cancel = cancel)
+	
+	def _graph_ml_lines(self , weights = None , colors = []):
+		"""Yield the lines of graph_ML()."""
+	
+		yield '<?xml version="1.0" encoding="UTF-8"?>' + '\n'
+		yield '<graphml xmlns="http://graphml.graphdrawing.org/xmlns" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+		yield 'xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">' + '\n'
+	
+		yield '<key id="d0" for="node" attr.name="color" attr.type="string">' + '\n'
+		yield '<default>yellow</default>' + '\n'
+		yield '</key>' + '\n'
+	
+		yield '<key id="d1" for="edge" attr.name="weight" attr.type="double"/>' + '\n'
+	
+		for i, (kind, name, attr_type) in enumerate(self._graph_ml_keys()):
+			yield '<key id="d' + str(i + 2) + '" for="' + kind + '" attr.name="' + _xml_quote(name) + '" attr.type="' + _graph_ml_types[attr_type] + '"/>' + '\n'
+	
+		yield '<graph id="G" edgedefault="' + self.graph_type + '">' + '\n'
+		yield _Section('nodes')
+	
+		if len(self.node_attributes):
+			texts = _attribute_texts(self.node_attributes, _xml_quote)
+			for key, token, row in izip(self.keys, self._escaped_keys('xml'), self.node_attributes.rows()):
+				data = '<data key="d0">' + colors[self.index[key]] + '</data>' + '\n' if colors else ''
+				yield '<node id="' + token + '">' + '\n' + data + _graph_ml_data(texts(row), 2) + '</node>' + '\n'
+		elif colors:
+			for key, token in izip(self.keys, self._escaped_keys('xml')):
+				yield '<node id="' + token + '">' + '\n' + '<data key="d0">' + colors[self.index[key]] + '</data>' + '\n' + '</node>' + '\n'
 		else:
-			for key in self.keys:
-				r_str += '<node id="' + key + '"/>' + '\n'
-		
-		
-		edge_id = 0
-		
+			for key in self._escaped_keys('xml'):
+				yield '<node id="' + key + '"/>' + '\n'
+	
+	
 		if weights:
-			for key in self.keys:
-				nodes = self.data[key][0]
-				weights = self.data[key][1]
-				for node in nodes:		
-					r_str += '<edge id="e' + str(edge_id) + '" source="' + key + '" target="' + node + '">' + '\n'
-					r_str += '<data key="d1">'+ str(weights[nodes.index(node)])+'</data>' + '\n'
-					r_str += '</edge>' + '\n'
-					edge_id += 1
+			yield _EdgeSection('_graph_ml_weight_edge_lines')
 		else:
-			for key in self.keys:
-				nodes = self.data[key][0]
-				for node in nodes:		
-					r_str += '<edge id="e' + str(edge_id) + '" source="' + key + '" target="' + node + '"/>' + '\n'
-					edge_id += 1	
-				
-		
-		r_str += '</graph>' + '\n'
-		r_str += '</graphml>' + '\n'
-		
-		return r_str[:-1]
-		
-	def spread_sheet(self):
+			yield _EdgeSection('_graph_ml_edge_lines')
+	
+		yield '</graph>' + '\n'
+		yield '</graphml>' + '\n'
+	
+	def _graph_ml_keys(self):
+		"""(for, name, type) of the data keys of the node then edge attributes, numbered from d2."""
+	
+		return [ (kind, name, table.types[name]) for kind, table in (('node', self.node_attributes), ('edge', self.edge_attributes)) for name in table ]
+	
+	def _graph_ml_edge_lines(self, keys, edge_id = 0):
+	
+		if len(self.edge_attributes) :
+			for line in self._graph_ml_attribute_edge_lines(keys, edge_id, False):
+				yield line
+			return
+	
+		for key, node, weight in self._escaped_rows(keys, 'xml'):
+			yield '<edge id="e' + str(edge_id) + '" source="' + key + '" target="' + node + '"/>' + '\n'
+			edge_id += 1
+	
+	def _graph_ml_weight_edge_lines(self, keys, edge_id = 0):
+	
+		if len(self.edge_attributes) :
+			for line in self._graph_ml_attribute_edge_lines(keys, edge_id, True):
+				yield line
+			return
+	
+		for key, node, weight in self._escaped_rows(keys, 'xml'):
+			yield '<edge id="e' + str(edge_id) + '" source="' + key + '" target="' + node + '">' + '\n' + \
+				'<data key="d1">'+ str(weight)+'</data>' + '\n' + '</edge>' + '\n'
+			edge_id += 1
+	
+	def _graph_ml_attribute_edge_lines(self, keys, edge_id, weights):
+		"""GraphML edges with the data of the edge attributes, after the d1 weight data when weights."""
+	
+		texts = _attribute_texts(self.edge_attributes, _xml_quote)
+		first = 2 + len(self.node_attributes)
+		for (key, node, weight), row in izip(self._escaped_rows(keys, 'xml'), self.edge_attributes.rows(edge_id)):
+			yield '<edge id="e' + str(edge_id) + '" source="' + key + '" target="' + node + '">' + '\n' + \
+				('<data key="d1">'+ str(weight)+'</data>' + '\n' if weights else '') + _graph_ml_data(texts(row), first) + '</edge>' + '\n'
+			edge_id += 1
+	
+	def spread_sheet(self, workers = 1, path = None, progress = None, cancel = None):
 		"""Spreadsheet (Excel)
 		
 		Nodes tables and edge tables are the file formats used in the Data Laboratory to import data from Excel. 
@@ -918,29 +2564,45 @@ class Gephi(object):
 		Args :
 			None
 		Kwargs :
-			None
+			path (str, default None) : write the format into this file instead of returning it, compressed by its extension (.gz, .bz2, .xz, .zst).
+			progress (callable, default None) : called as progress(edges done, total edges) every progress_chunk edges.
+			cancel (CancelToken, default None) : stop the export with ExportCancelled once cancelled, see gephi.progress.
+			workers (int, default 1) : number of processes formatting the edges.
 		Returns :
 			r_str (str) : string of graph format
-		Raises:
-			None
-		
-		"""
-		
-		r_str = 'Id;Label' + '\n'
-		
-		for key in self.keys:
-			r_str += key + ';' + key + '\n'
-			
-		r_str += 'Source;Target;Label' + '\n'
-		for key in self.keys:
-			nodes = self.data[key][0]
-			weights = self.data[key][1]
-			for node in nodes:
-				r_str += '{0};{1};"{0} to {1} : {2}"'.format(key,node,weights[nodes.index(node)]) + '\n'
+			size (int) : number of characters written, when path is given.
+		Raises:
+			None
 		
-		return r_str[:-1]
+		"""
 		
-	def GraphViz_dot_format(self, graph_format = 'basic'):
+		return self._render('spreadsheet', workers = workers, path = path, progress = progress, cancel = cancel)
+	
+	def _spread_sheet_lines(self, workers = 1):
+		"""Yield the lines of spread_sheet()."""
+	
+		yield 'Id;Label' + '\n'
+		yield _Section('nodes')
+	
+		for key in self._escaped_keys('csv'):
+			yield key + ';' + key + '\n'
+	
+		yield 'Source;Target;Label' + '\n'
+		yield _EdgeSection('_spread_sheet_edge_lines', workers)
+	
+	def _spread_sheet_edge_lines(self, keys, edge_id = 0):
+	
+		tokens, texts = self._tokens('csv'), self._tokens('csv_text')
+		if tokens is None :
+			for key, node, weight in self.edges(keys):
+				yield '{0};{1};"{0} to {1} : {2}"'.format(key,node,weight) + '\n'
+			return
+	
+		texts = texts or _Names()
+		for key, node, weight in self.edges(keys):
+			yield '{};{};"{} to {} : {}"'.format(tokens[key],tokens[node],texts[key],texts[node],weight) + '\n'
+	
+	def GraphViz_dot_format(self, graph_format = 'basic', path = None, progress = None, cancel = None):
 		"""GraphViz DOT Format
 		
 		DOT is the text file format of the suite GraphViz. It has a human-readable syntax that describes network data, 
@@ -980,53 +2642,69 @@ class Gephi(object):
 		Args : 
 			None
 		Kwargs : 
+			path (str, default None) : write the format into this file instead of returning it, compressed by its extension (.gz, .bz2, .xz, .zst).
+			progress (callable, default None) : called as progress(edges done, total edges) every progress_chunk edges.
+			cancel (CancelToken, default None) : stop the export with ExportCancelled once cancelled, see gephi.progress.
 			graph_format (str) : specifiy the graph format. 
 		Returns :
 			r_str (str) : string of GraphViz dot format.
+			size (int) : number of characters written, when path is given.
 		Raises:
 			ValueError :  raise exception when graph format is unsupported by GraphViz_dot_format
 		
 		"""
-	
-		r_str = 'digraph G {' + '\n'
 		
+		return self._render('dot', graph_format, path = path, progress = progress, cancel = cancel)
+	
+	def _graphviz_dot_lines(self, graph_format = 'basic'):
+		"""Yield the lines of GraphViz_dot_format()."""
+	
+		if graph_format not in ('Labels', 'adjacency-list', 'basic') :
+			raise ValueError('Unsupported graph format : ' + graph_format)
+	
+		yield 'digraph G {' + '\n'
+	
 		if graph_format == 'Labels':
-		
-			for key in self.keys:
-				nodes = self.data[key][0]
-				weights = self.data[key][1]
-				for node in nodes:
-					r_str += '{0} -> {1} [ label = " {0} to {1} : {2} " ]; '.format(key,node,weights[nodes.index(node)]) + '\n'
-
-			for key in self.keys:
-				r_str += key + '[label="' + key + '"];' + '\n'
-		
+	
+			yield _EdgeSection('_graphviz_label_edge_lines')
+			yield _Section('nodes')
+	
+			for key, text in izip(self._escaped_keys('dot'), self._escaped_keys('dot_text')):
+				yield key + '[label="' + text + '"];' + '\n'
+	
 		elif graph_format == 'adjacency-list' :
-			for key in self.keys:
-				buffer = ''
-				nodes = self.data[key][0]
-				for node in nodes:
-					buffer += node + ';'
-					
-				r_str += key + ' -> {' + buffer[:-1] +'}' + '\n'
-				
-				
-		elif graph_format == 'basic' :
-			for key in self.keys:
-				buffer = ''
-				nodes = self.data[key][0]
-				for node in nodes:
-					r_str += key + ' -> ' + node + ';' + '\n'
-					
+	
+			yield _EdgeSection('_graphviz_adjacency_lines')
+	
 		else :
-			raise ValueError('Unsupported graph format : ' + graph_format)
-					
-			
-		r_str += '}' + '\n'
-		
-		return r_str[:-1]
-		
-	def ucinet_DL(self, graph_format = 'basic'):
+	
+			yield _EdgeSection('_graphviz_edge_lines')
+	
+		yield '}' + '\n'
+	
+	def _graphviz_edge_lines(self, keys, edge_id = 0):
+	
+		for key, nodes in self._escaped_adjacency('dot', keys):
+			yield ''.join([ key + ' -> ' + node + ';' + '\n' for node in nodes ])
+	
+	def _graphviz_label_edge_lines(self, keys, edge_id = 0):
+	
+		tokens, texts = self._tokens('dot'), self._tokens('dot_text')
+		if tokens is None :
+			for key, node, weight in self.edges(keys):
+				yield '{0} -> {1} [ label = " {0} to {1} : {2} " ]; '.format(key,node,weight) + '\n'
+			return
+	
+		texts = texts or _Names()
+		for key, node, weight in self.edges(keys):
+			yield '{} -> {} [ label = " {} to {} : {} " ]; '.format(tokens[key],tokens[node],texts[key],texts[node],weight) + '\n'
+	
+	def _graphviz_adjacency_lines(self, keys, edge_id = 0):
+	
+		for key, nodes in self._escaped_adjacency('dot', keys):
+			yield key + ' -> {' + ';'.join(nodes) +'}' + '\n'
+	
+	def ucinet_DL(self, graph_format = 'basic', path = None, progress = None, cancel = None):
 		"""UCINET DL Format
 		
 		UCINET DL format is the most common file format used by UCINET package. Gephi currently supports the fullmatrix 
@@ -1115,164 +2793,79 @@ class Gephi(object):
 		Args :
 			None
 		Kwargs :
-			None
+			path (str, default None) : write the format into this file instead of returning it, compressed by its extension (.gz, .bz2, .xz, .zst).
+			progress (callable, default None) : called as progress(edges done, total edges) every progress_chunk edges,
+			                                   and before every matrix row of 'basic' and 'weight'.
+			cancel (CancelToken, default None) : stop the export with ExportCancelled once cancelled, see gephi.progress.
 		Returns :
 			r_str (str) : string of graph format
+			size (int) : number of characters written, when path is given.
 		Raises:
 			ValueError
 		
 		"""
 		
+		return self._render('dl', graph_format, path = path, progress = progress, cancel = cancel)
+	
+	def _ucinet_dl_lines(self, graph_format = 'basic'):
+		"""Yield the lines of ucinet_DL()."""
+	
+		if graph_format in ('basic', 'weight') :
+			dl_format = 'fullmatrix'
+		elif graph_format in ('edge-list', 'labels-embedded', 'edge-weight') :
+			dl_format = 'edgelist1'
+		else:
+			raise ValueError('Unsupported graph format : '+ graph_format)
+	
+		yield 'dl N = ' + str(len(self.keys)) + '\n'
+		yield 'format = ' + dl_format + '\n'
+		yield 'labels:' + '\n'
+		yield _Section('nodes')
+		yield ','.join(self._escaped_keys('dl')) + '\n'
+		yield 'data:' + '\n'
+	
 		if graph_format == 'basic':
-			
-			r_str = 'dl N = ' + str(len(self.keys)) + '\n'
-			r_str += 'format = fullmatrix' + '\n'
-			r_str += 'labels:' + '\n'
-			
-			for key in self.keys:
-				r_str += key + ','
-			r_str=r_str[:-1] + '\n'
-			
-			r_str += 'data:' + '\n'
-			
-			
-			matrix=[list() for _ in self.keys]
-			for i in xrange(len(self.keys)):
-				matrix[i]=[0 for _ in self.keys]
-				
-			if self.graph_type == 'undriect' :
-			
-				for key in self.keys :
-					nodes = self.data[key][0]
-					for node in nodes:
-						matrix[self.keys.index(key)][self.keys.index(node)] = 1
-						matrix[self.keys.index(node)][self.keys.index(key)] = 1
-
-					buffer=''	
-					for cell in matrix[self.keys.index(key)]:
-						buffer += "{0:.1f} ".format(float(cell))
-					buffer = buffer[:-1]
-					r_str +=  buffer + '\n'
-			else:
-			
-				for key in self.keys :
-					nodes = self.data[key][0]
-					for node in nodes:
-						matrix[self.keys.index(key)][self.keys.index(node)] = 1
-
-					buffer=''	
-					for cell in matrix[self.keys.index(key)]:
-						buffer += "{0:.1f} ".format( float(cell) )
-					buffer = buffer[:-1]
-					r_str +=  buffer + '\n'
-				
+	
+			yield _Section('matrix')
+			matrix = self._sparse_matrix(weighted = False)
+			yield _Section('edges', len(self.keys))
+			for row in self._dense_rows('0.0', '1.0', matrix):
+				yield ' '.join(row) + '\n'
+	
 		elif graph_format == 'weight':
-			
-			r_str = 'dl N = ' + str(len(self.keys)) + '\n'
-			r_str += 'format = fullmatrix' + '\n'
-			r_str += 'labels:' + '\n'
-			
-			for key in self.keys:
-				r_str += key + ','
-			r_str=r_str[:-1] + '\n'
-			
-			r_str += 'data:' + '\n'
-			
-			
-			matrix=[list() for _ in self.keys]
-			for i in xrange(len(self.keys)):
-				matrix[i]=[0 for _ in self.keys]
-			
-			
-			if self.graph_type == 'undriect' :
-			
-				for key in self.keys :
-
-					nodes = self.data[key][0]
-					weights = self.data[key][1]
-					for node in nodes:
-						matrix[self.keys.index(key)][self.keys.index(node)] = weights[nodes.index(node)]
-						matrix[self.keys.index(node)][self.keys.index(key)] = weights[nodes.index(node)]
-
-					buffer=''	
-					for cell in matrix[self.keys.index(key)]:
-						buffer += "{0:.1f} ".format(float(cell))
-					buffer = buffer[:-1]
-					r_str +=  buffer + '\n'
-			else:
-			
-				for key in self.keys :
-
-					nodes = self.data[key][0]
-					weights = self.data[key][1]
-					for node in nodes:
-						matrix[self.keys.index(key)][self.keys.index(node)] = weights[nodes.index(node)]
-
-					buffer=''	
-					for cell in matrix[self.keys.index(key)]:
-						buffer += "{0:.1f} ".format( float(cell) )
-					buffer = buffer[:-1]
-					r_str +=  buffer + '\n'
-					
-				
+	
+			yield _Section('matrix')
+			matrix = self._sparse_matrix(weighted = True)
+			yield _Section('edges', len(self.keys))
+			for row in self._dense_rows('0.0', "{0:.1f}", matrix):
+				yield ' '.join(row) + '\n'
+	
 		elif graph_format == 'edge-list':
-			
-			r_str = 'dl N = ' + str(len(self.keys)) + '\n'
-			r_str += 'format = edgelist1' + '\n'
-			r_str += 'labels:' + '\n'
-			
-			for key in self.keys:
-				r_str += key + ','
-			r_str=r_str[:-1] + '\n'
-			
-			r_str += 'data:' + '\n'
 	
-			for key in self.keys :
-				nodes = self.data[key][0]
-				for node in nodes:
-					r_str += "{} {}\n".format( self.keys.index(key) , self.keys.index(node) )
-					
+			yield _EdgeSection('_ucinet_dl_edge_lines')
+	
 		elif graph_format == 'labels-embedded':
-			
-			r_str = 'dl N = ' + str(len(self.keys)) + '\n'
-			r_str += 'format = edgelist1' + '\n'
-			r_str += 'labels:' + '\n'
-			
-			for key in self.keys:
-				r_str += key + ','
-			r_str=r_str[:-1] + '\n'
-			
-			r_str += 'data:' + '\n'
 	
-			for key in self.keys :
-				nodes = self.data[key][0]
-				for node in nodes:
-					r_str += "{} {}\n".format( key , node )
-				
-		elif graph_format == 'edge-weight':
-			
-			r_str = 'dl N = ' + str(len(self.keys)) + '\n'
-			r_str += 'format = edgelist1' + '\n'
-			r_str += 'labels:' + '\n'
-			
-			for key in self.keys:
-				r_str += key + ','
-			r_str=r_str[:-1] + '\n'
-			
-			r_str += 'data:' + '\n'
+			yield _EdgeSection('_ucinet_dl_label_edge_lines')
 	
-			for key in self.keys :
-				nodes = self.data[key][0]
-				weights = self.data[key][1]
-				for node in nodes:
-					r_str += "{} {} {:.2f}\n".format( self.keys.index(key) , self.keys.index(node) , weights[nodes.index(node)] )
-					
-		else:
-			raise ValueError('Unsupported graph format : '+ graph_format)
-					
-		return r_str[:-1]
-		
-	def TLP(self):
+		else :
+	
+			yield _EdgeSection('_ucinet_dl_weight_edge_lines')
+	
+	def _ucinet_dl_edge_lines(self, keys, edge_id = 0):
+	
+		return self._block_lines(keys, '%s %s\n')
+	
+	def _ucinet_dl_label_edge_lines(self, keys, edge_id = 0):
+	
+		for key, nodes in self._escaped_adjacency('dl', keys) :
+			yield ''.join([ "{} {}\n".format( key , node ) for node in nodes ])
+	
+	def _ucinet_dl_weight_edge_lines(self, keys, edge_id = 0):
+	
+		return self._block_lines(keys, '%s %s %.2f\n', weighted = True)
+	
+	def TLP(self, path = None, progress = None, cancel = None):
 		"""TLP Format
 		
 		TLP is the file format used by Tulip. Only network topology (nodes and edges) is currently supported.
@@ -1295,36 +2888,42 @@ class Gephi(object):
 		Args :
 			None
 		Kwargs :
-			None
+			path (str, default None) : write the format into this file instead of returning it, compressed by its extension (.gz, .bz2, .xz, .zst).
+			progress (callable, default None) : called as progress(edges done, total edges) every progress_chunk edges.
+			cancel (CancelToken, default None) : stop the export with ExportCancelled once cancelled, see gephi.progress.
 		Returns :
 			r_str (str) : string of graph format
+			size (int) : number of characters written, when path is given.
 		Raises:
 			None
 		
 		"""
 		
-		r_str = '(tlp "2.0" ' + '\n'
-		r_str += '(date "09-11-2006")' + '\n'
-		r_str += '(author "Wessam Elhefnawy")' + '\n'
-		r_str += '(comments "This file was generated by Tulip Gephi.")' + '\n'
-		r_str += '(nodes' 
-		
+		return self._render('tlp', path = path, progress = progress, cancel = cancel)
+	
+	def _tlp_lines(self):
+		"""Yield the lines of TLP()."""
+	
+		yield '(tlp "2.0" ' + '\n'
+		yield '(date "09-11-2006")' + '\n'
+		yield '(author "Wessam Elhefnawy")' + '\n'
+		yield '(comments "This file was generated by Tulip Gephi.")' + '\n'
+		yield '(nodes'
+		yield _Section('nodes')
+	
 		for key in self.keys:
-			r_str += " {}".format(self.keys.index(key))
-		r_str += ')' + '\n'
-		
-		edge_id = 0
-		for key in self.keys :
-			nodes = self.data[key][0]
-			for node in nodes:
-				r_str += "(edge {} {} {})\n".format(edge_id , self.keys.index(key) , self.keys.index(node) )
-				edge_id += 1
-		
-		r_str += ')' + '\n'	
-		
-		return r_str[:-1]
-		
-	def netdraw_VNA(self):
+			yield " {}".format(self.index[key])
+		yield ')' + '\n'
+	
+		yield _EdgeSection('_tlp_edge_lines')
+	
+		yield ')' + '\n'
+	
+	def _tlp_edge_lines(self, keys, edge_id = 0):
+	
+		return self._block_lines(keys, '(edge %s %s %s)\n', edge_id = edge_id)
+	
+	def netdraw_VNA(self, path = None, progress = None, cancel = None):
 		"""Netdraw VNA format
 		The VNA format is commonly used by Netdraw, and is very similar to Pajek format. It defines nodes and edges (ties), 
 		and supports attributes. Each section of the file is separated by an asterisk.
@@ -1348,39 +2947,441 @@ class Gephi(object):
 		j101 b303 1
 		w067 b303 5
 		
+		Node attributes named color, shape, size or shortlabel give the values of the node properties, the other node
+		attributes are columns of the node data and the edge attributes columns of the tie data, see set_node_attribute().
+		
 		Args :
 			None
 		Kwargs :
-			None
+			path (str, default None) : write the format into this file instead of returning it, compressed by its extension (.gz, .bz2, .xz, .zst).
+			progress (callable, default None) : called as progress(edges done, total edges) every progress_chunk edges.
+			cancel (CancelToken, default None) : stop the export with ExportCancelled once cancelled, see gephi.progress.
 		Returns :
 			r_str (str) : string of graph format
+			size (int) : number of characters written, when path is given.
 		Raises:
 			None
 		
 		
 		"""
 		
-		r_str = '*node data' + '\n'
-		r_str += 'ID name' + '\n'
-		for key in self.keys:
-			r_str += "{} {}\n".format( self.keys.index(key) , key )
+		return self._render('vna', path = path, progress = progress, cancel = cancel)
+	
+	def _netdraw_vna_lines(self):
+		"""Yield the lines of netdraw_VNA()."""
+	
+		table = self.node_attributes
+		builtin, extra = _attribute_columns(table, ['color', 'shape', 'size', 'shortlabel'])
+	
+		yield '*node data' + '\n'
+		yield 'ID name' + ''.join([ ' ' + table.names[i] for i in extra ]) + '\n'
+		yield _Section('nodes')
+		names = self._escaped_keys('vna')
+		if not len(table) :
+			for key, name in izip(self.keys, names):
+				yield "{} {}\n".format( self.index[key] , name )
+	
+			yield '*Node properties' + '\n'
+			yield 'ID color shape size shortlabel' + '\n'
+			for key, name in izip(self.keys, names):
+				yield "{} {} {} {} {}\n".format( self.index[key] , 100 , 1 , len(self.data[key][1]) , name)
+		else :
+			texts = _attribute_texts(table, _vna_quote)
+			for key, name, row in izip(self.keys, names, table.rows()):
+				values = texts(row)
+				yield "{} {}".format( self.index[key] , name ) + ''.join([ ' ' + values[i] for i in extra ]) + '\n'
+	
+			yield '*Node properties' + '\n'
+			yield 'ID color shape size shortlabel' + '\n'
+			for key, name, row in izip(self.keys, names, table.rows()):
+				values = texts(row)
+				columns = [ '100', '1', str(len(self.data[key][1])), name ]
+				for column, position in builtin :
+					columns[column] = values[position]
+				yield str(self.index[key]) + ' ' + ' '.join(columns) + '\n'
+	
+		yield '*tie data' + '\n'
+		yield 'from to strength' + ''.join([ ' ' + name for name in self.edge_attributes ]) + '\n'
+		yield _EdgeSection('_netdraw_vna_edge_lines')
+	
+	def _netdraw_vna_edge_lines(self, keys, edge_id = 0):
+	
+		if not len(self.edge_attributes) :
+			return self._block_lines(keys, '%s %s %.2f\n', weighted = True)
+	
+		return self._netdraw_vna_attribute_edge_lines(keys, edge_id)
+	
+	def _netdraw_vna_attribute_edge_lines(self, keys, edge_id):
+		"""VNA ties with the columns of the edge attributes, one edge at a time."""
+	
+		index = self.index
+		texts = _attribute_texts(self.edge_attributes, _vna_quote)
+		for (key, node, weight), row in izip(self.edges(keys), self.edge_attributes.rows(edge_id)):
+			yield '%s %s %.2f ' % ( index[key] , index[node] , weight ) + ' '.join(texts(row)) + '\n'
+	
+class _EdgeSection(object):
+	"""Placeholder yielded by a writer in place of its edge lines, formatted by getattr(G, method)(keys, edge_id).
+	
+	Gephi._lines() expands it through Gephi._edge_lines(), export_many() formats it chunk by chunk for several formats.
+	
+	"""
+	
+	__slots__ = ['method', 'workers']
+	
+	def __init__(self, method, workers = 1):
+	
+		self.method = method
+		self.workers = workers
+		
+class _Chunk(list):
+	"""Keys of one chunk of Gephi.export_many(), with the rows built from them once and shared by every format."""
+	
+	__slots__ = ['rows']
+	
+	def __init__(self, keys):
+	
+		list.__init__(self, keys)
+		self.rows = dict()
+		
+	def shared(self, name, build):
+		"""Rows name of the chunk, built by build() on the first call."""
+		
+		rows = self.rows.get(name)
+		if rows is None :
+			rows = self.rows[name] = build()
 			
-		r_str += '*Node properties' + '\n'
-		r_str += 'ID color shape size shortlabel' + '\n'
-		for key in self.keys:
-			r_str += "{} {} {} {} {}\n".format( self.keys.index(key) , 100 , 1 , len(self.data[key][1]) , key)
+		return rows
+		
+class _Section(object):
+	"""Marker yielded by a writer at the start of its node section, or of its edge lines when they are not an
+	_EdgeSection, so an instrumented export reports them as their own phase. Skipped by the other exports. rows is
+	the number of rows that follow, one line per node of a dense matrix or an adjacency list, tracked one by one by
+	the progress of the export."""
+	
+	__slots__ = ['phase','rows']
+	
+	def __init__(self, phase, rows = None):
+	
+		self.phase = phase
+		self.rows = rows
+		
+class _Shard(object):
+	"""Nodes and edges of one shard of Gephi.export_shards(), with the graph ids of its nodes, and of its edges when
+	edge_ids is True."""
+	
+	__slots__ = ['data','names','node_ids','edge_ids']
+	
+	def __init__(self, edge_ids = False):
+	
+		self.data = dict()
+		self.names = []
+		self.node_ids = []
+		self.edge_ids = dict() if edge_ids else None
+		
+	def node(self, name, node_id):
+		"""Add node name of graph id node_id, once."""
+		
+		if name not in self.data :
+			self.data[name] = ([], [])
+			self.names.append(name)
+			self.node_ids.append(node_id)
+			
+	def source(self, name, spanned):
+		"""Prepare the adjacency of name before its edges, with a time spans list when spanned."""
+		
+		if spanned and len(self.data[name]) == 2 :
+			self.data[name] = ([], [], [])
 			
-		r_str += '*tie data' + '\n'
-		r_str += 'from to strength' + '\n'
+	def edge(self, source, target, weight, span, edge_id):
+		"""Add the edge source -> target of graph id edge_id."""
+		
+		adjacency = self.data[source]
+		adjacency[0].append(target)
+		adjacency[1].append(weight)
+		if len(adjacency) > 2 :
+			adjacency[2].append(span)
+		if self.edge_ids is not None :
+			self.edge_ids.setdefault(source, []).append(edge_id)
+		
+	def edge_order(self):
+		"""Graph ids of the edges in the edges() order of the shard."""
+		
+		return [ edge_id for name in self.names for edge_id in self.edge_ids.get(name, ()) ]
+		
+class _Names(dict):
+	"""Token map of the names that need no escaping, every name is its own token."""
 	
-		for key in self.keys :
-			nodes = self.data[key][0]
-			weights = self.data[key][1]
-			for node in nodes:
-				r_str += "{} {} {:.2f}\n".format( self.keys.index(key) , self.keys.index(node) , weights[nodes.index(node)])
-					
-		return r_str[:-1]
+	def __missing__(self, name):
+	
+		return name
+		
+def _until_marker(lines):
+	"""Yield the lines of an export_many() format up to its next None chunk marker, or to its end."""
+	
+	for line in lines :
+		if line is None :
+			return
+		yield line
+		
+def _chunks(lines, chunk_size):
+	"""Coalesce lines into chunks of about chunk_size characters."""
+	
+	buffer = []
+	size = 0
+	for line in lines :
+		buffer.append(line)
+		size += len(line)
+		if size >= chunk_size :
+			yield ''.join(buffer)
+			buffer = []
+			size = 0
+			
+	if buffer :
+		yield ''.join(buffer)
+		
+def _bounded(chunks, chunk_size):
+	"""Split the chunks longer than chunk_size characters."""
+	
+	for chunk in chunks :
+		if len(chunk) <= chunk_size :
+			yield chunk
+		else :
+			for i in xrange(0, len(chunk), chunk_size) :
+				yield chunk[i : i + chunk_size]
+				
+def _write(fileobj, chunks):
+	"""Write chunks into a file object, returns the number of characters written."""
+	
+	size = 0
+	for chunk in chunks :
+		fileobj.write(chunk)
+		size += len(chunk)
+		
+	return size
+	
+def _cache_key(owner, fmt, args, kwargs):
+	"""Cache key of a format rendered by the graph owner, None when an argument is not hashable. workers, progress and
+	cancel do not change the output."""
+	
+	key = (owner, fmt, _frozen(args), _frozen(sorted( item for item in kwargs.items() if item[0] not in ('workers', 'progress', 'cancel') )))
+	try :
+		hash(key)
+	except TypeError :
+		return None
+		
+	return key
+	
+def _frozen(value):
+	"""Hashable copy of lists and tuples of arguments."""
+	
+	if isinstance(value, (list, tuple)) :
+		return tuple( _frozen(item) for item in value )
+		
+	return value
+	
+def _span(span):
+	"""(start, end) tuple of an edge time span given as any pair, NumPy rows included. None stays None."""
+	
+	if span is None :
+		return None
+		
+	start, end = span.tolist() if hasattr(span, 'tolist') else span
+	return (start, end)
+	
+def _span_attributes(span):
+	"""GEXF start / end attributes of a time span, floats are written with repr() to keep their precision."""
+	
+	if span is None :
+		return ''
+		
+	attributes = ''
+	for name, value in zip(('start', 'end'), span) :
+		if value is not None :
+			attributes += ' ' + name + '="' + (repr(value) if isinstance(value, float) else str(value)) + '"'
+			
+	return attributes
+	
+# attribute type -> column type of GDF, GEXF and GraphML
+_gdf_types = {'string' : 'VARCHAR', 'int' : 'INT', 'double' : 'DOUBLE', 'boolean' : 'BOOLEAN'}
+_gexf_types = {'string' : 'string', 'int' : 'integer', 'double' : 'double', 'boolean' : 'boolean'}
+_graph_ml_types = {'string' : 'string', 'int' : 'int', 'double' : 'double', 'boolean' : 'boolean'}
+
+def _attribute_columns(table, builtin):
+	"""Split the attributes of table in (builtin column position, attribute position) pairs for the attributes named
+	like a builtin column of a writer, and the positions of the other attributes."""
+	
+	columns = [ (builtin.index(name), i) for i, name in enumerate(table.names) if name in builtin ]
+	extra = [ i for i, name in enumerate(table.names) if name not in builtin ]
+	return columns, extra
+	
+def _attribute_texts(table, quote):
+	"""Formatter of the rows of table into lists of texts, string values go through quote()."""
+	
+	kinds = [ table.types[name] for name in table.names ]
+	
+	def texts(row):
+		return [ quote(value if isinstance(value, basestring) else str(value)) if kind == 'string' else
+		         ('true' if value else 'false') if kind == 'boolean' else str(value) for kind, value in izip(kinds, row) ]
+		
+	return texts
+	
+def _gdf_quote(text):
+	"""GDF text value, wrapped in single quotes when it holds a coma or a quote, its single quotes doubled."""
+	
+	return "'" + text.replace("'", "''") + "'" if ',' in text or "'" in text or '"' in text else text
+	
+def _csv_quote(text):
+	"""CSV field, wrapped in double quotes when it holds a separator, a quote or a line break, its quotes doubled."""
+	
+	return '"' + text.replace('"', '""') + '"' if _csv_special.search(text) else text
+	
+def _csv_text(text):
+	"""Text inside a quoted CSV field."""
+	
+	return text.replace('"', '""')
+	
+def _gml_quote(text):
+	"""GML key value, bare unless it holds a space, a bracket or a quote, then a quoted string with XML entities."""
+	
+	return '"' + _xml_quote(text) + '"' if not text or _gml_special.search(text) else text
+	
+def _dot_quote(text):
+	"""DOT ID, bare for identifiers and numerals, otherwise a quoted string with escaped quotes and backslashes."""
+	
+	if _dot_id.match(text) and text.lower() not in _dot_keywords :
+		return text
+		
+	return '"' + _dot_text(text) + '"'
+	
+def _dot_text(text):
+	"""Text inside a quoted DOT string."""
+	
+	return text.replace('\\', '\\\\').replace('"', '\\"')
+	
+def _xml_quote(text):
+	"""XML attribute value."""
+	
+	return escape(text, {'"' : '&quot;'})
+	
+def _vna_quote(text):
+	"""VNA text value, wrapped in double quotes when it is empty or holds a space."""
+	
+	return '"' + text + '"' if not text or ' ' in text or '\t' in text else text
+	
+def _pajek_text(text):
+	"""Text inside a quoted pajek label, which can not hold quotes nor line breaks : double quotes become single quotes
+	and line breaks spaces."""
+	
+	return _pajek_special.sub(lambda match : "'" if match.group() == '"' else ' ', text)
+	
+def _dl_quote(text):
+	"""UCINET DL label, wrapped in double quotes when it is empty or holds a coma, a space, a quote or a line break,
+	its quotes doubled."""
+	
+	return '"' + text.replace('"', '""') + '"' if not text or _dl_special.search(text) else text
+	
+def _dl_names(text):
+	"""True when a label of the NUL joined names text needs quotes in DL."""
+	
+	return _dl_special.search(text) or _empty_name(text)
+	
+def _empty_name(text):
+	"""True when the NUL joined names text holds an empty name."""
+	
+	return not text or text[0] == '\0' or text[-1] == '\0' or '\0\0' in text
+	
+def _gml_names(text):
+	"""True when a name of the NUL joined names text needs quotes in GML."""
+	
+	return _gml_special.search(text) or _empty_name(text)
+	
+def _vna_names(text):
+	"""True when a name of the NUL joined names text needs quotes in VNA."""
+	
+	return _vna_special.search(text) or _empty_name(text)
+	
+def _dot_names(text):
+	"""True when a name of the NUL joined names text may need quotes in DOT, numerals are told apart by _dot_quote()."""
+	
+	if _dot_special.search(text) or _empty_name(text) :
+		return True
+	if _dot_numerals.match(text) :
+		return False
+		
+	lower = text.lower()
+	return text[0].isdigit() or any( '\0' + digit in text for digit in '0123456789' ) or \
+		any( keyword in lower for keyword in _dot_keywords )
+	
+_csv_special = re.compile(r'[;,"\r\n]')
+_gml_special = re.compile(r'[\s\[\]"]')
+_vna_special = re.compile(r'[ \t]')
+_pajek_special = re.compile(r'["\r\n]')
+_dl_special = re.compile(r'[,"\s]')
+_dot_special = re.compile(r'[^A-Za-z0-9_\0]')
+_dot_numerals = re.compile(r'[0-9\0]*\Z')
+_dot_id = re.compile(r'([A-Za-z_][A-Za-z0-9_]*|-?(\.[0-9]+|[0-9]+(\.[0-9]*)?))$')
+_dot_keywords = set(['node', 'edge', 'graph', 'digraph', 'subgraph', 'strict'])
+
+# token style -> (quote function, test of the NUL joined names, true when at least one name may change)
+_token_styles = {
+	'csv' : (_csv_quote, _csv_special.search),
+	'csv_text' : (_csv_text, re.compile(r'"').search),
+	'gdf' : (_gdf_quote, re.compile(r'[,\'"]').search),
+	'xml' : (_xml_quote, re.compile(r'[&<>"]').search),
+	'gml' : (_gml_quote, _gml_names),
+	'dot' : (_dot_quote, _dot_names),
+	'dot_text' : (_dot_text, re.compile(r'["\\]').search),
+	'vna' : (_vna_quote, _vna_names),
+	'pajek' : (_pajek_text, _pajek_special.search),
+	'dl' : (_dl_quote, _dl_names),
+}
+	
+def _gexf_attvalues(texts):
+	"""<attvalues> block of the attribute texts of a GEXF node or edge."""
+	
+	return '<attvalues>' + '\n' + ''.join([ '<attvalue for="' + str(i) + '" value="' + text + '" />' + '\n' for i, text in enumerate(texts) ]) + '</attvalues>' + '\n'
+	
+def _graph_ml_data(texts, first):
+	"""<data> elements of the attribute texts of a GraphML node or edge, keys numbered from d<first>."""
+	
+	return ''.join([ '<data key="d' + str(first + i) + '">' + text + '</data>' + '\n' for i, text in enumerate(texts) ])
+	
+def _crc32(name):
+	"""Unsigned crc32 of a node name, the same in every process unlike hash()."""
+	
+	return zlib.crc32(name.encode('utf-8') if isinstance(name, unicode) else str(name)) & 0xffffffff
+	
+def _numpy_array(sequence):
+	"""NumPy view of a CSR array, without copy for array.array buffers."""
+	
+	if isinstance(sequence, array) and len(sequence) :
+		return numpy.frombuffer(sequence, dtype = sequence.typecode)
 		
+	return numpy.asarray(sequence)
+	
+def _format_chunk(task):
+	"""Format the edges of one chunk of nodes in a worker process, see Gephi._edge_lines()."""
+	
+	method, keys, data, edge_id, attributes = task
+	G = Gephi(data, graph_type = 'direct')
+	if attributes is not None :
+		G.edge_attributes = attributes
+	return ''.join(getattr(G, method)(keys, edge_id))
+	
+def _write_shard(task):
+	"""Write one shard of Gephi.export_shards(), in a worker process or not, returns the number of characters written."""
+	
+	fmt, path, args, kwargs, graph_type, data, names, node_attributes, edge_attributes = task
+	G = Gephi(data, graph_type = 'direct')
+	G.keys = names
+	G.index = dict( (name, i) for i, name in enumerate(names) )
+	G.graph_type = graph_type
+	if node_attributes is not None :
+		G.node_attributes = node_attributes
+	if edge_attributes is not None :
+		G.edge_attributes = edge_attributes
+	return G.write(fmt, path, *args, **kwargs)
+	
 	
 if __name__ == "__main__" :
 	pass
@@ -0,0 +1,121 @@
+"""Export Progress
+
+Progress reporting and cooperative cancellation of the Gephi exports. Every export method accepts a progress
+callback, called with the number of edges done and the total number of edges every Gephi.progress_chunk edges, or
+every row of the dense matrix and adjacency list formats, and a CancelToken checked at the same points. Cancelling
+the token from another thread, or from the progress callback, stops the export with ExportCancelled and removes the
+partially written file of a path export.
+
+	>>> token = CancelToken()
+	>>> def progress(done, total):
+	...     print '{:.0%}'.format(float(done) / total)
+	>>> G.pajek_net('weight', path = 'graph.net', progress = progress, cancel = token)
+
+Export progress module usage:
+	from .progress import CancelToken, ExportCancelled, ProgressTracker
+
+"""
+
+class ExportCancelled(Exception):
+	"""Raised by an export whose CancelToken was cancelled."""
+
+class CancelToken(object):
+	"""Cancel Token
+
+	Flag shared between an export and the code that may stop it, safe to set from any thread.
+
+	Attributes:
+		cancelled (bool): True once cancel() was called.
+
+	"""
+
+	__slots__ = ['cancelled']
+
+	def __init__(self):
+		"""CancelToken Constructor
+
+		Returns :
+			none
+
+		"""
+
+		self.cancelled = False
+
+	def cancel(self):
+		"""Ask the exports using this token to stop at their next check."""
+
+		self.cancelled = True
+
+	def check(self):
+		"""Raise ExportCancelled when the token was cancelled."""
+
+		if self.cancelled :
+			raise ExportCancelled('Export cancelled')
+
+class ProgressTracker(object):
+	"""Progress Tracker
+
+	State of the progress of one export, updated by the edge section of Gephi._lines(), or row by row by the dense
+	matrix and adjacency list formats, whose rows hold a line for every node.
+
+	Attributes:
+		progress (callable): called as progress(done, total), None when the export only checks the token.
+		cancel (CancelToken): token checked at every update, None when the export can not be cancelled.
+		total (int): number of edges of the export.
+		done (int): number of edges done at the last update, None before the first one.
+		lines (int): number of lines emitted outside the edge sections, the token is checked every 1024 lines.
+		rows (int): number of node rows of the current section, 0 outside of them.
+		row (int): number of rows of the current section emitted.
+
+	"""
+
+	__slots__ = ['progress','cancel','total','done','lines','rows','row']
+
+	def __init__(self, progress, cancel, total):
+		"""ProgressTracker Constructor
+
+		Args :
+			progress (callable) : progress callback or None.
+			cancel (CancelToken) : cancel token or None.
+			total (int) : number of edges of the export.
+
+		Returns :
+			none
+
+		"""
+
+		self.progress = progress
+		self.cancel = cancel
+		self.total = total
+		self.done = None
+		self.lines = 0
+		self.rows = 0
+		self.row = 0
+
+	def update(self, done):
+		"""Check the token then report done edges, unless they were already reported."""
+
+		if self.cancel is not None :
+			self.cancel.check()
+		if self.progress is not None and done != self.done :
+			self.progress(done, self.total)
+		self.done = done
+
+	def section(self, rows = None):
+		"""Start a section of the export, made of rows node rows when rows is given."""
+
+		self.rows = rows or 0
+		self.row = 0
+
+	def line(self):
+		"""Count a line emitted outside the edge sections, checking the token every 1024 lines. A node row is
+		worth edges in proportion of the rows, the token is checked and the progress reported before each of them."""
+
+		if self.row < self.rows :
+			self.update(self.total * self.row // self.rows)
+			self.row += 1
+			return
+
+		self.lines += 1
+		if not self.lines & 1023 and self.cancel is not None :
+			self.cancel.check()
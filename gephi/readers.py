@@ -0,0 +1,562 @@
+"""Graph Readers
+
+Parsers for the graph formats written by Gephi. Every reader consumes its source line by line, or element by element
+with an incremental parser for the XML formats, and returns the dictionary accepted by the Gephi constructor :
+
+	{ node name : ( [ target names ] , [ edges weights ] ) }
+
+Every node referenced by an edge is a key of the dictionary, nodes without out edges map to empty lists. Formats that
+do not store weights give every edge a weight of 1, formats that do not store names (TLP, Pajek or DL without labels)
+name the nodes by their ids.
+
+Paths are opened with gephi.files.open_file(), compressed files (.gz, .bz2, .xz, .zst) are decompressed on the fly.
+
+Readers module usage:
+	from .readers import readers
+
+"""
+
+import csv
+import re
+import xml.etree.cElementTree as ET
+from xml.sax.saxutils import unescape
+
+from .files import open_file
+
+
+def _lines(source):
+	"""Yield the lines of a path or of a file-like object / iterable of lines, without line terminators."""
+
+	if isinstance(source, basestring) :
+		with open_file(source) as f :
+			for line in f :
+				yield line.rstrip('\r\n')
+	else :
+		for line in source :
+			yield line.rstrip('\r\n')
+
+def _cells(line, separator, quote = '"'):
+	"""Split line on separator, with the csv module when it holds a quote, a quoted cell may hold the separator."""
+
+	if quote not in line :
+		return line.split(separator)
+
+	return next(csv.reader([line], delimiter = separator, quotechar = quote, skipinitialspace = separator == ' '))
+
+def _number(text):
+	"""Parse a weight, int when possible otherwise float."""
+
+	try :
+		return int(text)
+	except ValueError :
+		return float(text)
+
+def _add_node(data, node):
+
+	if node not in data :
+		data[node] = ([], [])
+
+def _add_edge(data, source, target, weight = 1):
+
+	_add_node(data, source)
+	_add_node(data, target)
+	data[source][0].append(target)
+	data[source][1].append(weight)
+
+def _add_span(data, source, span):
+	"""Set the time span of the last edge of source, the edges read before the first span get None spans."""
+
+	adjacency = data[source]
+	if len(adjacency) < 3 :
+		adjacency = data[source] = (adjacency[0], adjacency[1], [ None ] * (len(adjacency[0]) - 1))
+	adjacency[2].append(span)
+
+def _time(text):
+	"""Parse a GEXF time, number for the double timeformat, the text itself for dates. None stays None."""
+
+	if text is None :
+		return None
+
+	try :
+		return _number(text)
+	except ValueError :
+		return text
+
+def _label_weight(label):
+	"""Weight stored at the end of the edge labels written by Gephi, 'a to b : 12' -> 12."""
+
+	if ' : ' in label :
+		return _number(label.rsplit(' : ', 1)[1].strip(' "'))
+	return 1
+
+def _local(tag):
+	"""XML tag without its namespace."""
+
+	return tag.rsplit('}', 1)[-1]
+
+def _iterparse(source, tags):
+	"""Incremental XML parsing
+
+	Yield (local tag, element) for every complete element whose tag is in tags. Once handled the element is cleared and
+	removed from its parent, so memory does not grow with the size of the document.
+
+	"""
+
+	if isinstance(source, basestring) :
+		with open_file(source) as f :
+			for item in _iterparse(f, tags) :
+				yield item
+		return
+
+	parents = []
+
+	for event, element in ET.iterparse(source, events = ('start', 'end')) :
+		if event == 'start' :
+			parents.append(element)
+			continue
+
+		parents.pop()
+		tag = _local(element.tag)
+		if tag in tags :
+			yield tag, element
+			element.clear()
+			if parents :
+				del parents[-1][:]
+
+def read_csv(source, graph_format = 'adjacency-list'):
+	"""Read the CSV formats of Gephi.CVS()
+
+	Args :
+		source (str or file) : path or file-like object.
+	Kwargs :
+		graph_format (str, default 'adjacency-list') : edge-list, adjacency-list, mixed, matrix or edge-weight.
+	Returns :
+		data (dict) : Gephi data dictionary.
+	Raises :
+		ValueError : raise exception when graph_format is not supported.
+
+	"""
+
+	data = dict()
+
+	if graph_format in ('edge-list', 'adjacency-list', 'mixed') :
+
+		separator = ',' if graph_format == 'mixed' else ';'
+		for line in _lines(source) :
+			if not line :
+				continue
+			cells = _cells(line, separator)
+			_add_node(data, cells[0])
+			for node in cells[1:] :
+				_add_edge(data, cells[0], node)
+
+	elif graph_format in ('matrix', 'edge-weight') :
+
+		columns = None
+		for line in _lines(source) :
+			if not line :
+				continue
+			cells = _cells(line, ';')
+			if columns is None :
+				columns = cells[1:]
+				for node in columns :
+					_add_node(data, node)
+				continue
+			for column, cell in zip(columns, cells[1:]) :
+				weight = _number(cell)
+				if weight :
+					_add_edge(data, cells[0], column, weight if graph_format == 'edge-weight' else 1)
+
+	else :
+		raise ValueError('Unsupported CSV graph type : ' + graph_format)
+
+	return data
+
+def read_adjacency_list(source):
+	"""Read the format of Gephi.adjacency_list(), text after # is a comment."""
+
+	data = dict()
+
+	for line in _lines(source) :
+		cells = line.split('#', 1)[0].split()
+		if cells :
+			_add_node(data, cells[0])
+			for node in cells[1:] :
+				_add_edge(data, cells[0], node)
+
+	return data
+
+def read_multiline_adjacency_list(source):
+	"""Read the format of Gephi.multiline_adjacency_list()."""
+
+	data = dict()
+	key = None
+	degree = 0
+
+	for line in _lines(source) :
+		cells = line.split('#', 1)[0].split()
+		if not cells :
+			continue
+		if degree :
+			_add_edge(data, key, cells[0])
+			degree -= 1
+		else :
+			key, degree = cells[0], int(cells[1])
+			_add_node(data, key)
+
+	return data
+
+def read_pajek(source):
+	"""Read the *arcs, *edges and *edgeslist schemes of Gephi.pajek_net(), with or without labels."""
+
+	data = dict()
+	names = dict()
+	section = None
+
+	for line in _lines(source) :
+
+		line = line.strip()
+		if not line or line.startswith('%') :
+			continue
+
+		if line.startswith('*') :
+			section = line.split()[0].lower()
+			if section == '*vertices' :
+				for i in xrange(1, int(line.split()[1]) + 1) :
+					names[str(i)] = str(i)
+			continue
+
+		if section == '*vertices' :
+			node_id, _, label = line.partition(' ')
+			names[node_id] = label.strip().strip('"')
+
+		elif section in ('*arcs', '*edges') :
+			cells = line.split()
+			_add_edge(data, names[cells[0]], names[cells[1]], _number(cells[2]) if len(cells) > 2 else 1)
+
+		elif section == '*edgeslist' :
+			cells = line.split()
+			_add_node(data, names[cells[0]])
+			for node_id in cells[1:] :
+				_add_edge(data, names[cells[0]], names[node_id])
+
+	for i in sorted(names, key = int) :
+		_add_node(data, names[i])
+
+	return data
+
+def read_gdf(source):
+	"""Read the format of Gephi.GDF_format(), node name and edge node1, node2, weight columns."""
+
+	data = dict()
+	section = None
+
+	for line in _lines(source) :
+
+		if not line :
+			continue
+		if line.startswith('nodedef>') or line.startswith('edgedef>') :
+			section = line[:7]
+			continue
+
+		if section == 'nodedef' :
+			_add_node(data, _cells(line, ',', "'")[0])
+		elif section == 'edgedef' :
+			cells = _cells(line, ',', "'")
+			_add_edge(data, cells[0], cells[1], _number(cells[2]) if len(cells) > 2 else 1)
+
+	return data
+
+def read_gexf(source):
+	"""Read the format of Gephi.GEXF() incrementally, edges without a weight attribute have the GEXF default weight 1.0.
+
+	The start / end attributes of dynamic graphs edges are kept as the third list of (start, end) spans of their source.
+
+	"""
+
+	data = dict()
+	spanned = False
+
+	for tag, element in _iterparse(source, ('node', 'edge')) :
+		if tag == 'node' :
+			_add_node(data, element.get('id'))
+			continue
+
+		source_node = element.get('source')
+		_add_edge(data, source_node, element.get('target'), _number(element.get('weight', '1.0')))
+
+		start, end = element.get('start'), element.get('end')
+		if start is not None or end is not None :
+			spanned = True
+		if spanned :
+			span = None if start is None and end is None else (_time(start), _time(end))
+			_add_span(data, source_node, span)
+
+	return data
+
+def _gml_tokens(source):
+
+	for line in _lines(source) :
+		for token in re.findall(r'"[^"]*"|\[|\]|[^\s\[\]]+', line) :
+			yield token
+
+def read_gml(source):
+	"""Read the format of Gephi.GML(), edge weights come from a weight key or from the Gephi edge labels."""
+
+	data = dict()
+	tokens = _gml_tokens(source)
+	stack = []
+
+	for token in tokens :
+
+		if token == ']' :
+			kind, block = stack.pop()
+			if kind == 'node' :
+				_add_node(data, block['id'])
+			elif kind == 'edge' :
+				weight = _number(block['weight']) if 'weight' in block else _label_weight(block.get('label', ''))
+				_add_edge(data, block['source'], block['target'], weight)
+			continue
+
+		value = next(tokens)
+		if value == '[' :
+			stack.append((token, dict()))
+		elif stack :
+			stack[-1][1][token] = unescape(value[1:-1], _entities) if value.startswith('"') else value
+
+	return data
+
+def read_graphml(source):
+	"""Read the format of Gephi.graph_ML() incrementally, the weight comes from the edge key named weight."""
+
+	data = dict()
+	weight_key = None
+
+	for tag, element in _iterparse(source, ('key', 'node', 'edge')) :
+		if tag == 'key' :
+			if element.get('for') == 'edge' and element.get('attr.name') == 'weight' :
+				weight_key = element.get('id')
+		elif tag == 'node' :
+			_add_node(data, element.get('id'))
+		elif tag == 'edge' :
+			weight = 1
+			for child in element :
+				if _local(child.tag) == 'data' and child.get('key') == weight_key :
+					weight = _number(child.text)
+			_add_edge(data, element.get('source'), element.get('target'), weight)
+
+	return data
+
+def read_spreadsheet(source):
+	"""Read the node and edge tables of Gephi.spread_sheet()."""
+
+	data = dict()
+	section = None
+
+	for line in _lines(source) :
+
+		if not line :
+			continue
+		if line.startswith('Id;') or line == 'Id' :
+			section = 'nodes'
+			continue
+		if line.startswith('Source;Target') :
+			section = 'edges'
+			continue
+
+		cells = _cells(line, ';')
+		if section == 'nodes' :
+			_add_node(data, cells[0])
+		elif section == 'edges' :
+			_add_edge(data, cells[0], cells[1], _label_weight(';'.join(cells[2:])))
+
+	return data
+
+def read_dot(source):
+	"""Read the basic, Labels and adjacency-list formats of Gephi.GraphViz_dot_format()."""
+
+	data = dict()
+
+	for line in _lines(source) :
+
+		line = line.strip()
+		if not line or line.endswith('{') and '->' not in line or line == '}' :
+			continue
+
+		match = _dot_token.match(line)
+		key = _dot_name(match)
+		rest = line[match.end():].lstrip()
+		_add_node(data, key)
+
+		if not rest.startswith('->') :
+			continue
+		rest = rest[2:].lstrip()
+
+		if rest.startswith('{') :
+			for match in _dot_token.finditer(rest, 1) :
+				if match.group(3) :
+					break
+				_add_edge(data, key, _dot_name(match))
+		else :
+			match = _dot_token.match(rest)
+			label = re.search(r'label\s*=\s*"((?:[^"\\]|\\.)*)"', rest[match.end():])
+			_add_edge(data, key, _dot_name(match), _label_weight(label.group(1)) if label else 1)
+
+	return data
+
+def _dot_name(match):
+	"""Node name of a DOT ID token, quoted strings unescaped."""
+
+	if match.group(1) is not None :
+		return re.sub(r'\\(.)', r'\1', match.group(1))
+
+	return match.group(2)
+
+def read_dl(source):
+	"""Read the fullmatrix and edgelist1 formats of Gephi.ucinet_DL()
+
+	Edge list ids are 0-based like the ids written by Gephi.ucinet_DL(), node names come from the labels line
+	when present, quoted labels may hold comas and spaces. Rows made of names are read as embedded labels, they
+	must be declared on the labels line unless the header says labels embedded.
+
+	Raises :
+		ValueError : on an edge list row without two nodes, with an id out of range or an undeclared name.
+
+	"""
+
+	data = dict()
+	labels = []
+	dl_format = 'fullmatrix'
+	size = 0
+	header = True
+	labels_next = False
+	embedded = False
+	row = 0
+
+	for number, line in enumerate(_lines(source), 1) :
+
+		stripped = line.strip()
+		if not stripped :
+			continue
+
+		if header :
+			lower = stripped.lower()
+			if labels_next :
+				labels = _cells(stripped, ',') if '"' in stripped else [ label.strip() for label in stripped.split(',') ]
+				labels_next = False
+			elif lower.startswith('dl') :
+				match = re.search(r'n\s*=\s*(\d+)', lower)
+				size = int(match.group(1)) if match else 0
+			elif lower.startswith('n') and '=' in lower :
+				size = int(lower.split('=')[1])
+			elif lower.startswith('format') :
+				dl_format = lower.split('=')[1].strip()
+			elif lower.startswith('labels embedded') :
+				embedded = True
+			elif lower.startswith('labels') :
+				labels_next = True
+			elif lower.startswith('data') :
+				header = False
+				names = labels if labels else [ str(i) for i in xrange(size) ]
+				for name in names :
+					_add_node(data, name)
+				declared = set(names)
+			continue
+
+		cells = _cells(stripped, ' ') if '"' in stripped else stripped.split()
+
+		if dl_format == 'fullmatrix' :
+			for column, cell in enumerate(cells) :
+				weight = _number(cell)
+				if weight :
+					_add_edge(data, names[row], names[column], weight)
+			row += 1
+
+		else :
+			if len(cells) < 2 :
+				raise ValueError('DL edge list row without source and target at line ' + str(number) + ' : ' + stripped)
+			try :
+				ids = [ int(cell) for cell in cells[:2] ]
+			except ValueError :
+				ids = None
+			if ids is not None and not embedded :
+				if not all(0 <= i < len(names) for i in ids) :
+					raise ValueError('DL node id out of range at line ' + str(number) + ' : ' + stripped)
+				source_node, target_node = names[ids[0]], names[ids[1]]
+			elif embedded or (cells[0] in declared and cells[1] in declared) :
+				source_node, target_node = cells[0], cells[1]
+			else :
+				raise ValueError('Undeclared DL node name at line ' + str(number) + ' : ' + stripped)
+			_add_edge(data, source_node, target_node, _number(cells[2]) if len(cells) > 2 else 1)
+
+	return data
+
+def read_tlp(source):
+	"""Read the format of Gephi.TLP(), nodes are named by their ids."""
+
+	data = dict()
+
+	for line in _lines(source) :
+
+		line = line.strip()
+		if line.startswith('(nodes') :
+			for node in line[len('(nodes'):].strip(' )').split() :
+				_add_node(data, node)
+		elif line.startswith('(edge ') :
+			cells = line.strip('()').split()
+			_add_edge(data, cells[2], cells[3])
+
+	return data
+
+def read_vna(source):
+	"""Read the format of Gephi.netdraw_VNA(), ties refer to the node ids of the node data section."""
+
+	data = dict()
+	names = dict()
+	section = None
+	columns = False
+
+	for line in _lines(source) :
+
+		if not line.strip() :
+			continue
+		if line.startswith('*') :
+			section = line[1:].strip().lower()
+			columns = True
+			continue
+		if columns :
+			columns = False
+			continue
+
+		cells = _cells(line.strip(), ' ') if '"' in line else line.split()
+		if section == 'node data' :
+			names[cells[0]] = cells[1] if len(cells) > 1 else cells[0]
+			_add_node(data, names[cells[0]])
+		elif section == 'tie data' :
+			_add_edge(data, names.get(cells[0], cells[0]), names.get(cells[1], cells[1]), _number(cells[2]) if len(cells) > 2 else 1)
+
+	return data
+
+
+# DOT ID : quoted string, bare ID, or the closing brace of a node list
+_dot_token = re.compile(r'"((?:[^"\\]|\\.)*)"|([^\s;\[\]{}"]+)|(\})')
+
+# XML entities of the quoted GML strings, beside &amp; &lt; &gt;
+_entities = { '&quot;' : '"' }
+
+# format name -> reader, same names as Gephi.formats
+readers = {
+	'csv' : read_csv,
+	'adjacency-list' : read_adjacency_list,
+	'multiline-adjacency-list' : read_multiline_adjacency_list,
+	'pajek' : read_pajek,
+	'gdf' : read_gdf,
+	'gexf' : read_gexf,
+	'gml' : read_gml,
+	'graphml' : read_graphml,
+	'spreadsheet' : read_spreadsheet,
+	'dot' : read_dot,
+	'dl' : read_dl,
+	'tlp' : read_tlp,
+	'vna' : read_vna,
+}
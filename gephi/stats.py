@@ -0,0 +1,142 @@
+"""Export Statistics
+
+Instrumentation of the Gephi exports. A Gephi given an instrument calls it with one ExportPhase per phase of every
+export : the head of the format, its node section, its edge section, its tail, and the sparse matrix build of the
+matrix formats. The peak of a phase is how much the process wide peak_memory() rose since the export started. An ExportStats is such an instrument, it keeps the phases and sums them by format and phase.
+
+	>>> stats = ExportStats()
+	>>> G = Gephi(data, instrument = stats)
+	>>> G.ucinet_DL('weight')
+	>>> print stats
+
+Any callable taking an ExportPhase may be used instead, to feed a metrics or logging system. Graphs without an
+instrument run the exports unchanged.
+
+Export statistics module usage:
+	from .stats import ExportPhase, ExportStats, peak_memory
+
+"""
+
+import sys
+
+try :
+	import resource
+except ImportError :
+	resource = None
+
+class ExportPhase(object):
+	"""Export Phase
+
+	Measures of one phase of an export.
+
+	Attributes:
+		format (str): format name, a key of Gephi.formats.
+		phase (str): 'head', 'nodes', 'edges', 'tail' or 'matrix'.
+		seconds (float): wall time spent formatting the phase, the time the consumer of the lines takes is not counted.
+		nodes (int): number of nodes processed by the phase.
+		edges (int): number of edges processed by the phase.
+		size (int): number of characters emitted by the phase, 0 for the matrix build.
+		peak (int): growth in bytes of the peak resident memory of the process from the start of the export to the end
+			of the phase, None when unknown. The process peak is a high-water mark : an export staying below the
+			memory an earlier work already reached reports 0.
+
+	"""
+
+	__slots__ = ['format','phase','seconds','nodes','edges','size','peak']
+
+	def __init__(self, format, phase, seconds = 0.0, nodes = 0, edges = 0, size = 0, peak = None):
+		"""ExportPhase Constructor
+
+		Args :
+			format (str) : format name.
+			phase (str) : phase name.
+
+		Kwargs :
+			seconds (float, default 0.0) : wall time of the phase.
+			nodes (int, default 0) : number of nodes processed.
+			edges (int, default 0) : number of edges processed.
+			size (int, default 0) : number of characters emitted.
+			peak (int, default None) : growth of the peak resident memory in bytes.
+
+		Returns :
+			none
+
+		"""
+
+		self.format = format
+		self.phase = phase
+		self.seconds = seconds
+		self.nodes = nodes
+		self.edges = edges
+		self.size = size
+		self.peak = peak
+
+	def __repr__(self):
+
+		return 'ExportPhase({}, {}, seconds={:.6f}, nodes={}, edges={}, size={}, peak={})'.format(
+			self.format, self.phase, self.seconds, self.nodes, self.edges, self.size, self.peak)
+
+class ExportStats(object):
+	"""Export Stats
+
+	Instrument keeping every reported ExportPhase, see Gephi(instrument = ...).
+
+	Attributes:
+		phases (list): reported phases, in order.
+
+	"""
+
+	__slots__ = ['phases']
+
+	def __init__(self):
+		"""ExportStats Constructor
+
+		Returns :
+			none
+
+		"""
+
+		self.phases = []
+
+	def __call__(self, phase):
+
+		self.phases.append(phase)
+
+	def totals(self):
+		"""Map of (format, phase) to an ExportPhase summing its reports, the peak is the highest one."""
+
+		totals = dict()
+		for phase in self.phases :
+			total = totals.get((phase.format, phase.phase))
+			if total is None :
+				total = totals[(phase.format, phase.phase)] = ExportPhase(phase.format, phase.phase)
+			total.seconds += phase.seconds
+			total.nodes += phase.nodes
+			total.edges += phase.edges
+			total.size += phase.size
+			if phase.peak is not None :
+				total.peak = phase.peak if total.peak is None else max(total.peak, phase.peak)
+
+		return totals
+
+	def clear(self):
+		"""Forget the reported phases."""
+
+		del self.phases[:]
+
+	def __str__(self):
+
+		lines = [ '{:<26}{:<8}{:>10}{:>10}{:>10}{:>12}{:>14}'.format('format', 'phase', 'seconds', 'nodes', 'edges', 'size', 'peak') ]
+		for (fmt, name), total in sorted(self.totals().items()) :
+			lines.append('{:<26}{:<8}{:>10.4f}{:>10}{:>10}{:>12}{:>14}'.format(fmt, name, total.seconds, total.nodes, total.edges, total.size, total.peak))
+
+		return '\n'.join(lines)
+
+def peak_memory():
+	"""Process wide peak resident memory in bytes since the process started, None without the resource module."""
+
+	if resource is None :
+		return None
+
+	peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	return peak if sys.platform == 'darwin' else peak * 1024
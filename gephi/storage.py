@@ -0,0 +1,339 @@
+"""Graph Storage
+
+Compact array-backed adjacency for Gephi. The graph is kept in CSR (compressed sparse row) form : integer node ids,
+an offsets array with one entry per node plus one, a targets array of node ids and a weights array of doubles. An
+edge costs 12 bytes instead of the 100+ bytes of a python list entry plus its weight object.
+
+CompactData answers the same data[key] -> (nodes, weights) protocol as the dictionary accepted by Gephi, so every
+format method reads it unchanged, while Gephi.edges() walks the arrays directly.
+
+A CompactData can be saved as a binary snapshot, the CSR arrays as they are in memory followed by the names table :
+
+	header      64 bytes : magic, version, byte order mark, nodes, names, edges, names table size, flags
+	offsets     int64 * (nodes + 1)
+	targets     int32 * edges, padded to 8 bytes
+	weights     double * edges
+	names       names joined by NUL bytes
+
+load_snapshot() maps the file in memory and views the arrays in place with ctypes, without parsing nor copying them.
+The pages are shared by every process that loads the same snapshot, only the names table is decoded.
+
+Compact storage module usage:
+	from .storage import CompactData, edge_rows, save_snapshot, load_snapshot
+
+"""
+
+import ctypes
+import mmap
+import struct
+from array import array
+from itertools import izip, repeat
+
+# snapshot header : magic, version, byte order mark, nodes, names, edges, names table size, flags
+_HEADER = struct.Struct('=8sIIQQQQQ')
+HEADER_SIZE = 64
+SNAPSHOT_MAGIC = 'GEPHICSR'
+SNAPSHOT_VERSION = 1
+BYTE_ORDER_MARK = 0x01020304
+
+# ctypes type of a snapshot column -> array typecode of the columns written without conversion
+_typecodes = {
+	ctypes.c_int64 : 'l',
+	ctypes.c_int32 : 'i',
+	ctypes.c_double : 'd',
+}
+
+class CompactData(object):
+	"""Compact Data
+
+	CSR adjacency of a graph, node ids follow the order of the names table. The first nodes names are the graph nodes
+	(the sources, in keys order); targets that are not graph nodes are appended after them.
+
+	Attributes:
+		names (list): node names, the position of a name is its node id.
+		index (dict): map of node name to node id.
+		offsets (array('l')): the edges of node i are the positions offsets[i] to offsets[i+1] of targets and weights.
+		targets (array('i')): target node id of every edge.
+		weights (array('d')): weight of every edge.
+
+	The arrays may be any integer / float sequences supporting len, indexing and slicing (array, numpy or ctypes arrays).
+
+	"""
+
+	__slots__ = ['names','index','offsets','targets','weights']
+
+	def __init__(self, names = None, offsets = None, targets = None, weights = None):
+		"""CompactData Constructor
+
+		Kwargs :
+			names (list, default None) : node names, by default an empty graph ready for append().
+			offsets (sequence, default None) : CSR row offsets, by default a single 0 offset.
+			targets (sequence, default None) : CSR target node ids, by default an empty array('i').
+			weights (sequence, default None) : CSR edge weights, by default an empty array('d').
+
+		Returns :
+			none
+
+		"""
+
+		self.names = list(names) if names is not None else []
+		self.index = dict( (name, i) for i, name in enumerate(self.names) )
+		self.offsets = offsets if offsets is not None else array('l', [0])
+		self.targets = targets if targets is not None else array('i')
+		self.weights = weights if weights is not None else array('d')
+
+	@classmethod
+	def from_edges(cls, rows):
+		"""Build a CompactData from an edge list
+		
+		Group the edges by source in linear time without building the adjacency dictionary : a first pass over the rows
+		numbers the names and stores the edges as int arrays, a counting sort by source then fills the CSR arrays. Every
+		name is a graph node, numbered in order of appearance, and the edges of a source keep their order.
+		
+		Args :
+			rows (iterable) : (source, target, weight) triples, see edge_rows().
+			
+		Returns :
+			data (CompactData) : CSR adjacency of the edges.
+			
+		"""
+		
+		ids = dict()
+		names = []
+		sources = array('l')
+		targets = array('i')
+		weights = array('d')
+		
+		for source, target, weight in rows :
+			s = ids.get(source)
+			if s is None :
+				s = ids[source] = len(names)
+				names.append(source)
+			t = ids.get(target)
+			if t is None :
+				t = ids[target] = len(names)
+				names.append(target)
+			sources.append(s)
+			targets.append(t)
+			weights.append(weight)
+			
+		del ids
+		
+		offsets = array('l', [0]) * (len(names) + 1)
+		for s in sources :
+			offsets[s + 1] += 1
+		for i in xrange(1, len(offsets)) :
+			offsets[i] += offsets[i - 1]
+			
+		position = offsets[:-1]
+		csr_targets = array('i', [0]) * len(targets)
+		csr_weights = array('d', [0.0]) * len(weights)
+		for s, t, weight in izip(sources, targets, weights) :
+			p = position[s]
+			csr_targets[p] = t
+			csr_weights[p] = weight
+			position[s] = p + 1
+			
+		return cls(names, offsets, csr_targets, csr_weights)
+		
+	def append(self, nodes, weights):
+		"""Append the adjacency of the next node
+
+		Nodes are appended in id order, the n-th call stores the edges of names[n]. Target names missing from the
+		names table are given new ids after the existing ones.
+
+		Args :
+			nodes (list) : target nodes names.
+			weights (list) : edges weights, one per target.
+
+		Returns :
+			none
+
+		"""
+
+		try :
+			self.targets.extend([ self.index[node] for node in nodes ])
+		except KeyError :
+			for node in nodes :
+				if node not in self.index :
+					self.index[node] = len(self.names)
+					self.names.append(node)
+			self.targets.extend([ self.index[node] for node in nodes ])
+
+		self.weights.extend([ float(weight) for weight in weights ])
+		self.offsets.append(len(self.targets))
+
+	def edges(self, i):
+		"""Iterate over (target name, weight) pairs of node id i."""
+
+		start, end = self.offsets[i], self.offsets[i + 1]
+		return izip([ self.names[target] for target in self.targets[start:end] ], self.weights[start:end])
+
+	def keys(self):
+		"""Graph nodes names, the sources of the adjacency."""
+
+		return self.names[:len(self.offsets) - 1]
+
+	def __getitem__(self, key):
+
+		i = self.index[key]
+		if i >= len(self.offsets) - 1 :
+			raise KeyError(key)
+
+		start, end = self.offsets[i], self.offsets[i + 1]
+		return ( [ self.names[target] for target in self.targets[start:end] ] , list(self.weights[start:end]) )
+
+	def __contains__(self, key):
+
+		return self.index.get(key, len(self.offsets)) < len(self.offsets) - 1
+
+	def __iter__(self):
+
+		return iter(self.keys())
+
+	def __len__(self):
+
+		return len(self.offsets) - 1
+
+def edge_rows(sources, targets = None, weights = None):
+	"""Edge rows
+	
+	Iterate over an edge list given either as parallel sequences or as an iterable of tuples. Sequences with a tolist()
+	method (NumPy or array arrays) are converted to python values in one vectorised call. Node names that are not
+	strings, such as integer ids, are converted with str() since every writer joins names as text.
+	
+	Args :
+		sources (iterable) : source names, or (source, target) / (source, target, weight) tuples when targets is None.
+		
+	Kwargs :
+		targets (sequence, default None) : target names, one per source.
+		weights (sequence, default None) : edges weights, one per source, every edge weights 1 by default.
+		
+	Returns :
+		generator of (source, target, weight) triples
+		
+	"""
+	
+	if targets is None :
+		for row in sources :
+			source, target = row[0], row[1]
+			if not isinstance(source, basestring) :
+				source = str(source)
+			if not isinstance(target, basestring) :
+				target = str(target)
+			yield source, target, 1 if len(row) == 2 else row[2]
+		return
+		
+	sources, targets = _names(sources), _names(targets)
+	weights = repeat(1) if weights is None else _python(weights)
+	
+	for row in izip(sources, targets, weights) :
+		yield row
+		
+def _python(sequence):
+	
+	return sequence.tolist() if hasattr(sequence, 'tolist') else sequence
+	
+def _names(sequence):
+	"""Python values of a sequence of node names, as strings."""
+	
+	names = _python(sequence)
+	if all( isinstance(name, basestring) for name in names ) :
+		return names
+		
+	return [ name if isinstance(name, basestring) else str(name) for name in names ]
+		
+def save_snapshot(path, data, flags = 0):
+	"""Save a binary snapshot
+	
+	Write the CSR arrays and the names table of data into path, see the module documentation for the layout. The
+	array.array columns of CompactData are written as they are, other sequences are converted first.
+	
+	Args :
+		path (str) : snapshot file path.
+		data (CompactData) : graph adjacency.
+		
+	Kwargs :
+		flags (int, default 0) : caller defined flags, returned by load_snapshot().
+		
+	Returns :
+		size (int) : size of the snapshot in bytes.
+		
+	Raises :
+		ValueError : raise exception when a node name holds a NUL byte.
+		
+	"""
+	
+	names = [ name.encode('utf-8') if isinstance(name, unicode) else str(name) for name in data.names ]
+	table = '\0'.join(names)
+	if table.count('\0') != max(len(names) - 1, 0) :
+		raise ValueError('Snapshot node names can not hold NUL bytes')
+		
+	nodes = len(data.offsets) - 1
+	edges = len(data.targets)
+	
+	with open(path, 'wb') as f :
+		f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, BYTE_ORDER_MARK, nodes, len(names), edges, len(table), flags).ljust(HEADER_SIZE, '\0'))
+		_write_column(f, ctypes.c_int64, data.offsets)
+		_write_column(f, ctypes.c_int32, data.targets)
+		f.write('\0' * (-4 * edges % 8))
+		_write_column(f, ctypes.c_double, data.weights)
+		f.write(table)
+		return f.tell()
+		
+def load_snapshot(path):
+	"""Load a binary snapshot
+	
+	Map path in memory (copy on write) and view its CSR arrays in place as ctypes arrays, they stay valid as long as
+	the returned CompactData. Only the names table is read.
+	
+	Args :
+		path (str) : snapshot file path, written by save_snapshot().
+		
+	Returns :
+		data (CompactData) : graph adjacency backed by the mapped file.
+		flags (int) : flags given to save_snapshot().
+		
+	Raises :
+		ValueError : raise exception when path is not a snapshot, is truncated or was written with another byte order.
+		
+	"""
+	
+	with open(path, 'rb') as f :
+		mapped = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_COPY)
+		
+	if len(mapped) < HEADER_SIZE :
+		raise ValueError('Not a Gephi snapshot : ' + path)
+		
+	magic, version, mark, nodes, count, edges, size, flags = _HEADER.unpack_from(mapped, 0)
+	if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION :
+		raise ValueError('Not a Gephi snapshot : ' + path)
+	if mark != BYTE_ORDER_MARK :
+		raise ValueError('Snapshot written with another byte order : ' + path)
+		
+	position = HEADER_SIZE
+	columns = []
+	for ctype, length in ((ctypes.c_int64, nodes + 1), (ctypes.c_int32, edges), (ctypes.c_double, edges)) :
+		position += -position % ctypes.sizeof(ctype)
+		if position + length * ctypes.sizeof(ctype) > len(mapped) :
+			raise ValueError('Truncated Gephi snapshot : ' + path)
+		columns.append((ctype * length).from_buffer(mapped, position))
+		position += length * ctypes.sizeof(ctype)
+		
+	if position + size > len(mapped) :
+		raise ValueError('Truncated Gephi snapshot : ' + path)
+	names = mapped[position : position + size].split('\0') if count else []
+	
+	offsets, targets, weights = columns
+	return CompactData(names, offsets, targets, weights), flags
+	
+def _write_column(f, ctype, sequence):
+	"""Write a sequence as a C array of ctype, array.array of the same type without conversion."""
+	
+	if isinstance(sequence, array) and sequence.typecode == _typecodes[ctype] and sequence.itemsize == ctypes.sizeof(ctype) :
+		sequence.tofile(f)
+		return
+		
+	column = (ctype * len(sequence))()
+	column[:] = _python(sequence)
+	f.write(column)
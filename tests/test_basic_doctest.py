@@ -7,6 +7,60 @@ To run the basic test using doctest module use the following command :
 import doctest
 from context import gephi
 
+class Future(object):
+	"""Stand-in of an asyncio future resolved synchronously, the event loop of the AsyncStream doctest."""
+
+	def __init__(self):
+		self.error = None
+		self.value = None
+		self.callbacks = []
+		self.done = False
+
+	def cancelled(self):
+		return False
+
+	def set_result(self, value):
+		self.value, self.done = value, True
+		for callback in self.callbacks :
+			callback(self)
+
+	def set_exception(self, error):
+		self.error, self.done = error, True
+		for callback in self.callbacks :
+			callback(self)
+
+	def exception(self):
+		return self.error
+
+	def result(self):
+		if self.error is not None :
+			raise self.error
+		return self.value
+
+	def add_done_callback(self, callback):
+		if self.done :
+			callback(self)
+		else :
+			self.callbacks.append(callback)
+
+class Loop(object):
+	"""Stand-in of an asyncio event loop running its callbacks and executor calls at once, counting the executor calls."""
+
+	def __init__(self):
+		self.executed = 0
+
+	def create_future(self):
+		return Future()
+
+	def call_soon(self, callback, *args):
+		callback(*args)
+
+	def run_in_executor(self, executor, function):
+		self.executed += 1
+		future = Future()
+		future.set_result(function())
+		return future
+
 def test_gephi():
 	"""Basic doctest for gephi methods
 
@@ -49,6 +103,13 @@ def test_gephi():
 	c;0.5;0.0;0.0;12.0
 	b;14.0;1.0;0.0;20.0
 	d;0.0;4.0;3.0;0.0
+	>>> G = gephi.Gephi(data , graph_type = 'undirect')
+	>>> print G.CVS('matrix')
+	;a;c;b;d
+	a;1;1;1;0
+	c;1;0;1;1
+	b;1;1;0;1
+	d;0;1;1;0
 	>>> G = gephi.Gephi(data , graph_type = 'direct')
 	>>> print G.adjacency_list()
 	a a b c
@@ -72,6 +133,8 @@ def test_gephi():
 	b
 	c
 	>>> G = gephi.Gephi(data , graph_type = 'direct')
+	>>> [ G.index[key] for key in G.keys ]
+	[0, 1, 2, 3]
 	>>> print G.pajek_net('edges-list')
 	*Vertices 4
 	1 "a"
@@ -115,10 +178,287 @@ def test_gephi():
 	b,d,20
 	d,b,3
 	d,c,4
+	>>> G = gephi.Gephi({'a' : (['b','b'],[1,2]) , 'b' : ([],[]) } , graph_type = 'direct')
+	>>> list(G.edges())
+	[('a', 'b', 1), ('a', 'b', 2)]
+	>>> print G.pajek_net('weight',labels=None)
+	*Vertices 2
+	*arcs
+	1 2 1
+	1 2 2
+	>>> G = gephi.Gephi(data , graph_type = 'direct' , compact = True)
+	>>> G.data.offsets, G.data.targets
+	(array('l', [0, 3, 5, 8, 10]), array('i', [0, 2, 1, 0, 3, 0, 1, 3, 2, 1]))
+	>>> G.data['c']
+	(['a', 'd'], [0.5, 12.0])
+	>>> print G.pajek_net('weight',labels=None)
+	*Vertices 4
+	*arcs
+	1 1 12.0
+	1 3 11.0
+	1 2 10.0
+	2 1 0.5
+	2 4 12.0
+	3 1 14.0
+	3 2 1.0
+	3 4 20.0
+	4 3 3.0
+	4 2 4.0
+	>>> G = gephi.Gephi(data , graph_type = 'direct')
+	>>> import StringIO
+	>>> f = StringIO.StringIO()
+	>>> G.write('csv', f, 'edge-list', chunk_size = 8) == len(f.getvalue())
+	True
+	>>> f.getvalue() == G.CVS('edge-list') + '\\n'
+	True
+	>>> chunks = list(G.stream('tlp', chunk_size = 64))
+	>>> min([ len(chunk) for chunk in chunks[:-1] ]) >= 64 and ''.join(chunks) == G.TLP() + '\\n'
+	True
+	>>> gephi.Gephi.parallel_chunk = 2
+	>>> G.GEXF(workers = 2) == G.GEXF() and G.GML(workers = 2) == G.GML()
+	True
+	>>> G.GDF_format(workers = 2) == G.GDF_format() and G.spread_sheet(workers = 3) == G.spread_sheet()
+	True
+	>>> G.CVS('edge-list', workers = 2) == G.CVS('edge-list')
+	True
+	>>> gephi.Gephi.parallel_chunk = 65536
+	>>> gephi.Gephi.export_chunk = 3
+	>>> files = dict( (fmt, StringIO.StringIO()) for fmt in ('gexf', 'pajek', 'graphml', 'dot', 'tlp', 'dl') )
+	>>> sizes = G.export_many({'gexf' : files['gexf'], 'pajek' : (files['pajek'], 'weight', {'labels' : False}), 'graphml' : (files['graphml'], {'weights' : True}), 'dot' : (files['dot'], 'Labels'), 'tlp' : files['tlp'], 'dl' : (files['dl'], 'basic')})
+	>>> [ files[fmt].getvalue() == text + '\\n' for fmt, text in sorted([ ('dl', G.ucinet_DL('basic')), ('dot', G.GraphViz_dot_format('Labels')), ('gexf', G.GEXF()), ('graphml', G.graph_ML(weights = True)), ('pajek', G.pajek_net('weight', labels = False)), ('tlp', G.TLP()) ]) ]
+	[True, True, True, True, True, True]
+	>>> sizes['gexf'] == len(files['gexf'].getvalue())
+	True
+	>>> gephi.Gephi.export_chunk = 8192
+	>>> rows = [ (key, node, weight) for key, node, weight in G.edges() ]
+	>>> H = gephi.Gephi.from_edges([ row[0] for row in rows ], [ row[1] for row in rows ], [ row[2] for row in rows ], graph_type = 'direct')
+	>>> sorted(H.edges()) == sorted(G.edges())
+	True
+	>>> H = gephi.Gephi.from_edges(iter([('a', 'b'), ('a', 'e', 2), ('b', 'a')]), graph_type = 'direct', compact = True)
+	>>> H.keys, list(H.edges())
+	(['a', 'b', 'e'], [('a', 'b', 1.0), ('a', 'e', 2.0), ('b', 'a', 1.0)])
+	>>> gephi.Gephi(H.data).pajek_net('weight', labels = None)
+	'*Vertices 3\\n*arcs\\n1 2 1.0\\n1 3 2.0'
+	>>> G = gephi.Gephi(data , graph_type = 'direct' , compact = True)
+	>>> gephi.Gephi.block_size = 3
+	>>> numpy, gephi.gephi.numpy = gephi.gephi.numpy, None
+	>>> outputs = [ G.pajek_net('weight'), G.ucinet_DL('edge-weight'), G.TLP(), G.netdraw_VNA() ]
+	>>> print outputs[2]
+	(tlp "2.0" 
+	(date "09-11-2006")
+	(author "Wessam Elhefnawy")
+	(comments "This file was generated by Tulip Gephi.")
+	(nodes 0 1 2 3)
+	(edge 0 0 0)
+	(edge 1 0 2)
+	(edge 2 0 1)
+	(edge 3 1 0)
+	(edge 4 1 3)
+	(edge 5 2 0)
+	(edge 6 2 1)
+	(edge 7 2 3)
+	(edge 8 3 2)
+	(edge 9 3 1)
+	)
+	>>> gephi.gephi.numpy = numpy
+	>>> H = gephi.Gephi.from_edges(numpy.arange(3), numpy.arange(1, 4), graph_type = 'direct')
+	>>> sorted(H.keys), 'label="3"' in H.GEXF(), sorted(H.CVS('edge-list').split()), '1,2,1' in H.GDF_format()
+	(['0', '1', '2', '3'], True, ['0;1', '1;2', '2;3'], True)
+	>>> sorted(gephi.Gephi.from_edges([(1, 2), (2, 3, 5)], compact = True).keys)
+	['1', '2', '3']
+	>>> outputs == [ G.pajek_net('weight'), G.ucinet_DL('edge-weight'), G.TLP(), G.netdraw_VNA() ]
+	True
+	>>> gephi.Gephi.block_size = 16384
+	>>> G = gephi.Gephi(data , graph_type = 'direct' , cache = gephi.RenderCache(max_entries = 2))
+	>>> G.GEXF() is G.GEXF(workers = 2) and G.pajek_net('edges') is G.pajek_net('edges')
+	True
+	>>> G.TLP() is G.GEXF()
+	False
+	>>> len(G.cache), G.cache.hits, G.cache.misses
+	(2, 2, 4)
+	>>> G.GDF_format(colors = ['0,0,0'] * 4) is G.GDF_format(colors = ['0,0,0'] * 4)
+	True
+	>>> G._mutated()
+	>>> len(G.cache), G.cache.size
+	(0, 0)
+	>>> cache = gephi.RenderCache()
+	>>> G, H = gephi.Gephi({'a' : (['b'],[1]) , 'b' : ([],[]) } , cache = cache), gephi.Gephi({'a' : (['a'],[2]) } , cache = cache)
+	>>> G.TLP() == H.TLP(), len(cache)
+	(False, 2)
+	>>> H.add_edge('a', 'd'), len(cache), G.TLP() is G.TLP()
+	(True, 1, True)
+	>>> G = gephi.Gephi({'a' : (['b'],[1]) , 'b' : (['a'],[2]) } , cache = gephi.RenderCache())
+	>>> G.edge_count, G.TLP() is G.TLP()
+	(1, True)
+	>>> G.add_edge('b', 'a'), G.add_edge('b', 'c', 5), G.add_node('c'), G.edge_count
+	(False, True, False, 2)
+	>>> G.keys, G.index['c'], len(G.cache)
+	(['a', 'b', 'c'], 2, 0)
+	>>> G.remove_edge('c', 'b'), G.edge_count, G.add_edge('c', 'b', 7)
+	(5, 1, True)
+	>>> print G.pajek_net('weight')
+	*Vertices 3
+	1 "a"
+	2 "b"
+	3 "c"
+	*arcs
+	1 2 1
+	3 2 7
+	>>> G.remove_edge('a', 'c')
+	Traceback (most recent call last):
+	...
+	KeyError: 'Edge not found : a -> c'
+	>>> gephi.Gephi(data , compact = True).add_node('e')
+	Traceback (most recent call last):
+	...
+	TypeError: Compact graphs are read-only : build a dictionary graph to add or remove edges
+	>>> G = gephi.Gephi({'a' : (['b', 'c'], [1, 2], [(1, 5), None]) , 'b' : (['a'], [1], [(2, 3)]) , 'c' : ([], []) })
+	>>> G.data['a'], G.data['b']
+	((['b', 'c'], [1, 2], [(1, 5), None]), ([], [], []))
+	>>> G.add_edge('c', 'd', start = 2.5, end = 9)
+	True
+	>>> print G.GEXF(mode = 'dynamic')
+	<?xml version="1.0" encoding="UTF-8"?>
+	<gexf xmlns="http://www.gexf.net/1.2draft" version="1.2">
+	<meta lastmodifieddate="2009-03-20">
+	<creator>Gexf.net</creator>
+	<description>A hello world! file</description>
+	</meta>
+	<graph mode="dynamic" defaultedgetype="undirect" timeformat="double">
+	<nodes>
+	<node id="a" label="a" />
+	<node id="c" label="c" />
+	<node id="b" label="b" start="1" end="5" />
+	<node id="d" label="d" start="2.5" end="9" />
+	</nodes>
+	<edges>
+	<edge id="0" source="a" target="b" start="1" end="5" />
+	<edge id="1" source="a" target="c" />
+	<edge id="2" source="c" target="d" start="2.5" end="9" />
+	</edges>
+	</graph>
+	</gexf>
+	>>> G.GEXF(mode = 'dynamic', workers = 2) == G.GEXF(mode = 'dynamic')
+	True
+	>>> G.remove_edge('a', 'c'), G.data['a']
+	(2, (['b'], [1], [(1, 5)]))
+	>>> G.GEXF() == gephi.Gephi({'a' : (['b'],[1]) , 'b' : ([],[]) , 'c' : (['d'],[1]) , 'd' : ([],[]) }).GEXF()
+	True
+	>>> G = gephi.Gephi.from_edges(['x', 'y'], ['y', 'z'], spans = [(1, 2), (3, 4)], graph_type = 'direct')
+	>>> G.data['x'], G.GEXF(mode = 'dynamic').count('start=')
+	((['y'], [1], [(1, 2)]), 5)
+	>>> G.GEXF(mode = 'snapshot')
+	Traceback (most recent call last):
+	...
+	ValueError: Unsupported GEXF mode : snapshot
+	>>> G = gephi.Gephi({'a' : (['b', 'c'], [1, 2]) , 'b' : (['c'], [3]) , 'c' : ([], []) } , graph_type = 'direct')
+	>>> G.set_node_attribute('age', [56, 23], 'int')
+	>>> G.set_node_attribute('group', {'a' : 'x, y', 'c' : 'z'})
+	>>> G.set_node_attribute('color', ['1,2,3', '4,5,6', '7,8,9'])
+	>>> G.set_edge_attribute('kind', ['f', 'c', 'f & g'])
+	>>> G.set_edge_attribute('strong', [True, False], 'boolean')
+	>>> G.keys, G.node_attributes.get('age', G.index['b']), G.edge_attributes.get('strong', 0)
+	(['a', 'c', 'b'], 0, 1)
+	>>> print G.GDF_format()
+	nodedef>name VARCHAR,label VARCHAR,class VARCHAR, visible BOOLEAN,labelvisible BOOLEAN,width DOUBLE,color VARCHAR,age INT,group VARCHAR
+	a,a,a,true,true,2,'1,2,3',56,'x, y'
+	c,c,c,true,true,2,'4,5,6',23,z
+	b,b,b,true,true,2,'7,8,9',0,
+	edgedef>node1 VARCHAR,node2 VARCHAR,weight DOUBLE,kind VARCHAR,strong BOOLEAN
+	a,b,1,f,true
+	a,c,2,c,false
+	b,c,3,f & g,false
+	>>> print '\\n'.join(G.GEXF().split('\\n')[6:22])
+	<graph mode="static" defaultedgetype="direct">
+	<attributes class="node">
+	<attribute id="0" title="age" type="integer" />
+	<attribute id="1" title="group" type="string" />
+	<attribute id="2" title="color" type="string" />
+	</attributes>
+	<attributes class="edge">
+	<attribute id="0" title="kind" type="string" />
+	<attribute id="1" title="strong" type="boolean" />
+	</attributes>
+	<nodes>
+	<node id="a" label="a">
+	<attvalues>
+	<attvalue for="0" value="56" />
+	<attvalue for="1" value="x, y" />
+	<attvalue for="2" value="1,2,3" />
+	>>> print '\\n'.join(G.graph_ML(weights = True).split('\\n')[-7:])
+	<edge id="e2" source="b" target="c">
+	<data key="d1">3</data>
+	<data key="d5">f &amp; g</data>
+	<data key="d6">false</data>
+	</edge>
+	</graph>
+	</graphml>
+	>>> G.add_edge('a', 'd'), G.remove_edge('a', 'b'), G.edge_attributes.columns['kind']
+	(True, 1, ['c', '', 'f & g'])
+	>>> print G.netdraw_VNA()
+	*node data
+	ID name age group
+	0 a 56 "x, y"
+	1 c 23 z
+	2 b 0 ""
+	3 d 0 ""
+	*Node properties
+	ID color shape size shortlabel
+	0 1,2,3 1 2 a
+	1 4,5,6 1 0 c
+	2 7,8,9 1 1 b
+	3 "" 1 0 d
+	*tie data
+	from to strength kind strong
+	0 1 2.00 c false
+	0 3 1.00 "" false
+	2 1 3.00 "f & g" false
+	>>> G.GEXF(workers = 2) == G.GEXF() and G.GDF_format(workers = 2) == G.GDF_format()
+	True
+	>>> stats = gephi.ExportStats()
+	>>> G = gephi.Gephi({'a' : (['b','c'],[1,2]) , 'b' : (['c'],[3]) , 'c' : ([],[]) }, graph_type = 'direct', instrument = stats)
+	>>> G.ucinet_DL('weight') == gephi.Gephi(G.data, graph_type = 'direct').ucinet_DL('weight')
+	True
+	>>> [ (phase.format, phase.phase, phase.nodes, phase.edges, phase.size) for phase in stats.phases ]
+	[('dl', 'head', 0, 0, 37), ('dl', 'nodes', 3, 0, 12), ('dl', 'matrix', 3, 3, 0), ('dl', 'edges', 3, 3, 36)]
+	>>> all( 0 <= phase.peak < gephi.stats.peak_memory() for phase in stats.phases )
+	True
+	>>> stats.clear()
+	>>> size = len(G.GEXF())
+	>>> [ phase.phase for phase in stats.phases ], sum( phase.size for phase in stats.phases ) == size + 1
+	(['head', 'nodes', 'edges', 'tail'], True)
+	>>> import StringIO
+	>>> stats.clear()
+	>>> sizes = G.export_many({'gexf' : StringIO.StringIO(), 'tlp' : StringIO.StringIO()})
+	>>> sorted( (phase.format, phase.phase) for phase in stats.phases if phase.phase == 'edges' ), sum( phase.size for phase in stats.phases ) == sum(sizes.values())
+	([('gexf', 'edges'), ('tlp', 'edges')], True)
 	
 	"""
 
 
+def test_aio():
+	"""AsyncStream doctest for gephi, driven by a stand-in event loop so it runs without asyncio
+
+	>>> data = {'a' : (['a','b','c'],[12,11,10]) , 'b' : (['a','c','d'],[14,1,20]) , 'c' : (['a','d'],[.5,12]) , 'd' : (['b','c'],[3,4]) }
+	>>> G, loop, asyncio = gephi.Gephi(data , graph_type = 'direct'), Loop(), gephi.aio.asyncio
+	>>> gephi.aio.asyncio = asyncio or loop
+	>>> stream, chunks = G.aexport('pajek', 'weight', chunk_size = 16, loop = loop), []
+	>>> while True :
+	...     future = stream.__anext__()
+	...     if future.exception() is not None :
+	...         break
+	...     chunks.append(future.result())
+	>>> ''.join(chunks) == G.pajek_net('weight') + '\\n', max(map(len, chunks)), type(future.exception()) is gephi.EndOfStream
+	(True, 16, True)
+	>>> stream = G.aexport('gexf', chunk_size = 64, executor = 'pool', loop = loop)
+	>>> G.GEXF().startswith(stream.__anext__().result() + stream.__anext__().result()), loop.executed
+	(True, 2)
+	>>> stream.aclose().result(), type(stream.__anext__().exception()) is gephi.EndOfStream, loop.executed
+	(None, True, 3)
+	>>> gephi.aio.asyncio = asyncio
+
+	"""
+
 if __name__ == '__main__':
 	print __doc__ , '\nrun $python -m ' , __file__ , ' -v' , '\n'
 	doctest.testmod()
\ No newline at end of file
@@ -0,0 +1,252 @@
+"""Run readers doctest for gephi
+
+Every format written by Gephi is read back with Gephi.read and compared with the original edges, weights are
+compared for the formats that store them.
+
+To run the test using doctest module use the following command :
+
+"""
+
+import doctest
+from context import gephi
+
+def edges(G):
+	return sorted(G.edges())
+
+def pairs(G):
+	return sorted((source, target) for source, target, _ in G.edges())
+
+def ids(G):
+	return sorted((str(G.index[source]), str(G.index[target])) for source, target, _ in G.edges())
+
+def read(G, fmt, text, *args):
+	import StringIO
+	return gephi.Gephi.read(fmt, StringIO.StringIO(text), graph_type = 'direct', *args)
+
+def test_readers():
+	"""Round trip doctest for gephi readers
+
+	>>> data = {'a' : (['a','b','c'],[12,11,10]) , 'b' : (['a','c','d'],[14,1,20]) , 'c' : (['a','d'],[.5,12]) , 'd' : (['b','c'],[3,4]) }
+	>>> G = gephi.Gephi(data , graph_type = 'direct')
+	>>> [ pairs(read(G, 'csv', G.CVS(f), f)) == pairs(G) for f in ('edge-list', 'adjacency-list', 'mixed', 'matrix') ]
+	[True, True, True, True]
+	>>> edges(read(G, 'csv', G.CVS('edge-weight'), 'edge-weight')) == edges(G)
+	True
+	>>> pairs(read(G, 'adjacency-list', G.adjacency_list())) == pairs(G)
+	True
+	>>> pairs(read(G, 'multiline-adjacency-list', G.multiline_adjacency_list())) == pairs(G)
+	True
+	>>> [ pairs(read(G, 'pajek', G.pajek_net(s))) == pairs(G) for s in ('edges', 'weight', 'edges-list') ]
+	[True, True, True]
+	>>> edges(read(G, 'pajek', G.pajek_net('weight'))) == edges(G)
+	True
+	>>> H = read(G, 'pajek', G.pajek_net('edges', labels = False))
+	>>> sorted((str(int(s) - 1), str(int(t) - 1)) for s, t, _ in H.edges()) == ids(G)
+	True
+	>>> edges(read(G, 'gdf', G.GDF_format())) == edges(G)
+	True
+	>>> pairs(read(G, 'gexf', G.GEXF())) == pairs(G)
+	True
+	>>> edges(read(G, 'gml', G.GML())) == edges(G)
+	True
+	>>> edges(read(G, 'graphml', G.graph_ML(weights = True))) == edges(G)
+	True
+	>>> edges(read(G, 'spreadsheet', G.spread_sheet())) == edges(G)
+	True
+	>>> [ pairs(read(G, 'dot', G.GraphViz_dot_format(f))) == pairs(G) for f in ('basic', 'Labels', 'adjacency-list') ]
+	[True, True, True]
+	>>> edges(read(G, 'dot', G.GraphViz_dot_format('Labels'))) == edges(G)
+	True
+	>>> [ pairs(read(G, 'dl', G.ucinet_DL(f))) == pairs(G) for f in ('basic', 'weight', 'edge-list', 'labels-embedded', 'edge-weight') ]
+	[True, True, True, True, True]
+	>>> [ edges(read(G, 'dl', G.ucinet_DL(f))) == edges(G) for f in ('weight', 'edge-weight') ]
+	[True, True]
+	>>> for row in ('0 1', '0 4', '0', 'a x') :
+	...     try :
+	...         H = read(G, 'dl', 'dl N = 4\\nformat = edgelist1\\nlabels:\\na,b,c,d\\ndata:\\n' + row + '\\n')
+	...         print 'read', row
+	...     except ValueError as error :
+	...         print error
+	read 0 1
+	DL node id out of range at line 6 : 0 4
+	DL edge list row without source and target at line 6 : 0
+	Undeclared DL node name at line 6 : a x
+	>>> pairs(read(G, 'dl', 'dl N = 0\\nformat = edgelist1\\nlabels embedded\\ndata:\\na x\\n1 2\\n'))
+	[('1', '2'), ('a', 'x')]
+	>>> sorted((s, t) for s, t, _ in read(G, 'tlp', G.TLP()).edges()) == ids(G)
+	True
+	>>> edges(read(G, 'vna', G.netdraw_VNA())) == edges(G)
+	True
+	>>> sorted(read(G, 'gdf', G.GDF_format()).keys) == sorted(G.keys)
+	True
+	>>> G = gephi.Gephi({'a&b' : (['x<y','c,d'],[1,2]) , 'x<y' : (['q"q','e;f'],[3,4]) , 'q"q' : (['g h','[k]'],[5,6]) , 'e;f' : (["o'p"],[1]) , "o'p" : (['node'],[2]) , 'c,d' : ([],[]) , 'g h' : ([],[]) , '[k]' : ([],[]) , 'node' : (['a&b'],[7]) }, graph_type = 'direct')
+	>>> 'a&b;"c,d"' in G.CVS('edge-list'), "'c,d','c,d','c,d'" in G.GDF_format(), '"q\\\\"q" -> "g h";' in G.GraphViz_dot_format(), 'source="a&amp;b" target="x&lt;y"' in G.GEXF()
+	(True, True, True, True)
+	>>> [ pairs(read(G, 'csv', G.CVS(f), f)) == pairs(G) for f in ('edge-list', 'adjacency-list', 'mixed', 'matrix') ]
+	[True, True, True, True]
+	>>> [ edges(read(G, fmt, text)) == edges(G) for fmt, text in [ ('gdf', G.GDF_format()), ('gml', G.GML()), ('graphml', G.graph_ML(weights = True)), ('spreadsheet', G.spread_sheet()), ('dot', G.GraphViz_dot_format('Labels')), ('vna', G.netdraw_VNA()) ] ]
+	[True, True, True, True, True, True]
+	>>> [ pairs(read(G, fmt, text)) == pairs(G) for fmt, text in [ ('gexf', G.GEXF()), ('gexf', G.GEXF(workers = 2)), ('dot', G.GraphViz_dot_format('adjacency-list')) ] ]
+	[True, True, True]
+	>>> [ edges(read(G, 'dl', G.ucinet_DL(f))) == edges(G) for f in ('weight', 'edge-weight') ], pairs(read(G, 'dl', G.ucinet_DL('labels-embedded'))) == pairs(G)
+	([True, True], True)
+	>>> '"g h"' in G.ucinet_DL('basic'), '"c,d"' in G.ucinet_DL('basic'), ' "q\\'q"' in G.pajek_net('edges')
+	(True, True, True)
+	>>> H = gephi.Gephi({'a"b' : (['c\\nd'],[1]) , 'c\\nd' : ([],[]) }, graph_type = 'direct')
+	>>> print H.pajek_net('weight', labels = True)
+	*Vertices 2
+	1 "a'b"
+	2 "c d"
+	*arcs
+	1 2 1
+	>>> pairs(read(H, 'pajek', H.pajek_net('weight')))
+	[("a'b", 'c d')]
+	>>> H = read(G, 'gexf', '<?xml version="1.0" encoding="UTF-8"?><gexf xmlns="http://www.gexf.net/1.2draft" version="1.2"><graph mode="static"><nodes><node id="0" label="Hello" /><node id="1" label="Word" /></nodes><edges><edge id="0" source="0" target="1" weight="2.5" /></edges></graph></gexf>')
+	>>> list(H.edges())
+	[('0', '1', 2.5)]
+	>>> H = read(G, 'gexf', '<gexf><graph mode="dynamic" timeformat="date"><edges><edge source="0" target="1" /><edge source="0" target="2" start="2009-01-01" end="3" /></edges></graph></gexf>')
+	>>> H.data['0']
+	(['1', '2'], [1.0, 1.0], [None, ('2009-01-01', 3)])
+
+	"""
+
+def test_files():
+	"""Compressed file export doctest for gephi
+
+	>>> import os, shutil, tempfile
+	>>> data = {'a' : (['a','b','c'],[12,11,10]) , 'b' : (['a','c','d'],[14,1,20]) , 'c' : (['a','d'],[.5,12]) , 'd' : (['b','c'],[3,4]) }
+	>>> G = gephi.Gephi(data , graph_type = 'direct')
+	>>> folder = tempfile.mkdtemp()
+	>>> for name in ('graph.gexf', 'graph.gexf.gz', 'graph.gexf.bz2') :
+	...     path = os.path.join(folder, name)
+	...     print name, G.GEXF(path = path) == len(G.GEXF()) + 1, pairs(gephi.Gephi.read('gexf', path, graph_type = 'direct')) == pairs(G)
+	graph.gexf True True
+	graph.gexf.gz True True
+	graph.gexf.bz2 True True
+	>>> path = os.path.join(folder, 'graph.net.gz')
+	>>> G.pajek_net('weight', path = path) > 0 and edges(gephi.Gephi.read('pajek', path, graph_type = 'direct')) == edges(G)
+	True
+	>>> open(path, 'rb').read(2) == '\\x1f\\x8b'
+	True
+	>>> G, H = gephi.Gephi(data , graph_type = 'direct'), gephi.Gephi(data , graph_type = 'direct')
+	>>> net, csv = os.path.join(folder, 'graph.net'), os.path.join(folder, 'graph.csv')
+	>>> G.export_delta('pajek', net, 'weight', labels = False) == len(G.pajek_net('weight', labels = False)) + 1 + 32 - len('*Vertices 4')
+	True
+	>>> G.export_delta('csv', csv, 'edge-list') == len(G.CVS('edge-list')) + 1
+	True
+	>>> G.add_edge('a', 'e', 3), G.add_edge('e', 'b', 4)
+	(True, True)
+	>>> G.export_delta('pajek', net, 'weight', labels = False), G.export_delta('csv', csv, 'edge-list')
+	(12, 8)
+	>>> open(net).read().split('\\n')[0]
+	'*Vertices 5                     '
+	>>> edges(gephi.Gephi.read('pajek', net, graph_type = 'direct')) == sorted((str(G.index[s] + 1), str(G.index[t] + 1), w) for s, t, w in G.edges())
+	True
+	>>> G.remove_edge('a', 'e'), G.export_delta('csv', csv, 'edge-list') == len(G.CVS('edge-list')) + 1
+	(3, True)
+	>>> pairs(gephi.Gephi.read('csv', csv, 'edge-list', graph_type = 'direct')) == pairs(G)
+	True
+	>>> sorted(data), data['a'], H.TLP() == gephi.Gephi(data , graph_type = 'direct').TLP()
+	(['a', 'b', 'c', 'd'], (['a', 'b', 'c'], [12, 11, 10]), True)
+	>>> G.export_delta('pajek', net, 'edges-list')
+	Traceback (most recent call last):
+	...
+	ValueError: Unsupported delta format : pajek edges-list
+	>>> G.export_many({'gexf' : os.path.join(folder, 'many.gexf'), 'pajek' : (os.path.join(folder, 'many.net'), 'arcs')})
+	Traceback (most recent call last):
+	...
+	Exception: Unspprted Scheme arcs
+	>>> os.path.exists(os.path.join(folder, 'many.gexf')), os.path.exists(os.path.join(folder, 'many.net'))
+	(False, False)
+	>>> gephi.Gephi.export_chunk, calls, token = 2, [], gephi.CancelToken()
+	>>> def stop(done, total) :
+	...     calls.append((done, total))
+	...     if done : token.cancel()
+	>>> G.export_many({'gexf' : os.path.join(folder, 'many.gexf'), 'tlp' : os.path.join(folder, 'many.tlp')}, progress = stop, cancel = token)
+	Traceback (most recent call last):
+	...
+	ExportCancelled: Export cancelled
+	>>> calls, os.path.exists(os.path.join(folder, 'many.gexf')), os.path.exists(os.path.join(folder, 'many.tlp'))
+	([(0, 11), (3, 11)], False, False)
+	>>> gephi.Gephi.export_chunk = 8192
+	>>> path = os.path.join(folder, 'graph.csr')
+	>>> G = gephi.Gephi(data)
+	>>> G.save(path) == os.path.getsize(path)
+	True
+	>>> H = gephi.Gephi.load(path)
+	>>> H.graph_type, H.keys == G.keys, type(H.data.targets).__name__, H.edge_count == G.edge_count
+	('undirect', True, 'c_int_Array_6', True)
+	>>> C = gephi.Gephi(data, compact = True)
+	>>> all( getattr(H, method)(*args) == getattr(C, method)(*args) for method, args in [ ('pajek_net', ('weight',)), ('GEXF', ()), ('CVS', ('edge-weight',)), ('TLP', ()) ] )
+	True
+	>>> H.save(os.path.join(folder, 'copy.csr')) and open(os.path.join(folder, 'copy.csr'), 'rb').read() == open(path, 'rb').read()
+	True
+	>>> try :
+	...     gephi.Gephi.load(csv)
+	... except ValueError as error :
+	...     print str(error).startswith('Not a Gephi snapshot')
+	True
+	>>> del H
+	>>> gephi.Gephi.progress_chunk = 2
+	>>> calls, token = [], gephi.CancelToken()
+	>>> G.pajek_net('weight', progress = lambda done, total : calls.append((done, total))) == G.pajek_net('weight'), calls
+	(True, [(0, 6), (3, 6), (6, 6)])
+	>>> def cancel(done, total) :
+	...     if done >= 4 : token.cancel()
+	>>> path = os.path.join(folder, 'cancelled.gexf.gz')
+	>>> G.GEXF(path = path, progress = cancel, cancel = token)
+	Traceback (most recent call last):
+	...
+	ExportCancelled: Export cancelled
+	>>> os.path.exists(path)
+	False
+	>>> calls = []
+	>>> G.ucinet_DL('weight', progress = lambda done, total : calls.append(done)) == G.ucinet_DL('weight'), calls
+	(True, [0, 1, 3, 4, 6])
+	>>> token = gephi.CancelToken()
+	>>> rows = G.stream('csv', 'matrix', chunk_size = 1, progress = lambda done, total : done >= 3 and token.cancel(), cancel = token)
+	>>> [ next(rows) for _ in range(5) ][-1]
+	'b;1;1;0;1\\n'
+	>>> next(rows)
+	Traceback (most recent call last):
+	...
+	ExportCancelled: Export cancelled
+	>>> calls = []
+	>>> [ getattr(G, name)(progress = lambda done, total : calls.append(done)) == getattr(G, name)() for name in ('adjacency_list', 'multiline_adjacency_list') ], calls
+	([True, True], [0, 1, 3, 4, 6, 0, 1, 3, 4, 6])
+	>>> token = gephi.CancelToken()
+	>>> rows = G.stream('multiline-adjacency-list', chunk_size = 1, progress = lambda done, total : done >= 3 and token.cancel(), cancel = token)
+	>>> len([ next(rows) for _ in range(3) ])
+	3
+	>>> next(rows)
+	Traceback (most recent call last):
+	...
+	ExportCancelled: Export cancelled
+	>>> gephi.Gephi.progress_chunk = 65536
+	>>> G = gephi.Gephi(data , graph_type = 'direct')
+	>>> path = os.path.join(folder, 'shard-{}.gdf.gz')
+	>>> sorted(G.export_shards('gdf', path, 2, partition = {'a' : 0, 'b' : 0, 'c' : 1, 'd' : 1}).keys())
+	[0, 1, 'boundary']
+	>>> [ edges(gephi.Gephi.read('gdf', path.format(shard), graph_type = 'direct')) for shard in (0, 1) ]
+	[[('a', 'a', 12), ('a', 'b', 11), ('b', 'a', 14)], [('c', 'd', 12), ('d', 'c', 4)]]
+	>>> edges(gephi.Gephi.read('gdf', path.format('boundary'), graph_type = 'direct'))
+	[('a', 'c', 10), ('b', 'c', 1), ('b', 'd', 20), ('c', 'a', 0.5), ('d', 'b', 3)]
+	>>> G.export_shards('gdf', path, 2, partition = {'a' : 2})
+	Traceback (most recent call last):
+	...
+	ValueError: Node a mapped outside of the 2 shards : 2
+	>>> G.export_shards('gdf', path, 0)
+	Traceback (most recent call last):
+	...
+	ValueError: Unsupported number of shards : 0
+	>>> sizes = G.export_shards('csv', os.path.join(folder, 'shard-{}.csv'), 4, 'edge-list', workers = 2)
+	>>> all( size == os.path.getsize(os.path.join(folder, 'shard-{}.csv'.format(shard))) for shard, size in sizes.items() )
+	True
+	>>> shutil.rmtree(folder)
+
+	"""
+
+
+if __name__ == '__main__':
+	print __doc__ , '\nrun $python -m ' , __file__ , ' -v' , '\n'
+	doctest.testmod()